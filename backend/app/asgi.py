@@ -0,0 +1,122 @@
+from functools import wraps
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Mount, Route
+from werkzeug.http import http_date
+from backend.app.main import app as flask_app
+from backend.app.services import async_read_service
+from backend.app.utils import change_versions, json_provider
+from backend.app.utils.compression import AsgiCompressionMiddleware
+from backend.app.utils.pagination import parse_limit
+from backend.app.utils.permissions import has_permission, Role
+from backend.app.utils.security import decode_token
+from backend.app.utils.showcase_cache import showcase_cache, SHOWCASE_VERSION
+
+# ASGI entry point: the hot read endpoints are served on the event loop with
+# Motor, and every other route falls through to the Flask app. Run with
+# `uvicorn backend.app.asgi:app`. Socket.IO needs the WSGI server (start_server.py).
+
+class ApiJSONResponse(JSONResponse):
+    """Encodes like the Flask app's JSON provider"""
+
+    def render(self, content):
+        return json_provider.dumps(content)
+
+def async_route(required_role):
+    """Async counterpart of token_required + permission_required"""
+    def decorator(f):
+        @wraps(f)
+        async def endpoint(request):
+            token = request.headers.get('x-access-token')
+            if not token:
+                return ApiJSONResponse({'message': 'Token is missing'}, status_code=401)
+            try:
+                current_user = decode_token(token)
+            except Exception:
+                return ApiJSONResponse({'message': 'Token is invalid'}, status_code=401)
+            if not has_permission(current_user['role'], required_role):
+                return ApiJSONResponse({"message": "Permission denied"}, status_code=403)
+            try:
+                return await f(request, current_user)
+            except ValueError as e:
+                return ApiJSONResponse({"error": str(e)}, status_code=400)
+        return endpoint
+    return decorator
+
+def async_conditional(*collection_names, on_versions=None):
+    """Async counterpart of conditional_get; both produce the same validators for a URL"""
+    def decorator(f):
+        @wraps(f)
+        async def endpoint(request, current_user):
+            versions = await async_read_service.current_versions(collection_names)
+            if on_versions is not None:
+                on_versions(versions)
+            etag, last_modified = change_versions.validators(versions, f"{request.url.path}?{request.url.query}")
+            headers = {'ETag': f'W/"{etag}"', 'Cache-Control': 'private, no-cache'}
+            if last_modified is not None:
+                headers['Last-Modified'] = http_date(last_modified)
+            if change_versions.not_modified(etag, last_modified, request.headers.get('if-none-match'),
+                                            request.headers.get('if-modified-since')):
+                return Response(status_code=304, headers=headers)
+            response = await f(request, current_user)
+            if response.status_code == 200:
+                response.headers.update(headers)
+            return response
+        return endpoint
+    return decorator
+
+@async_route(Role.GUEST)
+@async_conditional('members')
+async def get_members(request, current_user):
+    limit = parse_limit(request.query_params.get('limit'))
+    page = await async_read_service.get_members_page(after=request.query_params.get('after'), limit=limit)
+    return ApiJSONResponse(page)
+
+@async_route(Role.GUEST)
+@async_conditional(SHOWCASE_VERSION, on_versions=showcase_cache.observe_versions)
+async def get_member_showcases(request, current_user):
+    try:
+        showcases = await async_read_service.get_public_showcases(request.path_params.get('segment'))
+    except Exception:
+        return ApiJSONResponse({"error": "Failed to retrieve showcases"}, status_code=500)
+    return ApiJSONResponse(showcases)
+
+@async_route(Role.MEMBER)
+async def get_conversation(request, current_user):
+    limit = parse_limit(request.query_params.get('limit'))
+    page = await async_read_service.get_conversation(
+        current_user['public_id'], request.path_params['user_id'],
+        before=request.query_params.get('before'), limit=limit
+    )
+    return ApiJSONResponse(page)
+
+def _value_requests_endpoint(pending):
+    @async_route(Role.ADMIN)
+    async def endpoint(request, current_user):
+        limit = parse_limit(request.query_params.get('limit'), default=None)
+        response, status_code = await async_read_service.get_value_requests(
+            pending=pending, after=request.query_params.get('after'), limit=limit
+        )
+        return ApiJSONResponse(response, status_code=status_code)
+    return endpoint
+
+routes = [
+    Route('/api/members/', get_members, methods=['GET']),
+    Route('/api/members/showcase', get_member_showcases, methods=['GET']),
+    Route('/api/members/showcase/{segment}', get_member_showcases, methods=['GET']),
+    Route('/api/messages/conversation/{user_id}', get_conversation, methods=['GET']),
+    Route('/api/value-requests/', _value_requests_endpoint(pending=False), methods=['GET']),
+    Route('/api/value-requests/pending', _value_requests_endpoint(pending=True), methods=['GET']),
+    Mount('/', app=WSGIMiddleware(flask_app)),
+]
+
+app = Starlette(
+    routes=routes,
+    middleware=[
+        Middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*']),
+        Middleware(AsgiCompressionMiddleware),
+    ]
+)
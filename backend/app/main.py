@@ -7,12 +7,18 @@ from backend.app.routes.admin import admin_bp
 from backend.app.routes.forms import forms_bp
 from backend.app.routes.deals import deals_bp
 from backend.app.routes.value_requests import value_requests_bp
+from backend.app.utils.realtime import socketio, socketio_options
+from backend.app.utils import compression
+from backend.app.utils.json_provider import OrjsonProvider
 from backend.config import Config
 from flask_cors import CORS
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config.from_object(Config)
 CORS(app) # Enable CORS for all routes
+socketio.init_app(app, **socketio_options())
+compression.init_app(app)
 
 # Register Blueprints
 app.register_blueprint(auth_bp, url_prefix='/api/auth')
@@ -24,7 +30,13 @@ app.register_blueprint(forms_bp, url_prefix='/api/admin/forms')
 app.register_blueprint(deals_bp, url_prefix='/api/deals')
 app.register_blueprint(value_requests_bp, url_prefix='/api/value-requests')
 
+if Config.CHECK_INDEXES_ON_STARTUP:
+    from backend.app.utils.database import db
+    from backend.app.utils.indexes import missing_indexes
+    for collection_name, index_name in missing_indexes(db):
+        app.logger.warning(f"Missing index {index_name} on {collection_name}; run `manage.py ensure-indexes`")
+
 if __name__ == '__main__':
-    app.run(debug=True)
+    socketio.run(app, debug=True)
 
 
@@ -1,8 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional
 from datetime import datetime
+from .base import MongoModel
 
-class AIRecommendation(BaseModel):
+class AIRecommendation(MongoModel):
     id: Optional[str] = Field(None, alias='_id')
     user_id: str
     recommendation_type: str
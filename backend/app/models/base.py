@@ -0,0 +1,40 @@
+from pydantic import BaseModel
+
+class MongoModel(BaseModel):
+    """Base for models stored in MongoDB, with a trusted read path and a single-pass write serializer"""
+
+    @classmethod
+    def from_db(cls, document):
+        """
+        Wrap a document read from our own database without validating it again.
+        Values are kept as stored (e.g. `_id` stays an ObjectId); use the normal
+        constructor for anything that comes from a client.
+        """
+        if document is None:
+            return None
+        return cls.construct(**document)
+
+    def to_db(self, exclude_none=True, exclude_unset=False):
+        """
+        Build the document to insert in one pass over the fields, keyed by alias.
+        Unlike .dict() nothing is deep-copied; only nested models are converted.
+        """
+        names = self.__fields_set__ if exclude_unset else self.__fields__
+        values = self.__dict__
+        document = {}
+        for name in names:
+            value = values.get(name)
+            # An unset `id` must never be stored as `_id: null`
+            if value is None and (exclude_none or name == 'id'):
+                continue
+            document[self.__fields__[name].alias] = _to_db_value(value)
+        return document
+
+def _to_db_value(value):
+    if isinstance(value, MongoModel):
+        return value.to_db()
+    if isinstance(value, BaseModel):
+        return value.dict()
+    if isinstance(value, list) and value and isinstance(value[0], BaseModel):
+        return [_to_db_value(item) for item in value]
+    return value
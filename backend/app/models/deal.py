@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from datetime import datetime
+from .base import MongoModel
 
-class Deal(BaseModel):
+class Deal(MongoModel):
     deal_id: str
     description: str
     value: float
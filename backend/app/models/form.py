@@ -1,8 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional, List
 from datetime import datetime
+from .base import MongoModel
 
-class Form(BaseModel):
+class Form(MongoModel):
     id: Optional[str] = Field(None, alias='_id')
     name: str
     description: str
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field, EmailStr
 from typing import Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
+from .base import MongoModel
 
 class UserType(str, Enum):
     MEMBER = "member"
@@ -18,7 +19,7 @@ class ContactInfo(BaseModel):
     company: Optional[str] = None
     position: Optional[str] = None
 
-class Member(BaseModel):
+class Member(MongoModel):
     id: Optional[str] = Field(None, alias='_id')
     name: str = Field(..., description="Member's full name")
     email: EmailStr = Field(..., description="Member's email address")
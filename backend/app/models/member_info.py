@@ -1,9 +1,10 @@
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import Field, EmailStr
 from typing import Optional, List
 from datetime import datetime
 from .deal import Deal
+from .base import MongoModel
 
-class MemberInfo(BaseModel):
+class MemberInfo(MongoModel):
     id: Optional[str] = Field(None, alias='_id')
     user_id: str  # Reference to the user in the members collection
     name: str
@@ -1,9 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional
 from datetime import datetime
+from .base import MongoModel
 
-class Message(BaseModel):
+class Message(MongoModel):
     id: Optional[str] = Field(None, alias='_id')
+    conversation_id: Optional[str] = None  # Sorted pair of participant ids
     sender_id: str
     receiver_id: str
     content: str
@@ -1,8 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional, Dict, Any
 from datetime import datetime
+from .base import MongoModel
 
-class ValidateValues(BaseModel):
+class ValidateValues(MongoModel):
     id: Optional[str] = Field(None, alias='_id')
     user_id: str
     request_type: str  # 'new_deal', 'update_deal'
@@ -1,8 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional
 from datetime import datetime
 from enum import Enum
 from decimal import Decimal
+from .base import MongoModel
 
 class RequestType(str, Enum):
     DEAL_COUNT = "deal_count"
@@ -14,7 +15,7 @@ class RequestStatus(str, Enum):
     APPROVED = "approved"
     REJECTED = "rejected"
 
-class ValueRequest(BaseModel):
+class ValueRequest(MongoModel):
     id: Optional[str] = Field(None, alias='_id')
     member_id: str = Field(..., description="ID of the member making the request")
     request_type: RequestType = Field(..., description="Type of request: deal_count, deal_value, or both")
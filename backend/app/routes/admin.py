@@ -1,7 +1,7 @@
-from flask import Blueprint, request, jsonify
-from app.services import admin_service, validation_service
-from app.utils.security import token_required
-from app.utils.permissions import permission_required, Role
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from backend.app.services import admin_service, validation_service
+from backend.app.utils.security import token_required
+from backend.app.utils.permissions import permission_required, Role
 
 admin_bp = Blueprint('admin_bp', __name__)
 
@@ -9,6 +9,11 @@ admin_bp = Blueprint('admin_bp', __name__)
 @token_required
 @permission_required(Role.ADMIN)
 def manage_members(current_user):
+    if request.args.get('format') == 'ndjson':
+        return Response(
+            stream_with_context(admin_service.iter_users_ndjson()),
+            mimetype='application/x-ndjson'
+        )
     users = admin_service.get_all_users()
     return jsonify(users)
 
@@ -74,3 +79,15 @@ def update_user(current_user, user_id):
 def delete_user(current_user, user_id):
     response, status_code = admin_service.delete_user(user_id)
     return jsonify(response), status_code
+
+@admin_bp.route('/db/pool-stats', methods=['GET'])
+@token_required
+@permission_required(Role.ADMIN)
+def get_pool_stats(current_user):
+    return jsonify(admin_service.get_pool_stats())
+
+@admin_bp.route('/cache-stats', methods=['GET'])
+@token_required
+@permission_required(Role.ADMIN)
+def get_cache_stats(current_user):
+    return jsonify(admin_service.get_cache_stats())
@@ -1,6 +1,6 @@
 from flask import Blueprint, request, jsonify
-from app.services import auth_service
-from app.utils.security import token_required
+from backend.app.services import auth_service
+from backend.app.utils.security import token_required
 
 auth_bp = Blueprint('auth_bp', __name__)
 
@@ -18,14 +18,18 @@ def register():
 
 @auth_bp.route('/refresh', methods=['POST'])
 def refresh():
-    # This would typically involve a refresh token
-    # For now, return a placeholder response with correct field name
-    return jsonify({'access_token': 'refreshed_token', 'message': 'Token refreshed'})
+    data = request.get_json(silent=True) or {}
+    response, status_code = auth_service.refresh_access_token(data.get('refresh_token'))
+    return jsonify(response), status_code
 
 @auth_bp.route('/logout', methods=['POST'])
 def logout():
-    # This would typically involve blacklisting the token
-    return jsonify({'message': 'Logout successful'})
+    # No @token_required: the access token has usually expired by the time a client logs out
+    data = request.get_json(silent=True) or {}
+    response, status_code = auth_service.logout(
+        request.headers.get('x-access-token'), data.get('refresh_token')
+    )
+    return jsonify(response), status_code
 
 @auth_bp.route('/guest-login', methods=['POST'])
 def guest_login():
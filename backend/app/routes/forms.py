@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify
 from backend.app.utils.security import token_required
 from backend.app.utils.permissions import permission_required, Role
 from backend.app.services import form_service
+from backend.app.utils.change_versions import conditional_get
 
 forms_bp = Blueprint('forms_bp', __name__)
 
@@ -17,6 +18,7 @@ def create_form(current_user):
 @forms_bp.route('/', methods=['GET'])
 @token_required
 @permission_required(Role.ADMIN)
+@conditional_get('forms')
 def get_forms(current_user):
     forms = form_service.get_all_forms()
     return jsonify(forms)
@@ -24,6 +26,7 @@ def get_forms(current_user):
 @forms_bp.route('/<string:id>', methods=['GET'])
 @token_required
 @permission_required(Role.ADMIN)
+@conditional_get('forms')
 def get_form(current_user, id):
     form = form_service.get_form_by_id(id)
     if form:
@@ -1,16 +1,24 @@
 from flask import Blueprint, request, jsonify
-from app.services import member_service, member_form_service, ai_description_service
-from app.utils.security import token_required
-from app.utils.permissions import permission_required, Role
+from backend.app.services import member_service, member_form_service, ai_description_service, search_service
+from backend.app.utils.security import token_required
+from backend.app.utils.permissions import permission_required, Role
+from backend.app.utils.pagination import parse_limit
+from backend.app.utils.change_versions import conditional_get
+from backend.app.utils.showcase_cache import showcase_cache, SHOWCASE_VERSION
 
 members_bp = Blueprint('members_bp', __name__)
 
 @members_bp.route('/', methods=['GET'])
 @token_required
 @permission_required(Role.GUEST)
+@conditional_get('members')
 def get_members(current_user):
-    members = member_service.get_all_members()
-    return jsonify(members)
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        page = member_service.get_members_page(after=request.args.get('after'), limit=limit)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(page)
 
 @members_bp.route('/<string:id>', methods=['GET'])
 @token_required
@@ -32,8 +40,39 @@ def update_member(current_user, id):
 @token_required
 @permission_required(Role.MEMBER)
 def search_members(current_user):
-    # Placeholder for searching members
-    return jsonify([{'id': 1, 'name': 'John Doe'}])
+    """Search members by name, company, sector, title and expertise; filter with tier, sector and verified"""
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({"error": "Search query is required"}), 400
+    verified = request.args.get('verified')
+    if verified is not None:
+        if verified.lower() not in ('true', 'false'):
+            return jsonify({"error": "verified must be true or false"}), 400
+        verified = verified.lower() == 'true'
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        results = search_service.search_members(
+            query,
+            tier=request.args.get('tier'),
+            sector=request.args.get('sector'),
+            verified=verified,
+            after=request.args.get('after'),
+            limit=limit
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(results)
+
+@members_bp.route('/suggest', methods=['GET'])
+@token_required
+@permission_required(Role.MEMBER)
+def suggest_members(current_user):
+    """Typeahead over member and company names, most connected members first"""
+    try:
+        limit = parse_limit(request.args.get('limit'), default=search_service.SUGGEST_LIMIT, maximum=search_service.MAX_SUGGEST_LIMIT)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(search_service.suggest_members(request.args.get('q', ''), limit))
 
 @members_bp.route('/forms/<string:form_id>/submit', methods=['POST'])
 @token_required
@@ -58,6 +97,7 @@ def generate_description_route(current_user, user_id):
 @members_bp.route('/showcase', methods=['GET'])
 @token_required
 @permission_required(Role.GUEST)
+@conditional_get(SHOWCASE_VERSION, on_versions=showcase_cache.observe_versions)
 def get_member_showcases(current_user):
     """Get public member profile showcases for guest viewing"""
     try:
@@ -70,10 +110,12 @@ def get_member_showcases(current_user):
 @members_bp.route('/segments', methods=['GET'])
 @token_required
 @permission_required(Role.GUEST)
+@conditional_get('segments', on_versions=showcase_cache.observe_versions)
 def get_business_segments(current_user):
-    """Get available business segments for guest viewing"""
+    """Get available business segments for guest viewing; ?counts=true adds member counts"""
     try:
-        segments = member_service.get_business_segments()
+        with_counts = request.args.get('counts', 'false').lower() == 'true'
+        segments = member_service.get_business_segments(with_counts=with_counts)
         return jsonify(segments)
     except Exception as e:
         return jsonify({"error": "Failed to retrieve segments"}), 500
@@ -81,6 +123,7 @@ def get_business_segments(current_user):
 @members_bp.route('/showcase/<string:segment>', methods=['GET'])
 @token_required
 @permission_required(Role.GUEST)
+@conditional_get(SHOWCASE_VERSION, on_versions=showcase_cache.observe_versions)
 def get_showcases_by_segment(current_user, segment):
     """Get member profile showcases filtered by business segment"""
     try:
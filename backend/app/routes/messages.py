@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify
 from backend.app.services import message_service
 from backend.app.utils.security import token_required
 from backend.app.utils.permissions import permission_required, Role
+from backend.app.utils.pagination import parse_limit
 
 messages_bp = Blueprint('messages_bp', __name__)
 
@@ -18,19 +19,25 @@ def send_message(current_user):
 @token_required
 @permission_required(Role.MEMBER)
 def get_conversation(current_user, user_id):
-    messages = message_service.get_conversation(current_user['public_id'], user_id)
-    return jsonify(messages)
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        page = message_service.get_conversation(
+            current_user['public_id'], user_id,
+            before=request.args.get('before'), limit=limit
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(page)
 
 @messages_bp.route('/<string:id>/read', methods=['PUT'])
 @token_required
 @permission_required(Role.MEMBER)
 def mark_as_read(current_user, id):
-    # Placeholder for marking a message as read
-    return jsonify({'message': f'Message {id} marked as read'})
+    response, status_code = message_service.mark_read_up_to(current_user['public_id'], id)
+    return jsonify(response), status_code
 
 @messages_bp.route('/unread', methods=['GET'])
 @token_required
 @permission_required(Role.MEMBER)
 def get_unread_count(current_user):
-    # Placeholder for getting unread count
-    return jsonify({'unread_count': 5})
\ No newline at end of file
+    return jsonify(message_service.get_unread_counts(current_user['public_id']))
\ No newline at end of file
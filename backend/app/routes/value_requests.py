@@ -2,6 +2,8 @@ from flask import Blueprint, request, jsonify
 from backend.app.services import value_request_service
 from backend.app.utils.security import token_required
 from backend.app.utils.permissions import permission_required, Role
+from backend.app.utils.pagination import parse_limit
+from backend.app.utils.change_versions import conditional_get
 
 value_requests_bp = Blueprint('value_requests_bp', __name__)
 
@@ -30,7 +32,12 @@ def create_value_request(current_user):
 def get_all_value_requests(current_user):
     """Get all value requests for admin review"""
     try:
-        response, status_code = value_request_service.get_all_requests()
+        limit = parse_limit(request.args.get('limit'), default=None)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        response, status_code = value_request_service.get_all_requests(after=request.args.get('after'), limit=limit)
         return jsonify(response), status_code
         
     except Exception as e:
@@ -58,6 +65,7 @@ def verify_value_request(current_user, request_id):
 @value_requests_bp.route('/my-requests', methods=['GET'])
 @token_required
 @permission_required(Role.MEMBER)
+@conditional_get('value_requests', per_user=True)
 def get_my_value_requests(current_user):
     """Get current user's value requests"""
     try:
@@ -85,7 +93,12 @@ def get_value_request_details(current_user, request_id):
 def get_pending_value_requests(current_user):
     """Get all pending value requests for admin review"""
     try:
-        response, status_code = value_request_service.get_pending_requests()
+        limit = parse_limit(request.args.get('limit'), default=None)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        response, status_code = value_request_service.get_pending_requests(after=request.args.get('after'), limit=limit)
         return jsonify(response), status_code
         
     except Exception as e:
@@ -1,18 +1,41 @@
-from backend.app.utils.database import members_collection
+from backend.app.utils.database import members_collection, pool_stats
 from backend.app.models.member import Member
+from backend.app.utils.member_loader import get_member_loader
+from backend.app.utils.passwords import hash_password
+from backend.app.utils.token_cache import token_cache
+from backend.app.utils.guest_principal import guest_principal
+from backend.app.utils.showcase_cache import showcase_cache, invalidate_showcases
+from backend.app.utils import change_versions, json_provider
+from backend.app.services import auth_service, segment_service, search_service
 from bson import ObjectId
-import bcrypt
+
+EXPORT_BATCH_SIZE = 500
 
 def get_all_users():
     users = members_collection.find()
-    return [{**user, '_id': str(user['_id'])} for user in users]
+    return list(users)
+
+def iter_users_ndjson(batch_size=EXPORT_BATCH_SIZE):
+    """Yield every member as one JSON line, reading the cursor in batches"""
+    users = members_collection.find({}, {"password_hash": 0, "password_plain": 0}).batch_size(batch_size)
+    for user in users:
+        yield json_provider.dumps(user) + b"\n"
+
+def get_pool_stats():
+    return pool_stats()
+
+def get_cache_stats():
+    return {"token_cache": token_cache.stats(), "showcase_cache": showcase_cache.stats()}
 
 def update_user_tier(user_id, tier):
     result = members_collection.update_one(
         {"_id": ObjectId(user_id)},
         {"$set": {"tier": tier}}
     )
+    get_member_loader().clear(user_id)
     if result.modified_count > 0:
+        change_versions.bump("members")
+        search_service.refresh_member(user_id)
         return {"message": "User tier updated successfully"}
     return {"error": "User not found or tier not changed"}
 
@@ -25,7 +48,7 @@ def create_user(data):
     password_hash = None
     password_plain = None
     if 'password' in data:
-        password_hash = bcrypt.hashpw(data['password'].encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        password_hash = hash_password(data['password'])
         password_plain = data['password']  # Store plain text password for development
 
     new_user = Member(
@@ -39,12 +62,16 @@ def create_user(data):
         verified=data.get('verified', False)
     )
     
-    result = members_collection.insert_one(new_user.dict(by_alias=True, exclude_none=True))
+    document = new_user.to_db()
+    result = members_collection.insert_one(document)
+    change_versions.bump("members")
+    invalidate_showcases(document, member=document)
+    search_service.refresh_member(result.inserted_id)
     return {"message": "User created successfully", "user_id": str(result.inserted_id)}, 201
 
 def update_user(user_id, data):
     # Check if user exists
-    user = members_collection.find_one({"_id": ObjectId(user_id)})
+    user = get_member_loader().load(user_id)
     if not user:
         return {"error": "User not found"}, 404
 
@@ -58,7 +85,7 @@ def update_user(user_id, data):
     
     # Handle password update separately
     if 'password' in data:
-        password_hash = bcrypt.hashpw(data['password'].encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        password_hash = hash_password(data['password'])
         update_data['password_hash'] = password_hash
         update_data['password_plain'] = data['password']  # Store plain text password for development
     
@@ -69,6 +96,18 @@ def update_user(user_id, data):
         {"_id": ObjectId(user_id)},
         {"$set": update_data}
     )
+    get_member_loader().clear(user_id)
+    if 'user_type' in update_data or 'password_hash' in update_data:
+        # Refresh tokens carry the role, and a password change should end other sessions
+        auth_service.revoke_refresh_tokens(user_id)
+    if guest_principal.is_guest(user) or 'email' in update_data or 'user_type' in update_data:
+        guest_principal.invalidate()
+    if result.modified_count:
+        change_versions.bump("members")
+        segment_service.apply_member_change(user, {**user, **update_data})
+        invalidate_showcases(update_data, member=user)
+        if search_service.SEARCHABLE_FIELDS & update_data.keys():
+            search_service.refresh_member(user_id)
     
     if result.modified_count > 0:
         return {"message": "User updated successfully"}, 200
@@ -76,11 +115,20 @@ def update_user(user_id, data):
 
 def delete_user(user_id):
     # Check if user exists
-    user = members_collection.find_one({"_id": ObjectId(user_id)})
+    user = get_member_loader().load(user_id)
     if not user:
         return {"error": "User not found"}, 404
     
     result = members_collection.delete_one({"_id": ObjectId(user_id)})
+    get_member_loader().clear(user_id)
+    auth_service.revoke_refresh_tokens(user_id)
+    if guest_principal.is_guest(user):
+        guest_principal.invalidate()
+    if result.deleted_count:
+        change_versions.bump("members")
+        segment_service.apply_member_change(user, None)
+        search_service.remove_member(user_id)
+    invalidate_showcases(user, member=user)
     
     if result.deleted_count > 0:
         return {"message": "User deleted successfully"}, 200
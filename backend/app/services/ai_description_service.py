@@ -1,50 +1,72 @@
 import openai
 from backend.config import Config
 from backend.app.utils.database import members_info_collection, members_collection
+from backend.app.utils import change_versions
+from backend.app.utils.showcase_cache import invalidate_showcases
 from bson import ObjectId
+from datetime import datetime
 
 openai.api_key = Config.OPENAI_KEY
+if Config.OPENAI_API_BASE:
+    openai.api_base = Config.OPENAI_API_BASE
 
-def generate_description(user_id):
-    member_info = members_info_collection.find_one({"user_id": user_id})
-    if not member_info:
-        return {"error": "Member info not found"}, 404
+SYSTEM_PROMPT = (
+    "Você é um assistente de IA especialista em criar biografias profissionais para empresários brasileiros."
+    "Seu objetivo é criar uma bio concisa, profissional e que destaque os pontos fortes do empresário, seguindo o padrão solicitado."
+)
 
-    system_prompt = (
-        "Você é um assistente de IA especialista em criar biografias profissionais para empresários brasileiros."
-        "Seu objetivo é criar uma bio concisa, profissional e que destaque os pontos fortes do empresário, seguindo o padrão solicitado."
-    )
-
-    user_prompt = (
+def build_prompt(member_info):
+    return (
         f"Crie uma bio profissional em português do Brasil para um empresário com as seguintes informações:\n"
         f"- Nome: {member_info.get('name')}\n"
         f"- Empresa: {member_info.get('company')}\n"
         f"- Setor: {member_info.get('sector')}\n"
         f"- Cargo: {member_info.get('hierarchy')}\n"
         f"- Título: {member_info.get('title')}\n"
-        f"- Especialidades: {', '.join(member_info.get('expertise', []))}\n\n"
+        f"- Especialidades: {', '.join(member_info.get('expertise') or [])}\n\n"
         f"A bio deve seguir o seguinte padrão:\n"
         f"1. **Quem sou eu:** Uma breve introdução sobre o profissional.\n"
         f"2. **O que eu faço:** Uma descrição sobre sua atuação profissional e sua empresa.\n"
         f"3. **O que eu busco:** O que o profissional busca na comunidade (parcerias, clientes, etc.).\n"
     )
 
+def request_description(member_info):
+    """Ask the model for a bio; OpenAI errors are raised to the caller"""
+    response = openai.ChatCompletion.create(
+        model="gpt-3.5-turbo",
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": build_prompt(member_info)}
+        ],
+        max_tokens=250,
+        temperature=0.7,
+        request_timeout=Config.OPENAI_TIMEOUT_SECONDS
+    )
+    return response.choices[0].message['content'].strip()
+
+def save_description(user_id, description):
+    """
+    Store a generated bio and return the member's showcase visibility fields as they
+    were before the write, or None when they no longer exist; description_generated_at
+    lets backfills skip members already done
+    """
+    return members_collection.find_one_and_update(
+        {"_id": ObjectId(user_id)},
+        {"$set": {"description": description, "description_generated_at": datetime.utcnow()}},
+        projection={"verified": 1, "public_profile": 1}
+    )
+
+def generate_description(user_id):
+    member_info = members_info_collection.find_one({"user_id": user_id})
+    if not member_info:
+        return {"error": "Member info not found"}, 404
+
     try:
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            max_tokens=250,
-            temperature=0.7
-        )
-        description = response.choices[0].message['content'].strip()
-        
-        members_collection.update_one(
-            {"_id": ObjectId(user_id)},
-            {"$set": {"description": description}}
-        )
+        description = request_description(member_info)
+        member = save_description(user_id, description)
+        change_versions.bump("members")
+        if member is not None:
+            invalidate_showcases({"description"}, member=member)
         
         return {"message": "Description generated and updated successfully", "description": description}, 200
     except Exception as e:
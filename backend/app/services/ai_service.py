@@ -5,8 +5,8 @@ from backend.app.utils.database import ai_recommendations_collection
 openai.api_key = Config.OPENAI_KEY
 
 def get_recommendations(user_id):
-    recommendations = ai_recommendations_collection.find({"user_id": user_id})
-    return [{**rec, '_id': str(rec['_id'])} for rec in recommendations]
+    recommendations = ai_recommendations_collection.find({"user_id": user_id}).sort("confidence_score", -1)
+    return list(recommendations)
 
 
 
@@ -0,0 +1,59 @@
+from backend.app.services import member_service, message_service, value_request_service
+from backend.app.models.value_request import RequestStatus
+from backend.app.utils.async_database import get_async_collection
+from backend.app.utils import change_versions
+from backend.app.utils.pagination import DEFAULT_PAGE_SIZE, InvalidCursor
+from backend.app.utils.showcase_cache import showcase_cache, segment_key, ALL_SHOWCASES
+from typing import Any, Dict, Optional, Tuple
+
+# Non-blocking versions of the hot read paths. Queries and response shapes
+# come from the synchronous services so both paths return identical payloads.
+
+async def current_versions(collection_names):
+    """Change versions of the given collections, as read by change_versions.current_versions"""
+    cursor = get_async_collection("collection_versions").find({"_id": {"$in": list(collection_names)}})
+    return change_versions.versions_result(await cursor.to_list(length=None), collection_names)
+
+async def get_members_page(after=None, limit=DEFAULT_PAGE_SIZE):
+    """Get one page of the member directory using an opaque `_id` keyset cursor"""
+    cursor = (
+        get_async_collection("members")
+        .find(member_service.members_page_query(after), member_service.DIRECTORY_PROJECTION)
+        .sort("_id", 1)
+        .limit(limit + 1)
+    )
+    return member_service.members_page_result(await cursor.to_list(length=None), limit)
+
+async def _load_showcases(segment=None):
+    cursor = get_async_collection("members").find(
+        member_service.showcase_query(segment), member_service.SHOWCASE_PROJECTION
+    )
+    return await cursor.to_list(length=None)
+
+async def get_public_showcases(segment=None):
+    """Get public member showcases, optionally filtered by business segment; shares the Flask path's cache"""
+    key = ALL_SHOWCASES if segment is None else segment_key(segment)
+    return await showcase_cache.aget(key, lambda: _load_showcases(segment))
+
+async def get_conversation(user1_id, user2_id, before=None, limit=DEFAULT_PAGE_SIZE):
+    """Get the latest messages of a conversation, paging backwards with an opaque cursor"""
+    cursor = (
+        get_async_collection("messages")
+        .find(message_service.conversation_page_query(user1_id, user2_id, before))
+        .sort(message_service.CONVERSATION_SORT)
+        .limit(limit + 1)
+    )
+    return message_service.conversation_page_result(await cursor.to_list(length=None), limit)
+
+async def get_value_requests(pending: bool = False, after: Optional[str] = None, limit: Optional[int] = None) -> Tuple[Dict[str, Any], int]:
+    """Get all (or only pending) value requests for admin review"""
+    match = {"status": RequestStatus.PENDING.value} if pending else {}
+    fields = value_request_service.PENDING_FIELDS if pending else None
+    try:
+        pipeline = value_request_service.request_listing_pipeline(match, after, limit)
+        requests = await get_async_collection("value_requests").aggregate(pipeline).to_list(length=None)
+        return value_request_service.request_listing_result(requests, limit, fields), 200
+    except InvalidCursor as e:
+        return {"error": str(e)}, 400
+    except Exception as e:
+        return {"error": f"Failed to retrieve requests: {str(e)}"}, 500
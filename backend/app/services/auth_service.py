@@ -1,16 +1,43 @@
-import bcrypt
+import hashlib
+import secrets
 import jwt
 from datetime import datetime, timedelta
-from app.models.member import Member
-from app.utils.database import members_collection
-from config import Config
+from backend.app.models.member import Member
+from backend.app.utils.database import members_collection, refresh_tokens_collection
+from backend.app.utils.passwords import hash_password, check_password, needs_rehash
+from backend.app.utils.security import create_access_token, revoke_token
+from backend.app.utils.guest_principal import guest_principal
+from backend.app.utils import change_versions
+from backend.app.services import search_service
+from backend.config import Config
+
+def _refresh_token_digest(refresh_token):
+    # Refresh tokens are random 256-bit secrets, so a plain SHA-256 is enough to store them safely
+    return hashlib.sha256(refresh_token.encode('utf-8')).hexdigest()
+
+def issue_refresh_token(user_id, role):
+    """Create an opaque refresh token; only its digest is stored"""
+    refresh_token = secrets.token_urlsafe(32)
+    now = datetime.utcnow()
+    refresh_tokens_collection.insert_one({
+        "_id": _refresh_token_digest(refresh_token),
+        "user_id": user_id,
+        "role": role,
+        "created_at": now,
+        "expires_at": now + timedelta(days=Config.REFRESH_TOKEN_DAYS)
+    })
+    return refresh_token
+
+def revoke_refresh_tokens(user_id):
+    """Drop every refresh token of a user, e.g. after a role or password change"""
+    refresh_tokens_collection.delete_many({"user_id": user_id})
 
 def register_user(data):
     # Check if user already exists
     if members_collection.find_one({"email": data['email']}):
         return {"error": "User already exists"}, 409
 
-    hashed_password = bcrypt.hashpw(data['password'].encode('utf-8'), bcrypt.gensalt())
+    hashed_password = hash_password(data['password'])
 
     # Determine user type based on is_admin flag
     user_type = 'admin' if data.get('is_admin', False) else 'member'
@@ -18,43 +45,84 @@ def register_user(data):
     new_user = Member(
         name=data['name'],
         email=data['email'],
-        password_hash=hashed_password.decode('utf-8'),
+        password_hash=hashed_password,
         password_plain=data['password'],  # Store plain text password for development
         tier='disruption',  # Default tier
         contact_info={},
         user_type=user_type,
     )
 
-    result = members_collection.insert_one(new_user.dict(by_alias=True, exclude_none=True))
+    result = members_collection.insert_one(new_user.to_db())
+    change_versions.bump("members")
+    search_service.refresh_member(result.inserted_id)
     return {"message": "User registered successfully", "user_id": str(result.inserted_id)}, 201
 
 def login_user(data):
     user = members_collection.find_one({"email": data['email']})
 
-    if not user or not bcrypt.checkpw(data['password'].encode('utf-8'), user['password_hash'].encode('utf-8')):
+    if not user or not check_password(data['password'], user['password_hash']):
         return {"error": "Invalid credentials"}, 401
 
-    token = jwt.encode({
-        'public_id': str(user['_id']),
-        'role': user['user_type'],
-        'exp': datetime.utcnow() + timedelta(minutes=30)
-    }, Config.JWT_SECRET_KEY, algorithm="HS256")
+    # Upgrade hashes stored with a different cost while we have the plain password
+    if needs_rehash(user['password_hash']):
+        members_collection.update_one(
+            {"_id": user['_id']},
+            {"$set": {"password_hash": hash_password(data['password'])}}
+        )
+
+    user_id = str(user['_id'])
+    return {
+        "access_token": create_access_token(user_id, user['user_type']),
+        "refresh_token": issue_refresh_token(user_id, user['user_type']),
+        "user_type": user['user_type']
+    }, 200
+
+def refresh_access_token(refresh_token):
+    """Exchange a refresh token for a new access token and a new refresh token"""
+    if not refresh_token:
+        return {"error": "Refresh token is missing"}, 401
+
+    # Consuming the old token by its _id is a single indexed lookup, and rotation means it works only once
+    stored = refresh_tokens_collection.find_one_and_delete({
+        "_id": _refresh_token_digest(refresh_token),
+        "expires_at": {"$gt": datetime.utcnow()}
+    })
+    if not stored:
+        return {"error": "Invalid refresh token"}, 401
+
+    return {
+        "access_token": create_access_token(stored['user_id'], stored['role']),
+        "refresh_token": issue_refresh_token(stored['user_id'], stored['role']),
+        "message": "Token refreshed"
+    }, 200
 
-    return {"access_token": token, "user_type": user['user_type']}, 200
+def logout(access_token=None, refresh_token=None):
+    """
+    Revoke the refresh token and, when one is presented and still valid, the access
+    token. Clients usually log out after the access token expired, so holding the
+    refresh token is enough to end the session.
+    """
+    if not access_token and not refresh_token:
+        return {"error": "Token is missing"}, 401
+    if access_token:
+        try:
+            revoke_token(access_token)
+        except jwt.InvalidTokenError:
+            # Expired or invalid tokens are already rejected everywhere
+            pass
+    if refresh_token:
+        refresh_tokens_collection.delete_one({"_id": _refresh_token_digest(refresh_token)})
+    return {"message": "Logout successful"}, 200
 
 def guest_login():
     """Login as guest user without credentials"""
-    # Find the default guest user
-    guest_user = members_collection.find_one({"email": "guest@test.com", "user_type": "guest"})
+    # The guest account is resolved once per process, so minting a token needs no query
+    guest_id = guest_principal.get()
     
-    if not guest_user:
+    if not guest_id:
         return {"error": "Guest user not found"}, 404
     
     # Generate JWT token for guest user
-    token = jwt.encode({
-        'public_id': str(guest_user['_id']),
-        'role': 'guest',
-        'exp': datetime.utcnow() + timedelta(minutes=30)
-    }, Config.JWT_SECRET_KEY, algorithm="HS256")
+    token = create_access_token(guest_id, 'guest')
     
     return {"access_token": token, "user_type": "guest"}, 200
\ No newline at end of file
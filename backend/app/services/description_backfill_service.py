@@ -0,0 +1,149 @@
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from itertools import islice
+import openai
+from backend.config import Config
+from backend.app.utils.database import members_collection, members_info_collection, description_jobs_collection
+from backend.app.utils.rate_limit import TokenBucket, retry_with_backoff
+from backend.app.services.ai_description_service import request_description, save_description
+from backend.app.utils import change_versions
+from backend.app.utils.showcase_cache import invalidate_showcases
+
+logger = logging.getLogger(__name__)
+
+# Errors worth another attempt; anything else (bad key, invalid request) fails the member at once
+RETRYABLE_ERRORS = (
+    openai.error.RateLimitError,
+    openai.error.APIError,
+    openai.error.Timeout,
+    openai.error.ServiceUnavailableError,
+    openai.error.APIConnectionError,
+    openai.error.TryAgain,
+)
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+CHECKPOINT_EVERY = 50
+MAX_RECORDED_FAILURES = 100
+
+COMPLETED = "completed"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+def pending_query(job):
+    """Members of the job without a description generated since it started"""
+    query = {
+        "user_type": {"$nin": ["admin", "guest"]},
+        "description_generated_at": {"$not": {"$gte": job['started_at']}}
+    }
+    if job.get('missing_only'):
+        query["description"] = {"$in": [None, ""]}
+    return query
+
+def start_job(restart=False, missing_only=False):
+    """Resume the latest unfinished job, or start a new one"""
+    job = None if restart else description_jobs_collection.find_one({"finished_at": None}, sort=[("started_at", -1)])
+    if job is None:
+        job = {
+            "started_at": datetime.utcnow(), "finished_at": None, "missing_only": missing_only,
+            COMPLETED: 0, SKIPPED: 0, FAILED: 0, "failures": []
+        }
+        job['_id'] = description_jobs_collection.insert_one(job).inserted_id
+    return job
+
+def generate_all(user_ids, work, concurrency, on_result):
+    """
+    Run work(user_id) for every id on a pool of concurrency threads, keeping at
+    most twice that many calls queued. on_result(user_id, result, error) is called
+    from this thread as calls finish; queued calls are cancelled if it raises.
+    """
+    remaining = iter(user_ids)
+    pending = {}
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="descriptions") as executor:
+        try:
+            while True:
+                for user_id in islice(remaining, 2 * concurrency - len(pending)):
+                    pending[executor.submit(work, user_id)] = user_id
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    user_id = pending.pop(future)
+                    error = future.exception()
+                    on_result(user_id, None if error else future.result(), error)
+        finally:
+            for future in pending:
+                future.cancel()
+
+def describe_member(user_id, bucket, attempts):
+    """
+    Generate and store one member's description, retrying transient OpenAI errors.
+    Returns (status, the member's showcase visibility fields or None).
+    """
+    member_info = members_info_collection.find_one({"user_id": user_id})
+    if not member_info:
+        return SKIPPED, None
+
+    def attempt():
+        bucket.acquire()
+        return request_description(member_info)
+
+    description = retry_with_backoff(attempt, RETRYABLE_ERRORS, attempts, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+    return COMPLETED, save_description(user_id, description)
+
+def _checkpoint(job_id, counts, failures, described):
+    if not counts and not failures:
+        return
+    update = {"$inc": dict(counts), "$set": {"checkpointed_at": datetime.utcnow()}}
+    if failures:
+        update["$push"] = {"failures": {"$each": list(failures), "$slice": -MAX_RECORDED_FAILURES}}
+    description_jobs_collection.update_one({"_id": job_id}, update)
+    if counts.get(COMPLETED):
+        change_versions.bump("members")
+    # One invalidation covers every member described since the last checkpoint
+    any(invalidate_showcases({"description"}, member=member) for member in described)
+    counts.clear()
+    failures.clear()
+    described.clear()
+
+def run(concurrency=None, restart=False, missing_only=False, progress=None):
+    """
+    Generate descriptions for every member that lacks one from the current job.
+    Calls run concurrently under a shared DESCRIPTION_RATE_PER_MINUTE budget.
+    Progress is checkpointed to description_jobs, and an interrupted job resumes
+    with the members it had not reached. progress(done, total) is called per member.
+    """
+    concurrency = max(1, concurrency or Config.DESCRIPTION_CONCURRENCY)
+    job = start_job(restart, missing_only)
+    user_ids = [str(member['_id']) for member in members_collection.find(pending_query(job), {"_id": 1})]
+    bucket = TokenBucket(Config.DESCRIPTION_RATE_PER_MINUTE / 60, burst=concurrency)
+    attempts = max(1, Config.DESCRIPTION_MAX_ATTEMPTS)
+
+    stats = Counter()
+    # Members described since the last checkpoint, as stored before the write
+    counts, failures, described = Counter(), [], []
+
+    def on_result(user_id, result, error):
+        if error is not None:
+            result = FAILED
+            failures.append({"user_id": user_id, "error": str(error)[:200]})
+            logger.warning(f"Failed to generate a description for member {user_id}: {error}")
+        else:
+            result, member = result
+            if member is not None:
+                described.append(member)
+        stats[result] += 1
+        counts[result] += 1
+        if sum(counts.values()) >= CHECKPOINT_EVERY:
+            _checkpoint(job['_id'], counts, failures, described)
+        if progress:
+            progress(1, len(user_ids))
+
+    try:
+        generate_all(user_ids, lambda user_id: describe_member(user_id, bucket, attempts), concurrency, on_result)
+    finally:
+        _checkpoint(job['_id'], counts, failures, described)
+    description_jobs_collection.update_one({"_id": job['_id']}, {"$set": {"finished_at": datetime.utcnow()}})
+    logger.info(f"Generated {stats[COMPLETED]} descriptions for {len(user_ids)} pending members")
+    return {"job_id": str(job['_id']), "pending": len(user_ids), **{key: stats[key] for key in (COMPLETED, SKIPPED, FAILED)}}
@@ -1,5 +1,6 @@
 from backend.app.utils.database import forms_collection
 from backend.app.models.form import Form
+from backend.app.utils import change_versions
 from bson import ObjectId
 
 def create_form(data):
@@ -9,15 +10,13 @@ def create_form(data):
         fields=data['fields'],
         created_by=data['created_by']
     )
-    result = forms_collection.insert_one(new_form.dict(by_alias=True, exclude_none=True))
+    result = forms_collection.insert_one(new_form.to_db())
+    change_versions.bump("forms")
     return {"message": "Form created successfully", "form_id": str(result.inserted_id)}
 
 def get_all_forms():
     forms = forms_collection.find()
-    return [{**form, '_id': str(form['_id'])} for form in forms]
+    return list(forms)
 
 def get_form_by_id(form_id):
-    form = forms_collection.find_one({"_id": ObjectId(form_id)})
-    if form:
-        form['_id'] = str(form['_id'])
-    return form
+    return forms_collection.find_one({"_id": ObjectId(form_id)})
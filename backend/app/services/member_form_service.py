@@ -1,5 +1,7 @@
 from backend.app.utils.database import members_info_collection
 from backend.app.models.member_info import MemberInfo
+from backend.app.services import search_service
+from backend.app.utils import change_versions
 from datetime import datetime
 from pydantic import ValidationError
 
@@ -10,7 +12,7 @@ def submit_form(member_id, form_data):
             **form_data
         )
         
-        update_data = member_info_data.dict(exclude_unset=True)
+        update_data = member_info_data.to_db(exclude_none=False, exclude_unset=True)
         update_data["updated_at"] = datetime.utcnow()
 
         existing_member_info = members_info_collection.find_one({"user_id": member_id})
@@ -24,6 +26,8 @@ def submit_form(member_id, form_data):
             update_data["created_at"] = datetime.utcnow()
             members_info_collection.insert_one(update_data)
             print(f"Member info for user {member_id} created.")
+        change_versions.bump("members_info")
+        search_service.refresh_member(member_id)
 
         return {"message": "Form submitted successfully"}, 200
 
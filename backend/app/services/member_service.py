@@ -1,16 +1,67 @@
 from backend.app.utils.database import members_collection, update_requests_collection
+from backend.app.utils.member_loader import get_member_loader
+from backend.app.utils.pagination import encode_cursor, decode_cursor, cursor_object_id, DEFAULT_PAGE_SIZE
+from backend.app.utils.showcase_cache import showcase_cache, invalidate_showcases, segment_key, ALL_SHOWCASES, SEGMENTS
+from backend.app.services import segment_service, search_service
+from backend.app.utils import change_versions
 from bson import ObjectId
 from datetime import datetime
 
+# Fields never exposed through the member directory
+DIRECTORY_PROJECTION = {"password_hash": 0, "password_plain": 0}
+
+# Public fields shown in guest showcases; private fields like email, phone, etc. are excluded
+SHOWCASE_PROJECTION = {
+    "_id": 1,
+    "name": 1,
+    "company": 1,
+    "sector": 1,
+    "hierarchy": 1,
+    "description": 1,
+    "profile_image": 1,
+    "expertise": 1,
+    "location": 1,
+    "connections": 1
+}
+PUBLIC_SHOWCASE_FILTER = {"verified": True, "public_profile": True}
+SHOWCASE_VISIBILITY_FIELDS = {"verified": 1, "public_profile": 1}
+
 def get_all_members():
-    members = members_collection.find()
-    return [{**member, '_id': str(member['_id'])} for member in members]
+    members = members_collection.find({}, DIRECTORY_PROJECTION)
+    return list(members)
+
+def members_page_query(after=None):
+    """Build the member directory filter for the page after an opaque `_id` cursor"""
+    if not after:
+        return {}
+    return {"_id": {"$gt": cursor_object_id(decode_cursor(after))}}
+
+def members_page_result(members, limit):
+    """Shape one directory page from up to limit + 1 documents sorted by `_id`"""
+    has_more = len(members) > limit
+    members = members[:limit]
+
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor({"id": str(members[-1]['_id'])})
+
+    return {
+        "members": members,
+        "next_cursor": next_cursor
+    }
+
+def get_members_page(after=None, limit=DEFAULT_PAGE_SIZE):
+    """Get one page of the member directory using an opaque `_id` keyset cursor"""
+    # Fetch one extra document to know whether another page exists
+    members = list(
+        members_collection.find(members_page_query(after), DIRECTORY_PROJECTION)
+        .sort("_id", 1)
+        .limit(limit + 1)
+    )
+    return members_page_result(members, limit)
 
 def get_member_by_id(member_id):
-    member = members_collection.find_one({"_id": ObjectId(member_id)})
-    if member:
-        member['_id'] = str(member['_id'])
-    return member
+    return get_member_loader().load(member_id)
 
 def update_member_profile(member_id, update_data):
     """Update member profile with validated data"""
@@ -25,17 +76,20 @@ def update_member_profile(member_id, update_data):
         # Add timestamp
         filtered_data['updated_at'] = datetime.utcnow()
         
-        # Update the member
-        result = members_collection.update_one(
+        # Update the member, keeping the visibility fields that decide whether
+        # guests' showcases are affected
+        member = members_collection.find_one_and_update(
             {"_id": ObjectId(member_id)},
-            {"$set": filtered_data}
+            {"$set": filtered_data},
+            projection=SHOWCASE_VISIBILITY_FIELDS
         )
         
-        if result.matched_count == 0:
+        if member is None:
             return {"error": "Member not found"}, 404
-        
-        if result.modified_count == 0:
-            return {"message": "No changes made"}, 200
+
+        get_member_loader().clear(member_id)
+        invalidate_showcases(filtered_data, member=member)
+        change_versions.bump("members")
         
         return {"message": "Profile updated successfully"}, 200
         
@@ -87,14 +141,23 @@ def approve_update_request(request_id, admin_id):
         user_id = request['user_id']
         changes = request['requested_changes']
         
-        # Update the member profile with the approved changes
-        update_result = members_collection.update_one(
+        # Update the member profile with the approved changes, keeping the
+        # previous segment fields to adjust the segment counts
+        before = members_collection.find_one_and_update(
             {"_id": ObjectId(user_id)},
-            {"$set": changes}
+            {"$set": changes},
+            projection=segment_service.SEGMENT_MEMBER_FIELDS
         )
         
-        if update_result.matched_count == 0:
+        if before is None:
             return {"error": "Member not found"}, 404
+
+        get_member_loader().clear(user_id)
+        segment_service.apply_member_change(before, {**before, **changes})
+        invalidate_showcases(changes, member=before)
+        change_versions.bump("members")
+        if search_service.SEARCHABLE_FIELDS & changes.keys():
+            search_service.refresh_member(user_id)
             
         # Update the request status
         update_requests_collection.update_one(
@@ -147,13 +210,17 @@ def get_pending_update_requests():
     """Get all pending profile update requests"""
     try:
         # Find all pending update requests
-        requests = update_requests_collection.find({"status": "pending"})
-        
+        requests = list(update_requests_collection.find({"status": "pending"}))
+
+        # Resolve every requesting user in one batch
+        loader = get_member_loader()
+        loader.prime(req['user_id'] for req in requests)
+
         # Convert ObjectId to string for JSON serialization
         result = []
         for req in requests:
             # Get user details
-            user = members_collection.find_one({"_id": ObjectId(req['user_id'])})
+            user = loader.load(req['user_id'])
             user_info = {"name": "Unknown", "email": "Unknown"} if not user else {
                 "name": user.get("name", "Unknown"),
                 "email": user.get("email", "Unknown")
@@ -161,12 +228,12 @@ def get_pending_update_requests():
             
             # Format the request
             formatted_req = {
-                "request_id": str(req["_id"]),
+                "request_id": req["_id"],
                 "user_id": req["user_id"],
                 "user_info": user_info,
                 "request_type": req["request_type"],
                 "requested_changes": req["requested_changes"],
-                "created_at": req["created_at"].isoformat() if isinstance(req["created_at"], datetime) else req["created_at"]
+                "created_at": req["created_at"]
             }
             result.append(formatted_req)
             
@@ -176,65 +243,34 @@ def get_pending_update_requests():
         raise Exception(f"Failed to get pending update requests: {str(e)}")
 
 # Guest-specific service methods
+def showcase_query(segment=None):
+    query = dict(PUBLIC_SHOWCASE_FILTER)
+    if segment is not None:
+        query["sector"] = segment
+    return query
+
+def _load_showcases(segment=None):
+    showcases = members_collection.find(showcase_query(segment), SHOWCASE_PROJECTION)
+    return list(showcases)
+
 def get_public_showcases():
     """Get public member showcases for guest viewing (verified members only)"""
     try:
-        # Get only verified/approved members with public information
-        showcases = members_collection.find(
-            {"verified": True, "public_profile": True},
-            {
-                "_id": 1,
-                "name": 1,
-                "company": 1,
-                "sector": 1,
-                "hierarchy": 1,
-                "description": 1,
-                "profile_image": 1,
-                "expertise": 1,
-                "location": 1,
-                "connections": 1
-                # Exclude private fields like email, phone, etc.
-            }
-        )
-        return [{**showcase, '_id': str(showcase['_id'])} for showcase in showcases]
+        return showcase_cache.get(ALL_SHOWCASES, _load_showcases)
     except Exception as e:
         raise Exception(f"Failed to get public showcases: {str(e)}")
 
-def get_business_segments():
-    """Get available business segments"""
+def get_business_segments(with_counts=False):
+    """Get business segments that have verified public members, optionally with member counts"""
     try:
-        # Get distinct sectors from verified members
-        segments = members_collection.distinct("sector", {"verified": True})
-        # Filter out None/empty values and return sorted list
-        segments = [segment for segment in segments if segment]
-        return sorted(segments)
+        key = f"{SEGMENTS}:counts" if with_counts else SEGMENTS
+        return showcase_cache.get(key, lambda: segment_service.list_segments(with_counts))
     except Exception as e:
         raise Exception(f"Failed to get business segments: {str(e)}")
 
 def get_showcases_by_segment(segment):
     """Get member showcases filtered by business segment"""
     try:
-        # Get verified members in the specified segment
-        showcases = members_collection.find(
-            {
-                "verified": True,
-                "public_profile": True,
-                "sector": segment
-            },
-            {
-                "_id": 1,
-                "name": 1,
-                "company": 1,
-                "sector": 1,
-                "hierarchy": 1,
-                "description": 1,
-                "profile_image": 1,
-                "expertise": 1,
-                "location": 1,
-                "connections": 1
-                # Exclude private fields
-            }
-        )
-        return [{**showcase, '_id': str(showcase['_id'])} for showcase in showcases]
+        return showcase_cache.get(segment_key(segment), lambda: _load_showcases(segment))
     except Exception as e:
-        raise Exception(f"Failed to get showcases by segment: {str(e)}")
\ No newline at end of file
+        raise Exception(f"Failed to get showcases by segment: {str(e)}")
@@ -1,21 +1,169 @@
 from backend.app.models.message import Message
-from backend.app.utils.database import messages_collection
+from backend.app.utils.database import messages_collection, unread_counters_collection
+from backend.app.utils.realtime import push_to_user
+from backend.app.utils.pagination import encode_cursor, decode_cursor, cursor_object_id, cursor_datetime, DEFAULT_PAGE_SIZE
+from bson import ObjectId
+from bson.errors import InvalidId
+from collections import defaultdict
+from datetime import datetime
+from pymongo import ReplaceOne
+
+CONVERSATION_SORT = [("created_at", -1), ("_id", -1)]
+
+def conversation_id_for(user1_id, user2_id):
+    """Canonical conversation key: the sorted pair of participant ids"""
+    return ':'.join(sorted([str(user1_id), str(user2_id)]))
 
 def send_message(data):
     new_message = Message(
+        conversation_id=conversation_id_for(data['sender_id'], data['receiver_id']),
         sender_id=data['sender_id'],
         receiver_id=data['receiver_id'],
         content=data['content'],
         status='sent'
     )
-    result = messages_collection.insert_one(new_message.dict(by_alias=True, exclude_none=True))
+    message_doc = new_message.to_db()
+    result = messages_collection.insert_one(message_doc)
+    _increment_unread(new_message.receiver_id, new_message.conversation_id, 1)
+
+    # Deliver to the receiver's open sockets as soon as the message is persisted
+    push_to_user(new_message.receiver_id, 'message', {
+        **message_doc,
+        '_id': str(result.inserted_id),
+        'created_at': new_message.created_at.isoformat()
+    })
     return {"message": "Message sent successfully", "message_id": str(result.inserted_id)}
 
-def get_conversation(user1_id, user2_id):
-    messages = messages_collection.find({
-        "$or": [
-            {"sender_id": user1_id, "receiver_id": user2_id},
-            {"sender_id": user2_id, "receiver_id": user1_id}
+def _increment_unread(user_id, conversation_id, amount):
+    """Atomically adjust a user's total and per-conversation unread counters"""
+    unread_counters_collection.update_one(
+        {"_id": user_id},
+        {"$inc": {"total": amount, f"conversations.{conversation_id}": amount}},
+        upsert=True
+    )
+
+def _decrement_unread(user_id, conversation_id, amount):
+    """
+    Atomically lower a user's total and per-conversation unread counters, never below
+    zero: messages stored before the counters existed were never counted
+    """
+    def floored(path):
+        return {"$max": [0, {"$subtract": [{"$ifNull": [path, 0]}, amount]}]}
+
+    unread_counters_collection.update_one(
+        {"_id": user_id},
+        [{"$set": {
+            "total": floored("$total"),
+            f"conversations.{conversation_id}": floored(f"$conversations.{conversation_id}")
+        }}]
+    )
+
+def rebuild_unread_counters():
+    """Recount every user's unread counters from the unread messages; used for backfills and to repair drift"""
+    counters = defaultdict(dict)
+    for row in messages_collection.aggregate([
+        {"$match": {"status": {"$ne": "read"}}},
+        {"$group": {
+            "_id": {"receiver_id": {"$toString": "$receiver_id"}, "conversation_id": "$conversation_id"},
+            "count": {"$sum": 1}
+        }}
+    ]):
+        counters[row['_id']['receiver_id']][row['_id']['conversation_id']] = row['count']
+    operations = [
+        ReplaceOne({"_id": user_id}, {"total": sum(conversations.values()), "conversations": conversations}, upsert=True)
+        for user_id, conversations in counters.items()
+    ]
+    if operations:
+        unread_counters_collection.bulk_write(operations, ordered=False)
+    unread_counters_collection.delete_many({"_id": {"$nin": list(counters)}})
+    return len(counters)
+
+def get_unread_counts(user_id):
+    """Get a user's unread message counters with a single document read"""
+    counters = unread_counters_collection.find_one({"_id": user_id}) or {}
+    return {
+        "unread_count": max(0, counters.get("total", 0)),
+        "conversations": {cid: count for cid, count in counters.get("conversations", {}).items() if count > 0}
+    }
+
+def mark_read_up_to(user_id, message_id):
+    """Mark every message received in a conversation up to and including message_id as read"""
+    try:
+        message = messages_collection.find_one({"_id": ObjectId(message_id)})
+    except InvalidId:
+        message = None
+    if not message or message['receiver_id'] != user_id:
+        return {"error": "Message not found"}, 404
+
+    conversation_id = conversation_id_for(message['sender_id'], message['receiver_id'])
+    result = messages_collection.update_many(
+        {
+            "conversation_id": conversation_id,
+            "receiver_id": user_id,
+            "created_at": {"$lte": message['created_at']},
+            "status": {"$ne": "read"}
+        },
+        {"$set": {"status": "read", "read_at": datetime.utcnow()}}
+    )
+    if result.modified_count:
+        _decrement_unread(user_id, conversation_id, result.modified_count)
+
+    return {"message": "Messages marked as read", "marked_read": result.modified_count}, 200
+
+def conversation_page_query(user1_id, user2_id, before=None):
+    """Build the filter for the conversation page before an opaque cursor"""
+    query = {"conversation_id": conversation_id_for(user1_id, user2_id)}
+    if before:
+        cursor = decode_cursor(before)
+        created_at = cursor_datetime(cursor)
+        query["$or"] = [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": cursor_object_id(cursor)}}
         ]
-    }).sort("created_at", 1)
-    return [{**message, '_id': str(message['_id'])} for message in messages]
\ No newline at end of file
+    return query
+
+def conversation_page_result(messages, limit):
+    """Shape one conversation page from up to limit + 1 messages sorted newest first"""
+    has_more = len(messages) > limit
+    messages = messages[:limit]
+
+    next_cursor = None
+    if has_more:
+        oldest = messages[-1]
+        next_cursor = encode_cursor({"created_at": oldest['created_at'].isoformat(), "id": str(oldest['_id'])})
+
+    # Return the page in chronological order
+    return {
+        "messages": messages[::-1],
+        "next_cursor": next_cursor
+    }
+
+def get_conversation(user1_id, user2_id, before=None, limit=DEFAULT_PAGE_SIZE):
+    """Get the latest messages of a conversation, paging backwards with an opaque cursor"""
+    # Fetch one extra message to know whether older messages exist
+    messages = list(
+        messages_collection.find(conversation_page_query(user1_id, user2_id, before))
+        .sort(CONVERSATION_SORT)
+        .limit(limit + 1)
+    )
+    return conversation_page_result(messages, limit)
+
+def backfill_conversation_ids():
+    """Set conversation_id on messages stored before it was introduced"""
+    # Legacy messages may store the ids as ObjectIds, which $concat rejects
+    sender, receiver = {"$toString": "$sender_id"}, {"$toString": "$receiver_id"}
+    result = messages_collection.update_many(
+        {"conversation_id": {"$exists": False}},
+        [{
+            "$set": {
+                "conversation_id": {
+                    "$cond": [
+                        {"$lt": [sender, receiver]},
+                        {"$concat": [sender, ":", receiver]},
+                        {"$concat": [receiver, ":", sender]}
+                    ]
+                }
+            }
+        }]
+    )
+    return result.modified_count
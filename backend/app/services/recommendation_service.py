@@ -0,0 +1,270 @@
+import logging
+import math
+from collections import Counter
+from datetime import datetime
+import numpy as np
+from pymongo import UpdateOne
+from backend.config import Config
+from backend.app.utils.database import (
+    members_collection, members_info_collection, ai_recommendations_collection, recommendation_runs_collection
+)
+from backend.app.utils.search_index import tokenize, normalize
+
+logger = logging.getLogger(__name__)
+
+# Documents written to ai_recommendations follow the AIRecommendation model, one per
+# recommended member: {user_id, recommendation_type, recommendation_data: {member_id,
+# shared}, confidence_score, created_at (when it was last computed), is_applied}
+SIMILAR = "similar_member"
+COMPLEMENTARY = "complementary_member"
+RECOMMENDATION_TYPES = (SIMILAR, COMPLEMENTARY)
+
+PROFILE_FIELDS = {"user_id": 1, "sector": 1, "hierarchy": 1, "title": 1, "expertise": 1, "updated_at": 1}
+FEATURE_WEIGHTS = {"sector": 1.0, "expertise": 1.0, "hierarchy": 0.5, "title": 0.5}
+MAX_SHARED_FEATURES = 5
+
+def profile_features(profile):
+    """The "field:value" features of a members_info document"""
+    features = set()
+    for field in ("sector", "hierarchy"):
+        value = normalize(profile.get(field))
+        if value:
+            features.add(f"{field}:{value}")
+    for item in profile.get('expertise') or []:
+        value = normalize(item)
+        if value:
+            features.add(f"expertise:{value}")
+    features.update(f"title:{token}" for token in tokenize(profile.get('title')))
+    return features
+
+def _inverse_norms(matrix):
+    norms = np.linalg.norm(matrix, axis=1)
+    norms[norms == 0] = np.inf
+    return (1 / norms).astype(np.float32)
+
+class ProfileMatrix:
+    """
+    Dense float32 encoding of member profiles.
+
+    Features shared by at least two members make up the vocabulary (capped at
+    max_features, most common first) and are weighted by field and idf. Similar
+    members are ranked by cosine similarity over every feature, complementary ones
+    by cosine similarity over expertise alone, across different sectors. Members
+    are kept ordered by sector so each sector is one contiguous range of columns.
+    """
+
+    def __init__(self, user_ids, features, max_features):
+        sector_of = [next((feature for feature in member_features if feature.startswith("sector:")), "")
+                     for member_features in features]
+        order = sorted(range(len(features)), key=lambda row: (sector_of[row], user_ids[row]))
+        self.user_ids = [user_ids[row] for row in order]
+        self.features = [features[row] for row in order]
+        self.rows = {user_id: row for row, user_id in enumerate(self.user_ids)}
+        size = len(self.user_ids)
+
+        counts = Counter(feature for member_features in self.features for feature in member_features)
+        vocabulary = [feature for feature, count in counts.most_common(max_features) if count > 1]
+        # Expertise columns first, so one product over them serves both kinds of score
+        vocabulary.sort(key=lambda feature: not feature.startswith("expertise:"))
+        columns = {feature: column for column, feature in enumerate(vocabulary)}
+        self.expertise_columns = sum(1 for feature in vocabulary if feature.startswith("expertise:"))
+        self.idf = {feature: math.log((1 + size) / (1 + counts[feature])) + 1 for feature in vocabulary}
+
+        rows, cols, values = [], [], []
+        for row, member_features in enumerate(self.features):
+            for feature in member_features:
+                column = columns.get(feature)
+                if column is not None:
+                    rows.append(row)
+                    cols.append(column)
+                    values.append(FEATURE_WEIGHTS[feature.split(":", 1)[0]] * self.idf[feature])
+        self.encoded = np.zeros((size, len(vocabulary)), dtype=np.float32)
+        self.encoded[rows, cols] = values
+        self.inverse_norms = _inverse_norms(self.encoded)
+        self.inverse_expertise_norms = _inverse_norms(self.encoded[:, :self.expertise_columns])
+
+        self.sector_ranges = {}
+        for row in range(size):
+            sector = sector_of[order[row]]
+            if sector:
+                start, _ = self.sector_ranges.get(sector, (row, row))
+                self.sector_ranges[sector] = (start, row + 1)
+        self.sector_starts = np.array([self.sector_ranges.get(sector_of[row], (0, 0))[0] for row in order], dtype=np.int64)
+        self.sector_ends = np.array([self.sector_ranges.get(sector_of[row], (0, 0))[1] for row in order], dtype=np.int64)
+
+    def __len__(self):
+        return len(self.user_ids)
+
+    def score_blocks(self, rows, chunk_size):
+        """
+        Yield (block rows, similar scores, complementary scores) for chunk_size rows
+        at a time against every member; a member is never scored against themselves.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        expertise, other = self.encoded[:, :self.expertise_columns], self.encoded[:, self.expertise_columns:]
+        for start in range(0, len(rows), chunk_size):
+            block = rows[start:start + chunk_size]
+            own = (np.arange(len(block)), block)
+            complementary = expertise[block] @ expertise.T
+            similar = complementary + other[block] @ other.T
+            similar *= self.inverse_norms[block, None]
+            similar *= self.inverse_norms[None, :]
+            similar[own] = -np.inf
+            complementary *= self.inverse_expertise_norms[block, None]
+            complementary *= self.inverse_expertise_norms[None, :]
+            for position, (sector_start, sector_end) in enumerate(zip(self.sector_starts[block], self.sector_ends[block])):
+                complementary[position, sector_start:sector_end] = -np.inf
+            complementary[own] = -np.inf
+            yield block, similar, complementary
+
+    def shared_features(self, row, other):
+        """The rarest features two members have in common"""
+        shared = self.features[row] & self.features[other]
+        return sorted(shared, key=lambda feature: (-self.idf.get(feature, 0), feature))[:MAX_SHARED_FEATURES]
+
+def top_k(scores, k):
+    """(columns, scores) of the k best entries in each row, best first"""
+    k = min(k, scores.shape[1])
+    if k == 0:
+        return np.empty((scores.shape[0], 0), dtype=np.int64), np.empty((scores.shape[0], 0), dtype=scores.dtype)
+    columns = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    best = np.take_along_axis(scores, columns, axis=1)
+    order = np.argsort(-best, axis=1)
+    return np.take_along_axis(columns, order, axis=1), np.take_along_axis(best, order, axis=1)
+
+def load_matrix():
+    """Encode the members_info profile of every member account"""
+    member_ids = {
+        str(member['_id'])
+        for member in members_collection.find({"user_type": {"$nin": ["admin", "guest"]}}, {"_id": 1})
+    }
+    profiles = {
+        profile['user_id']: profile
+        for profile in members_info_collection.find({}, PROFILE_FIELDS)
+        if profile.get('user_id') in member_ids
+    }
+    user_ids = sorted(profiles)
+    matrix = ProfileMatrix(
+        user_ids, [profile_features(profiles[user_id]) for user_id in user_ids], Config.RECOMMENDATION_MAX_FEATURES
+    )
+    return matrix, [profiles[user_id].get('updated_at') for user_id in user_ids]
+
+def _thresholds(matrix, k):
+    """Per type, the score a member must beat to enter each member's current top k"""
+    thresholds = {kind: np.zeros(len(matrix), dtype=np.float32) for kind in RECOMMENDATION_TYPES}
+    for group in ai_recommendations_collection.aggregate([
+        {"$match": {"recommendation_type": {"$in": list(RECOMMENDATION_TYPES)}}},
+        {"$group": {
+            "_id": {"user_id": "$user_id", "type": "$recommendation_type"},
+            "lowest": {"$min": "$confidence_score"},
+            "count": {"$sum": 1}
+        }}
+    ]):
+        row = matrix.rows.get(group['_id']['user_id'])
+        if row is not None and group['count'] >= k:
+            thresholds[group['_id']['type']][row] = group['lowest']
+    return thresholds
+
+def affected_rows(matrix, changed_rows, removed_ids, k, chunk_size):
+    """
+    Rows whose recommendations must be recomputed after the given members changed:
+    the changed members, members currently recommending a changed or removed
+    member, and members a changed member would now enter the top k of.
+    """
+    affected = set(int(row) for row in changed_rows)
+    stale_ids = [matrix.user_ids[row] for row in affected] + list(removed_ids)
+    if not stale_ids:
+        return affected
+    for recommendation in ai_recommendations_collection.find(
+        {"recommendation_type": {"$in": list(RECOMMENDATION_TYPES)}, "recommendation_data.member_id": {"$in": stale_ids}},
+        {"user_id": 1}
+    ):
+        row = matrix.rows.get(recommendation['user_id'])
+        if row is not None:
+            affected.add(row)
+    if changed_rows:
+        thresholds = _thresholds(matrix, k)
+        for _, similar, complementary in matrix.score_blocks(changed_rows, chunk_size):
+            affected.update(np.nonzero(similar.max(axis=0) > thresholds[SIMILAR])[0].tolist())
+            affected.update(np.nonzero(complementary.max(axis=0) > thresholds[COMPLEMENTARY])[0].tolist())
+    return affected
+
+def recommendation_operations(matrix, row, kind, columns, scores, computed_at):
+    user_id = matrix.user_ids[row]
+    for column, score in zip(columns.tolist(), scores.tolist()):
+        if not score > 0:
+            break
+        member_id = matrix.user_ids[column]
+        yield UpdateOne(
+            {"user_id": user_id, "recommendation_type": kind, "recommendation_data.member_id": member_id},
+            {
+                "$set": {
+                    "recommendation_data": {"member_id": member_id, "shared": matrix.shared_features(row, column)},
+                    "confidence_score": round(score, 4),
+                    "created_at": computed_at
+                },
+                "$setOnInsert": {"is_applied": False}
+            },
+            upsert=True
+        )
+
+def write_recommendations(matrix, rows, k, chunk_size, computed_at, progress=None):
+    """Compute and store the top k of each kind for rows, replacing what was stored for them"""
+    written = 0
+    for block, similar, complementary in matrix.score_blocks(sorted(rows), chunk_size):
+        operations = []
+        for kind, scores in ((SIMILAR, similar), (COMPLEMENTARY, complementary)):
+            best_columns, best_scores = top_k(scores, k)
+            for position, row in enumerate(block.tolist()):
+                operations.extend(recommendation_operations(
+                    matrix, row, kind, best_columns[position], best_scores[position], computed_at
+                ))
+        if operations:
+            ai_recommendations_collection.bulk_write(operations, ordered=False)
+        # Whatever was not rewritten in this run is no longer in the member's top k
+        ai_recommendations_collection.delete_many({
+            "user_id": {"$in": [matrix.user_ids[row] for row in block.tolist()]},
+            "recommendation_type": {"$in": list(RECOMMENDATION_TYPES)},
+            "created_at": {"$lt": computed_at}
+        })
+        written += len(operations)
+        if progress:
+            progress(len(block), len(rows))
+    return written
+
+def run(full=False, progress=None):
+    """
+    Recompute member recommendations. Without full, only members whose profile
+    changed since the last finished run, members without recommendations yet and
+    the members their change affects are recomputed. progress(done, total) is
+    called after every block.
+    """
+    started_at = datetime.utcnow()
+    last_run = None if full else recommendation_runs_collection.find_one(
+        {"finished_at": {"$ne": None}}, sort=[("started_at", -1)]
+    )
+    run_id = recommendation_runs_collection.insert_one({"started_at": started_at, "full": last_run is None}).inserted_id
+
+    matrix, updated_at = load_matrix()
+    k, chunk_size = Config.RECOMMENDATION_TOP_K, Config.RECOMMENDATION_CHUNK_SIZE
+    recommended_ids = set(ai_recommendations_collection.distinct(
+        "user_id", {"recommendation_type": {"$in": list(RECOMMENDATION_TYPES)}}
+    ))
+    removed_ids = recommended_ids - set(matrix.user_ids)
+    if last_run is None:
+        rows = set(range(len(matrix)))
+    else:
+        since = last_run['started_at']
+        changed_rows = [
+            row for row, user_id in enumerate(matrix.user_ids)
+            if user_id not in recommended_ids or (updated_at[row] is not None and updated_at[row] >= since)
+        ]
+        rows = affected_rows(matrix, changed_rows, removed_ids, k, chunk_size)
+    if removed_ids:
+        ai_recommendations_collection.delete_many({"user_id": {"$in": list(removed_ids)}})
+
+    written = write_recommendations(matrix, rows, k, chunk_size, started_at, progress)
+    stats = {"members": len(matrix), "recomputed": len(rows), "removed": len(removed_ids), "recommendations": written}
+    recommendation_runs_collection.update_one({"_id": run_id}, {"$set": {"finished_at": datetime.utcnow(), **stats}})
+    logger.info(f"Recommendations recomputed for {len(rows)} of {len(matrix)} members")
+    return stats
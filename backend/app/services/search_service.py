@@ -0,0 +1,126 @@
+import logging
+import threading
+from bson import ObjectId
+from backend.app.utils.database import members_collection, members_info_collection
+from backend.app.utils.search_index import member_index, member_suggestions
+from backend.app.utils.pagination import encode_cursor, decode_cursor, InvalidCursor, DEFAULT_PAGE_SIZE
+from backend.app.utils import change_versions
+
+logger = logging.getLogger(__name__)
+
+# Searchable text comes from members_info, falling back to the member document;
+# tier and verified only live on the member document
+SEARCH_MEMBER_FIELDS = {
+    "name": 1, "title": 1, "company": 1, "sector": 1, "expertise": 1,
+    "tier": 1, "verified": 1, "user_type": 1, "contact_info.company": 1, "connections": 1
+}
+SEARCH_INFO_FIELDS = {"user_id": 1, "name": 1, "title": 1, "company": 1, "sector": 1, "expertise": 1, "connections": 1}
+# Member fields whose change must be reflected in search results
+SEARCHABLE_FIELDS = set(SEARCH_MEMBER_FIELDS) - {"contact_info.company"} | {"contact_info"}
+SEARCH_COLLECTIONS = ("members", "members_info")
+SUGGEST_LIMIT = 8
+MAX_SUGGEST_LIMIT = 20
+
+_load_lock = threading.Lock()
+
+def search_document(member, info=None):
+    """Build the (id, fields, attrs, stored) entry for a member, or None when they are not searchable"""
+    if member is None or member.get('user_type', 'member') != 'member':
+        return None
+    info = info or {}
+    fields = {name: info.get(name) or member.get(name) for name in ("name", "title", "company", "sector", "expertise")}
+    if not fields['company']:
+        fields['company'] = (member.get('contact_info') or {}).get('company')
+    attrs = {"tier": member.get('tier'), "sector": fields['sector'], "verified": bool(member.get('verified'))}
+    member_id = str(member['_id'])
+    return member_id, fields, attrs, {"_id": member_id, **fields, "tier": attrs['tier'], "verified": attrs['verified']}
+
+def suggest_document(member, info=None):
+    """Build the (id, phrases, weight, stored) typeahead entry for a member, or None when they are not searchable"""
+    document = search_document(member, info)
+    if document is None:
+        return None
+    member_id, fields, _, _ = document
+    connections = (info or {}).get('connections') or member.get('connections') or 0
+    stored = {"_id": member_id, "name": fields['name'], "company": fields['company'], "connections": connections}
+    return member_id, (fields['name'], fields['company']), connections, stored
+
+def _version_numbers():
+    return {name: version for name, (version, _) in change_versions.current_versions(SEARCH_COLLECTIONS).items()}
+
+def load_index():
+    """Rebuild the search and typeahead indexes from MongoDB"""
+    # Read the versions first so writes made during the load trigger another sync
+    versions = _version_numbers()
+    infos = {info['user_id']: info for info in members_info_collection.find({}, SEARCH_INFO_FIELDS)}
+    pairs = [
+        (member, infos.get(str(member['_id'])))
+        for member in members_collection.find({}, SEARCH_MEMBER_FIELDS)
+    ]
+    member_suggestions.replace_all(filter(None, (suggest_document(*pair) for pair in pairs)))
+    member_index.replace_all([document for document in (search_document(*pair) for pair in pairs) if document], versions)
+    return len(member_index)
+
+def sync():
+    """Rebuild when another process changed members or members_info since the last load"""
+    if not member_index.loaded or _version_numbers() != member_index.versions:
+        load_index()
+
+def ensure_loaded():
+    if not member_index.loaded:
+        with _load_lock:
+            if not member_index.loaded:
+                load_index()
+    member_index.ensure_sync_thread(sync)
+
+def refresh_member(user_id):
+    """Re-index one member after a write; an index that is not loaded yet will pick the change up when it is"""
+    if not member_index.loaded:
+        return
+    try:
+        member = members_collection.find_one({"_id": ObjectId(user_id)}, SEARCH_MEMBER_FIELDS)
+        info = members_info_collection.find_one({"user_id": str(user_id)}, SEARCH_INFO_FIELDS)
+        document, suggestion = search_document(member, info), suggest_document(member, info)
+        if document:
+            member_index.upsert(*document)
+            member_suggestions.upsert(*suggestion)
+        else:
+            remove_member(user_id)
+    except Exception as e:
+        # The write itself succeeded; the background sync repairs the index
+        logger.warning(f"Failed to refresh search entry for member {user_id}: {e}")
+
+def remove_member(user_id):
+    member_index.remove(str(user_id))
+    member_suggestions.remove(str(user_id))
+
+def warm():
+    """Load the indexes ahead of the first request; failures are left to the lazy load"""
+    try:
+        if not member_index.loaded:
+            load_index()
+    except Exception as e:
+        logger.warning(f"Failed to load the search index at startup: {e}")
+
+def search_members(query, tier=None, sector=None, verified=None, after=None, limit=DEFAULT_PAGE_SIZE):
+    """Rank members by BM25 relevance to query, with an opaque cursor for the next page"""
+    offset = 0
+    if after:
+        offset = decode_cursor(after).get('offset')
+        if not isinstance(offset, int) or offset < 0:
+            raise InvalidCursor("Invalid cursor")
+    ensure_loaded()
+    total, hits = member_index.search(
+        query, {"tier": tier, "sector": sector, "verified": verified}, offset=offset, limit=limit
+    )
+    next_offset = offset + limit
+    return {
+        "results": [{**stored, "score": round(score, 4)} for _, score, stored in hits],
+        "total": total,
+        "next_cursor": encode_cursor({"offset": next_offset}) if next_offset < total else None
+    }
+
+def suggest_members(prefix, limit=SUGGEST_LIMIT):
+    """Most connected members whose name or company has a word starting with prefix"""
+    ensure_loaded()
+    return member_suggestions.suggest(prefix, limit)
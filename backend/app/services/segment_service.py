@@ -0,0 +1,59 @@
+from datetime import datetime
+from pymongo import UpdateOne
+from backend.app.utils.database import members_collection, segments_collection
+from backend.app.utils import change_versions
+
+# The segments collection holds one document per sector:
+# {_id: sector, count: verified public members, updated_at}
+SEGMENT_MEMBER_FIELDS = {"sector": 1, "verified": 1, "public_profile": 1}
+
+def counted_segment(member):
+    """The sector a member counts toward, or None when they are not a verified public member"""
+    if not member or not (member.get('verified') and member.get('public_profile')):
+        return None
+    return member.get('sector') or None
+
+def apply_member_change(before, after):
+    """Move a member's contribution from their old segment to their new one"""
+    old_segment, new_segment = counted_segment(before), counted_segment(after)
+    if old_segment == new_segment:
+        return False
+    now = datetime.utcnow()
+    operations = []
+    if old_segment:
+        operations.append(UpdateOne({"_id": old_segment}, {"$inc": {"count": -1}, "$set": {"updated_at": now}}))
+    if new_segment:
+        operations.append(UpdateOne({"_id": new_segment}, {"$inc": {"count": 1}, "$set": {"updated_at": now}}, upsert=True))
+    segments_collection.bulk_write(operations, ordered=False)
+    change_versions.bump("segments")
+    return True
+
+def list_segments(with_counts=False):
+    """Sorted segment names, or {segment, count, updated_at} entries, for sectors with members"""
+    segments = segments_collection.find({"count": {"$gt": 0}}).sort("_id", 1)
+    if not with_counts:
+        return [segment['_id'] for segment in segments]
+    return [
+        {"segment": segment['_id'], "count": segment['count'], "updated_at": segment.get('updated_at')}
+        for segment in segments
+    ]
+
+def rebuild_segments():
+    """Recount every segment from the members collection; used for backfills and to repair drift"""
+    counts = {
+        row['_id']: row['count']
+        for row in members_collection.aggregate([
+            {"$match": {"verified": True, "public_profile": True, "sector": {"$nin": [None, ""]}}},
+            {"$group": {"_id": "$sector", "count": {"$sum": 1}}}
+        ])
+    }
+    now = datetime.utcnow()
+    operations = [
+        UpdateOne({"_id": sector}, {"$set": {"count": count, "updated_at": now}}, upsert=True)
+        for sector, count in counts.items()
+    ]
+    if operations:
+        segments_collection.bulk_write(operations, ordered=False)
+    segments_collection.delete_many({"_id": {"$nin": list(counts)}})
+    change_versions.bump("segments")
+    return counts
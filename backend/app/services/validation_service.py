@@ -14,7 +14,7 @@ def submit_new_deal(user_id: str, deal_data: dict):
         request_type='new_deal',
         data=deal_data
     )
-    validate_values_collection.insert_one(validation_request.dict(by_alias=True))
+    validate_values_collection.insert_one(validation_request.to_db())
     return {"message": "New deal submission received and is pending approval.", "deal_id": deal_id}, 200
 
 def submit_update_deal(user_id: str, deal_id: str, update_data: dict):
@@ -29,12 +29,12 @@ def submit_update_deal(user_id: str, deal_id: str, update_data: dict):
         request_type='update_deal',
         data=update_data
     )
-    validate_values_collection.insert_one(validation_request.dict(by_alias=True))
+    validate_values_collection.insert_one(validation_request.to_db())
     return {"message": "Deal update submission received and is pending approval."}, 200
 
 def get_pending_requests():
     requests = validate_values_collection.find({"status": "pending"})
-    return [{**req, '_id': str(req['_id'])} for req in requests], 200
+    return list(requests), 200
 
 def approve_request(request_id: str):
     request = validate_values_collection.find_one({"_id": ObjectId(request_id)})
@@ -51,7 +51,7 @@ def approve_request(request_id: str):
         deal = Deal(**data)
         members_info_collection.update_one(
             {"user_id": user_id},
-            {"$push": {"deals": deal.dict()}}
+            {"$push": {"deals": deal.to_db()}}
         )
     elif request['request_type'] == 'update_deal':
         deal_id = data['deal_id']
@@ -1,8 +1,11 @@
 from backend.app.utils.database import value_requests_collection, members_collection
 from backend.app.models.value_request import RequestType, RequestStatus
+from backend.app.utils.member_loader import get_member_loader
+from backend.app.utils import change_versions
+from backend.app.utils.pagination import encode_cursor, decode_cursor, cursor_object_id, cursor_datetime, InvalidCursor
 from bson import ObjectId
 from datetime import datetime
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 def create_request(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
     """Create a new value request"""
@@ -18,7 +21,7 @@ def create_request(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
             return {"error": "Invalid request type"}, 400
         
         # Validate that member exists
-        member = members_collection.find_one({"_id": ObjectId(data['member_id'])})
+        member = get_member_loader().load(data['member_id'])
         if not member:
             return {"error": "Member not found"}, 404
         
@@ -78,6 +81,7 @@ def create_request(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
         result = value_requests_collection.insert_one(request_doc)
         
         if result.inserted_id:
+            change_versions.bump("value_requests")
             return {
                 "message": "Value request submitted successfully",
                 "request_id": str(result.inserted_id)
@@ -88,70 +92,104 @@ def create_request(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
     except Exception as e:
         return {"error": f"Failed to create value request: {str(e)}"}, 500
 
-def get_all_requests() -> Tuple[Dict[str, Any], int]:
+def _format_listed_request(req: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a value request document joined with its member's name"""
+    member = req['member'][0] if req.get('member') else None
+    return {
+        "_id": req['_id'],
+        "member_id": req['member_id'],
+        "member_name": member.get('name', 'Unknown') if member else 'Unknown',
+        "request_type": req['request_type'],
+        "current_deal_count": req.get('current_deal_count'),
+        "requested_deal_count": req.get('requested_deal_count'),
+        "current_deal_value": req.get('current_deal_value'),
+        "requested_deal_value": req.get('requested_deal_value'),
+        "justification": req['justification'],
+        "verified": req['verified'],
+        "status": req['status'],
+        "admin_notes": req.get('admin_notes'),
+        "created_at": req['created_at'],
+        "updated_at": req['updated_at'],
+        "verified_at": req.get('verified_at'),
+        "verified_by": req.get('verified_by')
+    }
+
+# Fields returned by the pending requests listing
+PENDING_FIELDS = (
+    "_id", "member_id", "member_name", "request_type",
+    "current_deal_count", "requested_deal_count",
+    "current_deal_value", "requested_deal_value",
+    "justification", "created_at", "updated_at"
+)
+
+def request_listing_pipeline(match: Dict[str, Any], after: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Build the aggregation listing value requests newest first with their member names"""
+    if after:
+        cursor = decode_cursor(after)
+        created_at = cursor_datetime(cursor)
+        last_id = cursor_object_id(cursor)
+        match = {
+            **match,
+            "$or": [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "_id": {"$lt": last_id}}
+            ]
+        }
+
+    pipeline = [
+        {"$match": match},
+        {"$sort": {"created_at": -1, "_id": -1}}
+    ]
+    if limit:
+        # Fetch one extra document to know whether another page exists
+        pipeline.append({"$limit": limit + 1})
+    pipeline.append({
+        "$lookup": {
+            "from": members_collection.name,
+            "localField": "member_id",
+            "foreignField": "_id",
+            "pipeline": [{"$project": {"_id": 0, "name": 1}}],
+            "as": "member"
+        }
+    })
+    return pipeline
+
+def request_listing_result(requests: List[Dict[str, Any]], limit: Optional[int] = None, fields: Optional[tuple] = None) -> Dict[str, Any]:
+    """Shape the documents returned by request_listing_pipeline"""
+    result = {}
+    if limit:
+        has_more = len(requests) > limit
+        requests = requests[:limit]
+        last = requests[-1] if has_more else None
+        result["next_cursor"] = encode_cursor({
+            "created_at": last['created_at'].isoformat(),
+            "id": str(last['_id'])
+        }) if last else None
+
+    formatted = [_format_listed_request(req) for req in requests]
+    if fields:
+        formatted = [{field: req[field] for field in fields} for req in formatted]
+    result["requests"] = formatted
+    return result
+
+def get_all_requests(after: Optional[str] = None, limit: Optional[int] = None) -> Tuple[Dict[str, Any], int]:
     """Get all value requests for admin review"""
     try:
-        requests = value_requests_collection.find().sort("created_at", -1)
-        request_list = []
-        
-        for req in requests:
-            # Get member info
-            member = members_collection.find_one({"_id": req['member_id']})
-            member_name = member.get('name', 'Unknown') if member else 'Unknown'
-            
-            request_data = {
-                "_id": str(req['_id']),
-                "member_id": str(req['member_id']),
-                "member_name": member_name,
-                "request_type": req['request_type'],
-                "current_deal_count": req.get('current_deal_count'),
-                "requested_deal_count": req.get('requested_deal_count'),
-                "current_deal_value": req.get('current_deal_value'),
-                "requested_deal_value": req.get('requested_deal_value'),
-                "justification": req['justification'],
-                "verified": req['verified'],
-                "status": req['status'],
-                "admin_notes": req.get('admin_notes'),
-                "created_at": req['created_at'].isoformat(),
-                "updated_at": req['updated_at'].isoformat(),
-                "verified_at": req['verified_at'].isoformat() if req.get('verified_at') else None,
-                "verified_by": str(req['verified_by']) if req.get('verified_by') else None
-            }
-            request_list.append(request_data)
-        
-        return {"requests": request_list}, 200
-        
+        requests = list(value_requests_collection.aggregate(request_listing_pipeline({}, after, limit)))
+        return request_listing_result(requests, limit), 200
+    except InvalidCursor as e:
+        return {"error": str(e)}, 400
     except Exception as e:
         return {"error": f"Failed to retrieve requests: {str(e)}"}, 500
 
-def get_pending_requests() -> Tuple[Dict[str, Any], int]:
+def get_pending_requests(after: Optional[str] = None, limit: Optional[int] = None) -> Tuple[Dict[str, Any], int]:
     """Get all pending value requests"""
     try:
-        requests = value_requests_collection.find({"status": RequestStatus.PENDING.value}).sort("created_at", -1)
-        request_list = []
-        
-        for req in requests:
-            # Get member info
-            member = members_collection.find_one({"_id": req['member_id']})
-            member_name = member.get('name', 'Unknown') if member else 'Unknown'
-            
-            request_data = {
-                "_id": str(req['_id']),
-                "member_id": str(req['member_id']),
-                "member_name": member_name,
-                "request_type": req['request_type'],
-                "current_deal_count": req.get('current_deal_count'),
-                "requested_deal_count": req.get('requested_deal_count'),
-                "current_deal_value": req.get('current_deal_value'),
-                "requested_deal_value": req.get('requested_deal_value'),
-                "justification": req['justification'],
-                "created_at": req['created_at'].isoformat(),
-                "updated_at": req['updated_at'].isoformat()
-            }
-            request_list.append(request_data)
-        
-        return {"requests": request_list}, 200
-        
+        pipeline = request_listing_pipeline({"status": RequestStatus.PENDING.value}, after, limit)
+        requests = list(value_requests_collection.aggregate(pipeline))
+        return request_listing_result(requests, limit, PENDING_FIELDS), 200
+    except InvalidCursor as e:
+        return {"error": str(e)}, 400
     except Exception as e:
         return {"error": f"Failed to retrieve pending requests: {str(e)}"}, 500
 
@@ -189,6 +227,7 @@ def verify_request(request_id: str, data: Dict[str, Any]) -> Tuple[Dict[str, Any
         
         if result.matched_count == 0:
             return {"error": "Request not found"}, 404
+        change_versions.bump("value_requests")
         
         # If approved, update member's profile
         if data['verified']:
@@ -204,6 +243,8 @@ def verify_request(request_id: str, data: Dict[str, Any]) -> Tuple[Dict[str, Any
                     {"_id": request_doc['member_id']},
                     {"$set": member_update}
                 )
+                get_member_loader().clear(request_doc['member_id'])
+                change_versions.bump("members")
         
         status_text = "approved" if data['verified'] else "rejected"
         return {"message": f"Request {status_text} successfully"}, 200
@@ -219,7 +260,7 @@ def get_member_requests(member_id: str) -> Tuple[Dict[str, Any], int]:
         
         for req in requests:
             request_data = {
-                "_id": str(req['_id']),
+                "_id": req['_id'],
                 "request_type": req['request_type'],
                 "current_deal_count": req.get('current_deal_count'),
                 "requested_deal_count": req.get('requested_deal_count'),
@@ -229,9 +270,9 @@ def get_member_requests(member_id: str) -> Tuple[Dict[str, Any], int]:
                 "verified": req['verified'],
                 "status": req['status'],
                 "admin_notes": req.get('admin_notes'),
-                "created_at": req['created_at'].isoformat(),
-                "updated_at": req['updated_at'].isoformat(),
-                "verified_at": req['verified_at'].isoformat() if req.get('verified_at') else None
+                "created_at": req['created_at'],
+                "updated_at": req['updated_at'],
+                "verified_at": req.get('verified_at')
             }
             request_list.append(request_data)
         
@@ -254,12 +295,12 @@ def get_request_details(request_id: str, user_id: str, user_type: str) -> Tuple[
         # Get member info if admin
         member_name = None
         if user_type == 'admin':
-            member = members_collection.find_one({"_id": request_doc['member_id']})
+            member = get_member_loader().load(request_doc['member_id'])
             member_name = member.get('name', 'Unknown') if member else 'Unknown'
         
         request_data = {
-            "_id": str(request_doc['_id']),
-            "member_id": str(request_doc['member_id']),
+            "_id": request_doc['_id'],
+            "member_id": request_doc['member_id'],
             "request_type": request_doc['request_type'],
             "current_deal_count": request_doc.get('current_deal_count'),
             "requested_deal_count": request_doc.get('requested_deal_count'),
@@ -269,10 +310,10 @@ def get_request_details(request_id: str, user_id: str, user_type: str) -> Tuple[
             "verified": request_doc['verified'],
             "status": request_doc['status'],
             "admin_notes": request_doc.get('admin_notes'),
-            "created_at": request_doc['created_at'].isoformat(),
-            "updated_at": request_doc['updated_at'].isoformat(),
-            "verified_at": request_doc['verified_at'].isoformat() if request_doc.get('verified_at') else None,
-            "verified_by": str(request_doc['verified_by']) if request_doc.get('verified_by') else None
+            "created_at": request_doc['created_at'],
+            "updated_at": request_doc['updated_at'],
+            "verified_at": request_doc.get('verified_at'),
+            "verified_by": request_doc.get('verified_by')
         }
         
         if member_name:
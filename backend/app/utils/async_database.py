@@ -0,0 +1,15 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+from backend.app.utils.database import DATABASE_NAME, client_options, pool_listener
+from backend.config import Config
+
+_client = None
+
+def get_async_client():
+    """Get the process-wide Motor client, created on first use inside the running event loop"""
+    global _client
+    if _client is None:
+        _client = AsyncIOMotorClient(Config.MONGO_URI, event_listeners=[pool_listener("motor")], **client_options())
+    return _client
+
+def get_async_collection(name):
+    return get_async_client().get_database(DATABASE_NAME).get_collection(name)
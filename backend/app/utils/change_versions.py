@@ -0,0 +1,81 @@
+import hashlib
+import logging
+from datetime import timezone
+from functools import wraps
+from flask import request, make_response
+from pymongo import UpdateOne
+from werkzeug.http import parse_date, parse_etags
+from backend.app.utils import database
+
+logger = logging.getLogger(__name__)
+
+# collection_versions holds one document per collection:
+# {_id: collection name, version: int, updated_at: datetime}. Services bump it
+# after every write, and read endpoints derive their ETag and Last-Modified from it.
+
+def bump(*collection_names):
+    """Record that the given collections changed"""
+    try:
+        database.collection_versions_collection.bulk_write([
+            UpdateOne({"_id": name}, {"$inc": {"version": 1}, "$currentDate": {"updated_at": True}}, upsert=True)
+            for name in collection_names
+        ], ordered=False)
+    except Exception as e:
+        # The write itself succeeded; clients will revalidate on the next bump
+        logger.warning(f"Failed to bump change version of {', '.join(collection_names)}: {e}")
+
+def versions_result(docs, collection_names):
+    """Map each collection to (version, updated_at), defaulting to (0, None) for never-written ones"""
+    found = {doc['_id']: (doc.get('version', 0), doc.get('updated_at')) for doc in docs}
+    return {name: found.get(name, (0, None)) for name in collection_names}
+
+def current_versions(collection_names):
+    docs = database.collection_versions_collection.find({"_id": {"$in": list(collection_names)}})
+    return versions_result(docs, collection_names)
+
+def validators(versions, key):
+    """Build (etag, last_modified) for a response identified by key from the collections' versions"""
+    fingerprint = key + "|" + "|".join(f"{name}:{version}" for name, (version, _) in sorted(versions.items()))
+    etag = hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()[:32]
+    modified = [updated_at for _, updated_at in versions.values() if updated_at is not None]
+    last_modified = max(modified).replace(tzinfo=timezone.utc, microsecond=0) if modified else None
+    return etag, last_modified
+
+def not_modified(etag, last_modified, if_none_match, if_modified_since):
+    """Evaluate conditional request headers; If-None-Match wins over If-Modified-Since"""
+    if if_none_match:
+        return parse_etags(if_none_match).contains_weak(etag)
+    if if_modified_since and last_modified is not None:
+        since = parse_date(if_modified_since)
+        return since is not None and last_modified <= since.replace(tzinfo=timezone.utc)
+    return False
+
+def conditional_get(*collection_names, per_user=False, on_versions=None):
+    """
+    Answer GET requests with 304 Not Modified, without running the view, when none of the
+    collections changed since the client's copy. Place below token_required.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(current_user, *args, **kwargs):
+            versions = current_versions(collection_names)
+            if on_versions is not None:
+                on_versions(versions)
+            key = request.full_path
+            if per_user:
+                key += "|" + current_user['public_id']
+            etag, last_modified = validators(versions, key)
+            if not_modified(etag, last_modified, request.headers.get('If-None-Match'),
+                            request.headers.get('If-Modified-Since')):
+                response = make_response('', 304)
+            else:
+                response = make_response(f(current_user, *args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return decorated
+    return decorator
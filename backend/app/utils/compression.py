@@ -0,0 +1,175 @@
+import zlib
+from werkzeug.datastructures import Accept
+from werkzeug.http import parse_accept_header
+from backend.config import Config
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; without it only gzip is offered
+    brotli = None
+
+COMPRESSIBLE_TYPES = {
+    "application/json", "application/x-ndjson", "application/javascript",
+    "application/xml", "image/svg+xml"
+}
+
+def supported_encodings():
+    """Configured encodings in order of preference, limited to what is installed"""
+    return [encoding for encoding in Config.COMPRESS_ALGORITHMS if encoding == "gzip" or (encoding == "br" and brotli)]
+
+def negotiate(accept_encoding):
+    """Pick an encoding from an Accept-Encoding header, or None to send the body as is"""
+    encodings = supported_encodings()
+    if not accept_encoding or not encodings:
+        return None
+    return parse_accept_header(accept_encoding, Accept).best_match(encodings)
+
+def compressible(content_type):
+    if not content_type:
+        return False
+    mimetype = content_type.split(";")[0].strip().lower()
+    return mimetype.startswith("text/") or mimetype in COMPRESSIBLE_TYPES
+
+class Compressor:
+    """Incremental gzip or brotli compressor with periodic flushes so streamed bodies keep moving"""
+
+    def __init__(self, encoding):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=Config.COMPRESS_BROTLI_QUALITY)
+        else:
+            # wbits 31 writes a gzip header and trailer
+            self._compressor = zlib.compressobj(Config.COMPRESS_LEVEL, zlib.DEFLATED, 31)
+        self._unflushed = 0
+
+    def compress(self, chunk):
+        if self.encoding == "br":
+            data = self._compressor.process(chunk)
+        else:
+            data = self._compressor.compress(chunk)
+        self._unflushed += len(chunk)
+        if self._unflushed >= Config.COMPRESS_STREAM_FLUSH_BYTES:
+            data += self.flush()
+        return data
+
+    def flush(self):
+        self._unflushed = 0
+        if self.encoding == "br":
+            return self._compressor.flush()
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush(zlib.Z_FINISH)
+
+def compress(data, encoding):
+    """Compress a complete body in one call"""
+    if encoding == "br":
+        return brotli.compress(data, quality=Config.COMPRESS_BROTLI_QUALITY)
+    compressor = zlib.compressobj(Config.COMPRESS_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+def _compress_stream(chunks, encoding):
+    compressor = Compressor(encoding)
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.finish()
+    finally:
+        if hasattr(chunks, "close"):
+            chunks.close()
+
+def compress_response(response, accept_encoding):
+    """Compress a Flask response in place when the client accepts it and it is worth it"""
+    response.vary.add("Accept-Encoding")
+    if (response.status_code < 200 or response.status_code in (204, 304)
+            or "Content-Encoding" in response.headers
+            or response.direct_passthrough
+            or not compressible(response.content_type)):
+        return response
+    encoding = negotiate(accept_encoding)
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = _compress_stream(response.response, encoding)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < Config.COMPRESS_MIN_SIZE:
+            return response
+        response.set_data(compress(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+def init_app(app):
+    """Compress every Flask response through an after_request hook"""
+    from flask import request
+
+    @app.after_request
+    def compress_after_request(response):
+        return compress_response(response, request.headers.get("Accept-Encoding"))
+
+class AsgiCompressionMiddleware:
+    """ASGI counterpart of init_app for routes served outside Flask; already encoded responses pass through"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        accept_encoding = next(
+            (value.decode("latin-1") for name, value in scope["headers"] if name == b"accept-encoding"), None
+        )
+        encoding = negotiate(accept_encoding)
+        start = None
+        compressor = None
+
+        async def send_compressed(message):
+            nonlocal start, compressor
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                return await send(message)
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                headers = [(name, value) for name, value in start["headers"]]
+                names = {name.lower() for name, _ in headers}
+                content_type = next((value.decode("latin-1") for name, value in headers if name.lower() == b"content-type"), None)
+                if (encoding is None or b"content-encoding" in names or start["status"] in (204, 304)
+                        or not compressible(content_type)
+                        or (not more_body and len(body) < Config.COMPRESS_MIN_SIZE)):
+                    if encoding is not None and b"vary" not in names:
+                        headers.append((b"vary", b"Accept-Encoding"))
+                    await send({**start, "headers": headers})
+                    start = None
+                    return await send(message)
+                headers = [(name, value) for name, value in headers if name.lower() != b"content-length"]
+                headers += [(b"content-encoding", encoding.encode("latin-1")), (b"vary", b"Accept-Encoding")]
+                if not more_body:
+                    body = compress(body, encoding)
+                    headers.append((b"content-length", str(len(body)).encode("latin-1")))
+                    await send({**start, "headers": headers})
+                    start = None
+                    return await send({"type": "http.response.body", "body": body})
+                compressor = Compressor(encoding)
+                await send({**start, "headers": headers})
+                start = None
+
+            if compressor is None:
+                return await send(message)
+            data = compressor.compress(body)
+            if not more_body:
+                data += compressor.finish()
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
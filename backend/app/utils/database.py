@@ -1,14 +1,151 @@
-from pymongo import MongoClient
-from config import Config
-
-client = MongoClient(Config.MONGO_URI)
-db = client.get_database("Cluster0-Members-book")
-
-members_collection = db.get_collection("members")
-messages_collection = db.get_collection("messages")
-ai_recommendations_collection = db.get_collection("ai_recommendations")
-forms_collection = db.get_collection("forms")
-members_info_collection = db.get_collection("members_info")
-validate_values_collection = db.get_collection("validate_values")
-update_requests_collection = db.get_collection("update_requests")
-value_requests_collection = db.get_collection("value_requests")
\ No newline at end of file
+import os
+import threading
+from pymongo import MongoClient, monitoring
+from backend.config import Config
+
+DATABASE_NAME = "Cluster0-Members-book"
+
+def client_options():
+    """MongoClient keyword arguments built from Config"""
+    options = {
+        "maxPoolSize": Config.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": Config.MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": Config.MONGO_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": Config.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": Config.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": Config.MONGO_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": Config.MONGO_SOCKET_TIMEOUT_MS,
+    }
+    if Config.MONGO_COMPRESSORS:
+        options["compressors"] = Config.MONGO_COMPRESSORS
+    return {key: value for key, value in options.items() if value is not None}
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """Counts connection pool events for the client it is registered on"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {
+            "connections_created": 0,
+            "connections_closed": 0,
+            "checked_out": 0,
+            "checkout_failed": 0,
+            "pools_cleared": 0,
+        }
+
+    def _bump(self, counter, amount=1):
+        with self._lock:
+            self.counters[counter] += amount
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._bump("pools_cleared")
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._bump("connections_created")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._bump("connections_closed")
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self._bump("checkout_failed")
+
+    def connection_checked_out(self, event):
+        self._bump("checked_out")
+
+    def connection_checked_in(self, event):
+        self._bump("checked_out", -1)
+
+_lock = threading.Lock()
+_client = None
+_client_pid = None
+_pool_listeners = {}  # client name -> PoolStatsListener, for every client this process created
+
+def pool_listener(name):
+    """A fresh listener for one of this process's clients, reported by pool_stats under name"""
+    listener = PoolStatsListener()
+    _pool_listeners[name] = listener
+    return listener
+
+def get_client():
+    """Get this process's MongoClient, creating it on first use and again after a fork"""
+    global _client, _client_pid
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _lock:
+            if _client is None or _client_pid != pid:
+                _client = MongoClient(Config.MONGO_URI, event_listeners=[pool_listener("pymongo")], **client_options())
+                _client_pid = pid
+    return _client
+
+def reset_client():
+    """Drop this process's client reference; a client inherited across fork must never be used"""
+    global _client, _client_pid
+    _client = None
+    _client_pid = None
+    _pool_listeners.pop("pymongo", None)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_client)
+
+def get_db():
+    return get_client().get_database(DATABASE_NAME)
+
+def pool_stats():
+    """Connection pool statistics for this process: totals over every client, then per client"""
+    clients = {name: dict(listener.counters) for name, listener in _pool_listeners.items()}
+    stats = {
+        "pid": os.getpid(),
+        "client_created": bool(clients),
+        "options": client_options(),
+    }
+    for counters in clients.values():
+        for counter, value in counters.items():
+            stats[counter] = stats.get(counter, 0) + value
+    stats["clients"] = clients
+    return stats
+
+class _LazyCollection:
+    """Stand-in for a collection that resolves against the current process's client on each use"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __getattr__(self, attr):
+        return getattr(get_db().get_collection(self.name), attr)
+
+class _LazyDatabase:
+    def __getattr__(self, attr):
+        return getattr(get_db(), attr)
+
+db = _LazyDatabase()
+
+members_collection = _LazyCollection("members")
+messages_collection = _LazyCollection("messages")
+ai_recommendations_collection = _LazyCollection("ai_recommendations")
+forms_collection = _LazyCollection("forms")
+members_info_collection = _LazyCollection("members_info")
+validate_values_collection = _LazyCollection("validate_values")
+update_requests_collection = _LazyCollection("update_requests")
+value_requests_collection = _LazyCollection("value_requests")
+unread_counters_collection = _LazyCollection("unread_counters")
+refresh_tokens_collection = _LazyCollection("refresh_tokens")
+revoked_tokens_collection = _LazyCollection("revoked_tokens")
+segments_collection = _LazyCollection("segments")
+collection_versions_collection = _LazyCollection("collection_versions")
+recommendation_runs_collection = _LazyCollection("recommendation_runs")
+description_jobs_collection = _LazyCollection("description_jobs")
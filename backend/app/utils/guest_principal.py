@@ -0,0 +1,45 @@
+import threading
+import time
+from backend.config import Config
+from backend.app.utils import database
+
+GUEST_EMAIL = "guest@test.com"
+
+class GuestPrincipal:
+    """The guest account's id, resolved once per process and reloaded after a TTL or an admin change"""
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._guest_id = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def _fresh(self):
+        return self._guest_id is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    def get(self):
+        """Return the guest id, or None when no guest account exists"""
+        if self._fresh():
+            return self._guest_id
+        with self._lock:
+            if not self._fresh():
+                guest = database.members_collection.find_one(
+                    {"email": GUEST_EMAIL, "user_type": "guest"}, {"_id": 1}
+                )
+                self.loads += 1
+                # A missing guest account is not cached so seeding it takes effect at once
+                self.prime(str(guest['_id']) if guest else None)
+            return self._guest_id
+
+    def prime(self, guest_id):
+        self._guest_id = guest_id
+        self._loaded_at = time.monotonic()
+
+    def is_guest(self, user):
+        return user.get('user_type') == 'guest' or user.get('email') == GUEST_EMAIL
+
+    def invalidate(self):
+        self._guest_id = None
+
+guest_principal = GuestPrincipal(Config.GUEST_PRINCIPAL_TTL_SECONDS)
@@ -0,0 +1,131 @@
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+# Every index the services rely on, keyed by collection name
+INDEXES = {
+    "members": [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        IndexModel(
+            [("verified", ASCENDING), ("public_profile", ASCENDING), ("sector", ASCENDING)],
+            name="verified_public_sector"
+        ),
+    ],
+    "value_requests": [
+        IndexModel([("member_id", ASCENDING), ("status", ASCENDING)], name="member_status"),
+        IndexModel([("member_id", ASCENDING), ("created_at", DESCENDING)], name="member_created_at"),
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], name="status_created_at"),
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at"),
+    ],
+    "messages": [
+        IndexModel(
+            [("conversation_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="conversation_created_at"
+        ),
+    ],
+    "members_info": [
+        IndexModel([("user_id", ASCENDING)], name="user_id"),
+        IndexModel([("deals.deal_id", ASCENDING)], name="deals_deal_id"),
+    ],
+    "update_requests": [
+        IndexModel([("status", ASCENDING)], name="status"),
+    ],
+    "validate_values": [
+        IndexModel([("status", ASCENDING)], name="status"),
+    ],
+    # Refresh tokens are looked up by their hashed _id; expired ones are removed by the TTL monitor
+    "refresh_tokens": [
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+        IndexModel([("user_id", ASCENDING)], name="user_id"),
+    ],
+    "revoked_tokens": [
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+        IndexModel([("revoked_at", ASCENDING)], name="revoked_at"),
+    ],
+    # One document per (member, type, recommended member), rewritten by the recommendation engine
+    "ai_recommendations": [
+        IndexModel(
+            [("user_id", ASCENDING), ("recommendation_type", ASCENDING), ("recommendation_data.member_id", ASCENDING)],
+            name="user_type_member", unique=True
+        ),
+        IndexModel([("recommendation_data.member_id", ASCENDING)], name="recommended_member"),
+    ],
+    "recommendation_runs": [
+        IndexModel([("started_at", DESCENDING)], name="started_at"),
+    ],
+    "description_jobs": [
+        IndexModel([("finished_at", ASCENDING), ("started_at", DESCENDING)], name="finished_started_at"),
+    ],
+}
+
+def ensure_indexes(db):
+    """Create every registered index; existing indexes are left untouched"""
+    created = {}
+    for collection_name, indexes in INDEXES.items():
+        created[collection_name] = db.get_collection(collection_name).create_indexes(indexes)
+    return created
+
+def missing_indexes(db):
+    """List (collection, index name) pairs that are registered but not present"""
+    missing = []
+    for collection_name, indexes in INDEXES.items():
+        existing = set(db.get_collection(collection_name).index_information())
+        for index in indexes:
+            name = index.document['name']
+            if name not in existing:
+                missing.append((collection_name, name))
+    return missing
+
+# Representative shapes of the queries issued by the services.
+# Each entry is (description, collection name, filter, sort).
+def service_queries():
+    some_id = ObjectId()
+    return [
+        ("login by email", "members", {"email": "someone@example.com"}, None),
+        ("showcases by segment", "members",
+         {"verified": True, "public_profile": True, "sector": "Technology"}, None),
+        ("member directory page", "members", {"_id": {"$gt": some_id}}, [("_id", ASCENDING)]),
+        ("pending value request check", "value_requests",
+         {"member_id": some_id, "status": "pending"}, None),
+        ("member value requests", "value_requests",
+         {"member_id": some_id}, [("created_at", DESCENDING)]),
+        ("pending value requests listing", "value_requests",
+         {"status": "pending"}, [("created_at", DESCENDING), ("_id", DESCENDING)]),
+        ("value requests listing", "value_requests",
+         {}, [("created_at", DESCENDING), ("_id", DESCENDING)]),
+        ("conversation page", "messages",
+         {"conversation_id": "a:b"}, [("created_at", DESCENDING), ("_id", DESCENDING)]),
+        ("member info by user", "members_info", {"user_id": str(some_id)}, None),
+        ("deal lookup", "members_info", {"user_id": str(some_id), "deals.deal_id": "deal"}, None),
+        ("pending update requests", "update_requests", {"status": "pending"}, None),
+        ("pending deal validations", "validate_values", {"status": "pending"}, None),
+        ("refresh token lookup", "refresh_tokens", {"_id": "digest"}, None),
+        ("revoked tokens since last sync", "revoked_tokens", {"revoked_at": {"$gte": 0}}, None),
+        ("member recommendations", "ai_recommendations", {"user_id": str(some_id)}, [("confidence_score", DESCENDING)]),
+        ("members recommending a changed member", "ai_recommendations",
+         {"recommendation_type": {"$in": ["similar_member"]}, "recommendation_data.member_id": {"$in": [str(some_id)]}}, None),
+    ]
+
+def _plan_stages(plan):
+    """Collect every stage name in an explain() plan tree"""
+    stages = []
+    if isinstance(plan, dict):
+        if 'stage' in plan:
+            stages.append(plan['stage'])
+        for key in ('inputStage', 'queryPlan'):
+            if key in plan:
+                stages.extend(_plan_stages(plan[key]))
+        for child in plan.get('inputStages', []):
+            stages.extend(_plan_stages(child))
+    return stages
+
+def unindexed_queries(db):
+    """Explain every service query and return those whose winning plan is not an index scan"""
+    failures = []
+    for description, collection_name, query, sort in service_queries():
+        cursor = db.get_collection(collection_name).find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        stages = _plan_stages(cursor.explain()['queryPlanner']['winningPlan'])
+        if 'COLLSCAN' in stages or not {'IXSCAN', 'IDHACK', 'EXPRESS_IXSCAN'} & set(stages):
+            failures.append((description, stages))
+    return failures
@@ -0,0 +1,42 @@
+from datetime import date
+from decimal import Decimal
+import orjson
+from bson import ObjectId, Decimal128
+from flask.json.provider import JSONProvider
+from pydantic import BaseModel
+
+# Services return documents as MongoDB hands them over; this encoder takes care of
+# ObjectId, Decimal128 and pydantic models, and orjson writes datetimes as ISO 8601.
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def default(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, Decimal128):
+        return str(value.to_decimal())
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.dict(by_alias=True)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps(obj):
+    """Serialize to UTF-8 JSON bytes"""
+    return orjson.dumps(obj, default=default, option=OPTIONS)
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype="application/json")
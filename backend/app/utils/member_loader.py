@@ -0,0 +1,64 @@
+from flask import g, has_app_context
+from bson import ObjectId
+from bson.errors import InvalidId
+from backend.app.utils import database
+
+# Member fields never loaded into request memory
+LOADER_PROJECTION = {"password_hash": 0, "password_plain": 0}
+
+class MemberLoader:
+    """Collects member ids and resolves them with a single $in query, memoizing the results"""
+
+    def __init__(self, projection=None):
+        self._projection = projection or LOADER_PROJECTION
+        self._cache = {}
+        self._pending = set()
+        self.query_count = 0
+
+    @staticmethod
+    def _key(member_id):
+        try:
+            return ObjectId(member_id)
+        except (InvalidId, TypeError):
+            return None
+
+    def prime(self, member_ids):
+        """Queue ids to be resolved by the next batch"""
+        for member_id in member_ids:
+            key = self._key(member_id)
+            if key is not None and key not in self._cache:
+                self._pending.add(key)
+
+    def _dispatch(self):
+        if not self._pending:
+            return
+        ids = list(self._pending)
+        self._pending.clear()
+        for key in ids:
+            self._cache[key] = None
+        self.query_count += 1
+        for member in database.members_collection.find({"_id": {"$in": ids}}, self._projection):
+            self._cache[member['_id']] = member
+
+    def load(self, member_id):
+        """Get one member document, or None if it does not exist"""
+        return self.load_many([member_id])[0]
+
+    def load_many(self, member_ids):
+        """Get member documents for every id, in order, with None for missing members"""
+        member_ids = list(member_ids)
+        self.prime(member_ids)
+        self._dispatch()
+        return [self._cache.get(self._key(member_id)) for member_id in member_ids]
+
+    def clear(self, member_id):
+        """Forget a memoized member, e.g. after it has been written"""
+        self._cache.pop(self._key(member_id), None)
+
+def get_member_loader():
+    """Get the loader for the current request, or a fresh one outside of a request"""
+    if not has_app_context():
+        return MemberLoader()
+    if 'member_loader' not in g:
+        g.member_loader = MemberLoader()
+    return g.member_loader
@@ -0,0 +1,51 @@
+import base64
+import json
+from datetime import datetime
+from bson import ObjectId
+from bson.errors import InvalidId
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+class InvalidCursor(ValueError):
+    pass
+
+def encode_cursor(values):
+    """Encode keyset values into an opaque, URL-safe cursor token"""
+    payload = json.dumps(values, separators=(',', ':'), default=str).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def decode_cursor(token):
+    """Decode a cursor token produced by encode_cursor"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid cursor")
+    if not isinstance(values, dict):
+        raise InvalidCursor("Invalid cursor")
+    return values
+
+def cursor_object_id(values, key='id'):
+    """Read an ObjectId stored in a decoded cursor"""
+    try:
+        return ObjectId(values[key])
+    except (KeyError, TypeError, InvalidId):
+        raise InvalidCursor("Invalid cursor")
+
+def cursor_datetime(values, key='created_at'):
+    """Read an ISO-8601 timestamp stored in a decoded cursor"""
+    try:
+        return datetime.fromisoformat(values[key])
+    except (KeyError, TypeError, ValueError):
+        raise InvalidCursor("Invalid cursor")
+
+def parse_limit(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Parse a ?limit= query argument, clamped to [1, maximum]"""
+    if value is None or value == '':
+        return default
+    try:
+        limit = int(value)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid limit")
+    return max(1, min(limit, maximum))
@@ -0,0 +1,78 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import bcrypt
+from backend.config import Config
+
+# bcrypt runs in a bounded pool of worker processes so a burst of logins
+# cannot pin every request thread on CPU. With PASSWORD_HASH_WORKERS=0
+# hashing runs inline.
+
+_lock = threading.Lock()
+_executor = None
+_executor_pid = None
+_slots = None
+
+def _hashpw(password, rounds):
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+def _checkpw(password, hashed):
+    return bcrypt.checkpw(password, hashed)
+
+def _get_executor():
+    global _executor, _executor_pid, _slots
+    pid = os.getpid()
+    if _executor is None or _executor_pid != pid:
+        with _lock:
+            if _executor is None or _executor_pid != pid:
+                workers = Config.PASSWORD_HASH_WORKERS
+                # Spawned workers avoid forking a process that already runs threads
+                _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+                _slots = threading.BoundedSemaphore(workers * Config.PASSWORD_HASH_QUEUE_FACTOR)
+                _executor_pid = pid
+    return _executor
+
+def _run(fn, *args):
+    if not Config.PASSWORD_HASH_WORKERS:
+        return fn(*args)
+    executor = _get_executor()
+    # Bound the backlog so a login flood waits here instead of queueing without limit
+    with _slots:
+        return executor.submit(fn, *args).result()
+
+def shutdown():
+    global _executor, _executor_pid
+    with _lock:
+        if _executor is not None and _executor_pid == os.getpid():
+            _executor.shutdown(wait=True)
+        _executor = None
+        _executor_pid = None
+
+def hash_password(password, rounds=None):
+    """Hash a password with the configured bcrypt cost and return it as a str"""
+    hashed = _run(_hashpw, password.encode('utf-8'), rounds or Config.BCRYPT_ROUNDS)
+    return hashed.decode('utf-8')
+
+def check_password(password, hashed_password):
+    """Verify a password against a stored bcrypt hash (str or bytes)"""
+    if isinstance(hashed_password, str):
+        hashed_password = hashed_password.encode('utf-8')
+    try:
+        return _run(_checkpw, password.encode('utf-8'), hashed_password)
+    except ValueError:
+        # Malformed stored hash
+        return False
+
+def hash_cost(hashed_password):
+    """Read the cost factor from a bcrypt hash such as $2b$12$..."""
+    if isinstance(hashed_password, bytes):
+        hashed_password = hashed_password.decode('utf-8')
+    try:
+        return int(hashed_password.split('$')[2])
+    except (IndexError, ValueError):
+        return None
+
+def needs_rehash(hashed_password):
+    """Whether a stored hash uses a different cost than the configured one"""
+    return hash_cost(hashed_password) != Config.BCRYPT_ROUNDS
@@ -6,17 +6,20 @@ class Role:
     MEMBER = "member"
     ADMIN = "admin"
 
+def has_permission(user_role, required_role):
+    if user_role == Role.ADMIN:
+        return True
+    if user_role == Role.MEMBER and required_role != Role.ADMIN:
+        return True
+    if user_role == Role.GUEST and required_role == Role.GUEST:
+        return True
+    return False
+
 def permission_required(required_role):
     def decorator(f):
         @wraps(f)
         def decorated_function(current_user, *args, **kwargs):
-            user_role = current_user['role']
-
-            if user_role == Role.ADMIN:
-                return f(current_user, *args, **kwargs)
-            if user_role == Role.MEMBER and required_role != Role.ADMIN:
-                return f(current_user, *args, **kwargs)
-            if user_role == Role.GUEST and required_role == Role.GUEST:
+            if has_permission(current_user['role'], required_role):
                 return f(current_user, *args, **kwargs)
             
             return jsonify({"message": "Permission denied"}), 403
@@ -0,0 +1,59 @@
+import random
+import threading
+import time
+
+class TokenBucket:
+    """Thread-safe token bucket: rate tokens per second, holding at most burst"""
+
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens):
+        """Take tokens if available and return 0, or return how long to wait for them"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens=1):
+        """Block until tokens are available; a rate of 0 or less never limits"""
+        if self.rate <= 0:
+            return
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return
+            self._sleep(wait)
+
+def backoff_delay(attempt, base_delay, max_delay):
+    """Exponential backoff with full jitter for the given zero-based attempt"""
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+def retry_with_backoff(fn, retryable, attempts, base_delay=1.0, max_delay=60.0, sleep=time.sleep):
+    """
+    Call fn until it succeeds, retrying the retryable exception types up to attempts
+    times in total. A Retry-After header on the error is honoured as a minimum wait.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except retryable as e:
+            if attempt == attempts - 1:
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            retry_after = (getattr(e, 'headers', None) or {}).get('retry-after')
+            try:
+                delay = max(delay, float(retry_after)) if retry_after else delay
+            except ValueError:
+                pass
+            sleep(delay)
@@ -0,0 +1,46 @@
+from flask import request
+from flask_socketio import SocketIO, Namespace, ConnectionRefusedError, join_room
+from backend.app.utils.security import decode_token
+from backend.app.utils.permissions import Role
+from backend.config import Config
+
+MESSAGES_NAMESPACE = '/messages'
+
+socketio = SocketIO()
+
+def socketio_options():
+    """SocketIO.init_app keyword arguments built from Config"""
+    options = {"cors_allowed_origins": "*", "async_mode": Config.SOCKETIO_ASYNC_MODE}
+    if Config.SOCKETIO_MESSAGE_QUEUE:
+        # Emits are published to the queue and delivered by every process holding a socket in the room
+        options.update(message_queue=Config.SOCKETIO_MESSAGE_QUEUE, channel=Config.SOCKETIO_CHANNEL)
+    return options
+
+def user_room(user_id):
+    return f"user:{user_id}"
+
+class MessagesNamespace(Namespace):
+    """Pushes new messages to the receiver's room, authenticated with the API's JWT"""
+
+    def on_connect(self, auth=None):
+        token = (auth or {}).get('token') or request.args.get('token') or request.headers.get('x-access-token')
+        if not token:
+            raise ConnectionRefusedError('Token is missing')
+        try:
+            current_user = decode_token(token)
+        except Exception:
+            raise ConnectionRefusedError('Token is invalid')
+        if current_user['role'] == Role.GUEST:
+            raise ConnectionRefusedError('Permission denied')
+        join_room(user_room(current_user['public_id']))
+
+socketio.on_namespace(MessagesNamespace(MESSAGES_NAMESPACE))
+
+def push_to_user(user_id, event, data):
+    """
+    Emit an event to every socket the user has open, in any server process when a
+    message queue is configured; a no-op when sockets are not initialised
+    """
+    if socketio.server is None:
+        return
+    socketio.emit(event, data, to=user_room(user_id), namespace=MESSAGES_NAMESPACE)
@@ -0,0 +1,85 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from backend.config import Config
+from backend.app.utils import database
+
+logger = logging.getLogger(__name__)
+
+class RevocationList:
+    """In-memory set of revoked access token ids (jti), each kept until the token would have expired"""
+
+    def __init__(self):
+        self._revoked = {}
+        self._lock = threading.Lock()
+        self._synced_at = None
+        self._sync_pid = None
+
+    def __contains__(self, jti):
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def add(self, jti, expires_at):
+        with self._lock:
+            self._revoked[jti] = expires_at
+
+    def purge_expired(self):
+        now = time.time()
+        with self._lock:
+            for jti in [jti for jti, expires_at in self._revoked.items() if expires_at <= now]:
+                del self._revoked[jti]
+
+    def __len__(self):
+        return len(self._revoked)
+
+    def sync(self):
+        """Pull revocations made by other processes since the last sync"""
+        query = {"expires_at": {"$gt": datetime.utcnow()}}
+        if self._synced_at is not None:
+            # Overlap the window slightly so revocations committed during the last sync are not missed
+            query["revoked_at"] = {"$gte": self._synced_at - Config.REVOCATION_SYNC_SECONDS}
+        started_at = time.time()
+        for doc in database.revoked_tokens_collection.find(query, {"_id": 1, "expires_at": 1}):
+            self.add(doc['_id'], _timestamp(doc['expires_at']))
+        self._synced_at = started_at
+        self.purge_expired()
+
+    def ensure_sync_thread(self):
+        """Start this process's background sync, once per process (and again after fork)"""
+        if not Config.REVOCATION_SYNC_SECONDS or self._sync_pid == os.getpid():
+            return
+        with self._lock:
+            if self._sync_pid == os.getpid():
+                return
+            self._sync_pid = os.getpid()
+        threading.Thread(target=self._sync_forever, name="revocation-sync", daemon=True).start()
+
+    def _sync_forever(self):
+        while True:
+            try:
+                self.sync()
+            except Exception as e:
+                logger.warning(f"Failed to sync revoked tokens: {e}")
+            time.sleep(Config.REVOCATION_SYNC_SECONDS)
+
+def _timestamp(value):
+    if isinstance(value, datetime):
+        return (value - datetime(1970, 1, 1)).total_seconds()
+    return float(value)
+
+revocation_list = RevocationList()
+
+def revoke(jti, expires_at):
+    """Revoke an access token in this process immediately and persist it for every other process"""
+    revocation_list.add(jti, expires_at)
+    database.revoked_tokens_collection.update_one(
+        {"_id": jti},
+        {"$set": {"expires_at": datetime.utcfromtimestamp(expires_at), "revoked_at": time.time()}},
+        upsert=True
+    )
+
+def is_revoked(jti):
+    revocation_list.ensure_sync_thread()
+    return jti in revocation_list
@@ -0,0 +1,275 @@
+import bisect
+import heapq
+import logging
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from backend.config import Config
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+def tokenize(text):
+    """Lowercase word tokens with accents stripped, so "Sócio" and "socio" match"""
+    if not text:
+        return []
+    if isinstance(text, (list, tuple)):
+        text = " ".join(str(item) for item in text if item)
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    folded = "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+    return TOKEN_PATTERN.findall(folded)
+
+def normalize(value):
+    """Filter values are compared accent- and case-insensitively"""
+    if value is None or isinstance(value, bool):
+        return value
+    return " ".join(tokenize(value))
+
+class SearchIndex:
+    """
+    In-memory inverted index ranked with BM25.
+
+    Each document is a set of text fields, filterable attributes and the stored
+    values returned with a hit. Term frequencies are weighted per field, so a
+    match in the name counts more than one in the expertise list. Postings hold
+    each document's precomputed BM25 term weight against the average document
+    length of the last full load, so a query only multiplies by idf and adds up.
+    """
+
+    def __init__(self, field_weights, k1=1.2, b=0.75):
+        self.field_weights = field_weights
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._reset()
+        self.loaded = False
+        self.versions = None
+        self._sync_pid = None
+
+    def _reset(self):
+        self._postings = {}  # term -> {doc_id: BM25 term weight}
+        self._terms = {}
+        self._attrs = {}
+        self._attr_sets = defaultdict(set)  # (attribute, value) -> doc ids
+        self._stored = {}
+        self._average_length = None
+
+    def __len__(self):
+        return len(self._terms)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._terms
+
+    def _frequencies(self, fields):
+        frequencies = defaultdict(float)
+        for field, weight in self.field_weights.items():
+            for term in tokenize(fields.get(field)):
+                frequencies[term] += weight
+        return frequencies
+
+    def _add(self, doc_id, frequencies, attrs, stored):
+        length = sum(frequencies.values())
+        norm = self.k1 * (1 - self.b + self.b * length / (self._average_length or length or 1.0))
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, {})[doc_id] = frequency * (self.k1 + 1) / (frequency + norm)
+        self._terms[doc_id] = tuple(frequencies)
+        self._attrs[doc_id] = attrs = {name: normalize(value) for name, value in attrs.items()}
+        for item in attrs.items():
+            self._attr_sets[item].add(doc_id)
+        self._stored[doc_id] = stored
+
+    def _remove(self, doc_id):
+        if doc_id not in self._terms:
+            return False
+        for term in self._terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+        for item in self._attrs.pop(doc_id).items():
+            self._attr_sets[item].discard(doc_id)
+        del self._stored[doc_id]
+        return True
+
+    def upsert(self, doc_id, fields, attrs, stored):
+        frequencies = self._frequencies(fields)
+        with self._lock:
+            self._remove(doc_id)
+            self._add(doc_id, frequencies, attrs, stored)
+
+    def remove(self, doc_id):
+        with self._lock:
+            return self._remove(doc_id)
+
+    def replace_all(self, documents, versions=None):
+        """Swap in a full set of (doc_id, fields, attrs, stored) documents"""
+        analyzed = [(doc_id, self._frequencies(fields), attrs, stored) for doc_id, fields, attrs, stored in documents]
+        fresh = SearchIndex(self.field_weights, self.k1, self.b)
+        if analyzed:
+            fresh._average_length = sum(sum(frequencies.values()) for _, frequencies, _, _ in analyzed) / len(analyzed)
+        for document in analyzed:
+            fresh._add(*document)
+        with self._lock:
+            self._postings, self._terms, self._stored = fresh._postings, fresh._terms, fresh._stored
+            self._attrs, self._attr_sets, self._average_length = fresh._attrs, fresh._attr_sets, fresh._average_length
+            self.versions = versions
+            self.loaded = True
+
+    def search(self, query, filters=None, offset=0, limit=20):
+        """Return (total, [(doc_id, score, stored)]) for the best BM25 matches of any query term"""
+        filters = [(name, normalize(value)) for name, value in (filters or {}).items() if value is not None]
+        terms = set(tokenize(query))
+        with self._lock:
+            count = len(self._terms)
+            matched = [self._postings[term] for term in terms if term in self._postings]
+            if not matched:
+                return 0, []
+            if len(matched) == 1:
+                # A single term ranks by its term weight alone; idf only scales the reported score
+                scores = matched[0]
+                scale = _idf(len(scores), count)
+            else:
+                # Start from the longest posting list so the merge loop runs over the shorter ones
+                matched.sort(key=len, reverse=True)
+                idf = _idf(len(matched[0]), count)
+                scores, scale = {doc_id: idf * weight for doc_id, weight in matched[0].items()}, 1.0
+                for postings in matched[1:]:
+                    idf, get = _idf(len(postings), count), scores.get
+                    for doc_id, weight in postings.items():
+                        scores[doc_id] = get(doc_id, 0.0) + idf * weight
+            candidates = scores
+            if filters:
+                allowed = sorted((self._attr_sets.get(item, set()) for item in filters), key=len)
+                candidates = allowed[0].intersection(scores, *allowed[1:])
+            top = _top(candidates, scores, offset + limit)[offset:]
+            return len(candidates), [(doc_id, scale * scores[doc_id], self._stored[doc_id]) for doc_id in top]
+
+    def ensure_sync_thread(self, sync):
+        """Start this process's background sync(), once per process (and again after fork)"""
+        if not Config.SEARCH_INDEX_SYNC_SECONDS or self._sync_pid == os.getpid():
+            return
+        with self._lock:
+            if self._sync_pid == os.getpid():
+                return
+            self._sync_pid = os.getpid()
+        threading.Thread(target=self._sync_forever, args=(sync,), name="search-index-sync", daemon=True).start()
+
+    def _sync_forever(self, sync):
+        while True:
+            time.sleep(Config.SEARCH_INDEX_SYNC_SECONDS)
+            try:
+                sync()
+            except Exception as e:
+                logger.warning(f"Failed to sync the search index: {e}")
+
+def _top(candidates, scores, count):
+    """The count best candidates by score, ties broken by id so pages are stable across processes"""
+    top = heapq.nlargest(count, candidates, key=scores.__getitem__)
+    if not top:
+        return top
+    threshold = scores[top[-1]]
+    above = sorted((doc_id for doc_id in top if scores[doc_id] > threshold), key=lambda doc_id: (-scores[doc_id], doc_id))
+    ties = [doc_id for doc_id in top if scores[doc_id] == threshold]
+    # Only a tie cut off at the boundary needs another pass over the candidates
+    if len(top) == count and list(map(scores.__getitem__, candidates)).count(threshold) > len(ties):
+        ties = [doc_id for doc_id in candidates if scores[doc_id] == threshold]
+    return above + sorted(ties)[:count - len(above)]
+
+def _idf(document_frequency, count):
+    return math.log(1 + (count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+class PrefixIndex:
+    """
+    Typeahead index over short phrases such as names, kept as one sorted array.
+
+    Every word start of a phrase is a key ("ana souza" and "souza"), so a prefix
+    lookup is a binary search followed by a scan of the matching range. Matches are
+    ranked by a popularity weight; ranked lists for very short prefixes, whose
+    ranges are the longest, are cached until the next write.
+    """
+
+    def __init__(self, cached_prefix_length=2, cached_results=20):
+        self.cached_prefix_length = cached_prefix_length
+        self.cached_results = cached_results
+        self._lock = threading.Lock()
+        self._keys = []  # sorted (key, doc_id)
+        self._entries = {}  # doc_id -> (keys, weight, stored)
+        self._ranked = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _phrase_keys(phrases):
+        keys = set()
+        for phrase in phrases:
+            tokens = tokenize(phrase)
+            keys.update(" ".join(tokens[start:]) for start in range(len(tokens)))
+        return keys
+
+    def _remove(self, doc_id):
+        entry = self._entries.pop(doc_id, None)
+        if entry is None:
+            return False
+        for key in entry[0]:
+            position = bisect.bisect_left(self._keys, (key, doc_id))
+            del self._keys[position]
+        return True
+
+    def upsert(self, doc_id, phrases, weight, stored):
+        keys = self._phrase_keys(phrases)
+        with self._lock:
+            self._remove(doc_id)
+            for key in keys:
+                bisect.insort(self._keys, (key, doc_id))
+            self._entries[doc_id] = (keys, weight or 0, stored)
+            self._ranked = {}
+
+    def remove(self, doc_id):
+        with self._lock:
+            removed = self._remove(doc_id)
+            self._ranked = {}
+            return removed
+
+    def replace_all(self, documents):
+        """Swap in a full set of (doc_id, phrases, weight, stored) documents"""
+        entries = {doc_id: (self._phrase_keys(phrases), weight or 0, stored) for doc_id, phrases, weight, stored in documents}
+        keys = sorted((key, doc_id) for doc_id, (doc_keys, _, _) in entries.items() for key in doc_keys)
+        with self._lock:
+            self._keys, self._entries, self._ranked = keys, entries, {}
+
+    def _rank(self, prefix, limit):
+        matches = set()
+        position = bisect.bisect_left(self._keys, (prefix,))
+        keys = self._keys
+        while position < len(keys) and keys[position][0].startswith(prefix):
+            matches.add(keys[position][1])
+            position += 1
+        entries = self._entries
+        return heapq.nlargest(limit, matches, key=lambda doc_id: entries[doc_id][1])
+
+    def suggest(self, prefix, limit=10):
+        """Stored values of the most popular documents with a phrase word starting with prefix"""
+        prefix = " ".join(tokenize(prefix))
+        if not prefix:
+            return []
+        with self._lock:
+            if len(prefix) > self.cached_prefix_length or limit > self.cached_results:
+                ranked = self._rank(prefix, limit)
+            else:
+                ranked = self._ranked.get(prefix)
+                if ranked is None:
+                    ranked = self._ranked[prefix] = self._rank(prefix, self.cached_results)
+            return [self._entries[doc_id][2] for doc_id in ranked[:limit]]
+
+# Name and title matches outrank company, sector and expertise matches
+MEMBER_FIELD_WEIGHTS = {"name": 3.0, "title": 2.0, "company": 2.0, "sector": 1.0, "expertise": 1.0}
+
+member_index = SearchIndex(MEMBER_FIELD_WEIGHTS)
+# Member and company names for typeahead, ranked by connections
+member_suggestions = PrefixIndex()
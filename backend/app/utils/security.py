@@ -1,14 +1,48 @@
-import bcrypt
 import jwt
+import uuid
+from datetime import datetime, timedelta
 from functools import wraps
 from flask import request, jsonify
 from backend.config import Config
+from backend.app.utils.passwords import hash_password, check_password, needs_rehash
+from backend.app.utils.token_cache import token_cache
+from backend.app.utils import revocation
 
-def hash_password(password):
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+def create_access_token(public_id, role):
+    """Issue a short-lived JWT; the jti lets it be revoked before it expires"""
+    return jwt.encode({
+        'public_id': public_id,
+        'role': role,
+        'jti': uuid.uuid4().hex,
+        'exp': datetime.utcnow() + timedelta(minutes=Config.ACCESS_TOKEN_MINUTES)
+    }, Config.JWT_SECRET_KEY, algorithm="HS256")
 
-def check_password(password, hashed_password):
-    return bcrypt.checkpw(password.encode('utf-8'), hashed_password)
+def decode_token(token):
+    """Verify a JWT and return the user it identifies; verified tokens are cached until they expire"""
+    claims = token_cache.get(token)
+    if claims is None:
+        data = jwt.decode(token, Config.JWT_SECRET_KEY, algorithms=["HS256"])
+        claims = {
+            'public_id': data['public_id'],
+            'role': data['role'],
+            'jti': data.get('jti')
+        }
+        token_cache.put(token, claims, data.get('exp'))
+
+    if claims['jti'] and revocation.is_revoked(claims['jti']):
+        raise jwt.InvalidTokenError('Token has been revoked')
+    return {'public_id': claims['public_id'], 'role': claims['role']}
+
+def revoke_token(token):
+    """Revoke a valid access token everywhere until it expires"""
+    data = jwt.decode(token, Config.JWT_SECRET_KEY, algorithms=["HS256"])
+    token_cache.invalidate(token)
+    if data.get('jti'):
+        revocation.revoke(data['jti'], data['exp'])
+
+def invalidate_token(token):
+    """Forget a cached verification, e.g. when the token is revoked"""
+    token_cache.invalidate(token)
 
 def token_required(f):
     @wraps(f)
@@ -19,11 +53,7 @@ def token_required(f):
         if not token:
             return jsonify({'message': 'Token is missing'}), 401
         try:
-            data = jwt.decode(token, Config.JWT_SECRET_KEY, algorithms=["HS256"])
-            current_user = {
-                'public_id': data['public_id'],
-                'role': data['role']
-            }
+            current_user = decode_token(token)
         except:
             return jsonify({'message': 'Token is invalid'}), 401
         return f(current_user, *args, **kwargs)
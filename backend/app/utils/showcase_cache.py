@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import threading
+import time
+from backend.config import Config
+from backend.app.utils import change_versions
+
+logger = logging.getLogger(__name__)
+
+ALL_SHOWCASES = "showcases"
+SEGMENTS = "segments"
+# collection_versions entry bumped only when guest-visible data changes; showcase
+# ETags and cross-process invalidation key on it rather than on every members write
+SHOWCASE_VERSION = "showcases"
+
+def segment_key(segment):
+    return f"showcases:{segment}"
+
+# Member fields whose change can alter what guests see
+SHOWCASE_FIELDS = {
+    "name", "company", "sector", "hierarchy", "description", "profile_image",
+    "expertise", "location", "connections", "verified", "public_profile"
+}
+
+class ShowcaseCache:
+    """
+    TTL cache for guest showcase reads with stale-while-revalidate.
+
+    Entries younger than ttl are served as is. Entries up to ttl + stale_ttl old are
+    still served while a single background refresh replaces them. Older entries, and
+    misses, are loaded by the caller.
+    """
+
+    def __init__(self, ttl, stale_ttl):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        # Bumped on invalidation so a load that started earlier is not stored
+        self._generation = 0
+        self._versions = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def _lookup(self, key):
+        """Return (value, needs_refresh) for a usable entry, or None on a miss"""
+        if not self.ttl:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, loaded_at = entry
+            age = time.monotonic() - loaded_at
+            if age < self.ttl:
+                self.hits += 1
+                return value, False
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                needs_refresh = key not in self._refreshing
+                self._refreshing.add(key)
+                return value, needs_refresh
+            self.misses += 1
+            return None
+
+    def _store(self, key, value, generation):
+        with self._lock:
+            self._refreshing.discard(key)
+            if self.ttl and generation == self._generation:
+                self._entries[key] = (value, time.monotonic())
+
+    def _refresh_failed(self, key, error):
+        with self._lock:
+            self._refreshing.discard(key)
+        logger.warning(f"Failed to refresh showcase cache entry {key}: {error}")
+
+    def get(self, key, loader):
+        """Serve key from memory, calling loader() on a miss or in the background when stale"""
+        generation = self._generation
+        found = self._lookup(key)
+        if found is None:
+            value = loader()
+            self._store(key, value, generation)
+            return value
+        value, needs_refresh = found
+        if needs_refresh:
+            threading.Thread(target=self._refresh, args=(key, loader, generation), daemon=True).start()
+        return value
+
+    def _refresh(self, key, loader, generation):
+        try:
+            self._store(key, loader(), generation)
+        except Exception as e:
+            self._refresh_failed(key, e)
+
+    async def aget(self, key, loader):
+        """Async counterpart of get() where loader is a coroutine function"""
+        generation = self._generation
+        found = self._lookup(key)
+        if found is None:
+            value = await loader()
+            self._store(key, value, generation)
+            return value
+        value, needs_refresh = found
+        if needs_refresh:
+            asyncio.get_running_loop().create_task(self._arefresh(key, loader, generation))
+        return value
+
+    async def _arefresh(self, key, loader, generation):
+        try:
+            self._store(key, await loader(), generation)
+        except Exception as e:
+            self._refresh_failed(key, e)
+
+    def invalidate(self):
+        """Drop every entry; called after writes that change what guests see"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._refreshing.clear()
+
+    def observe_versions(self, versions):
+        """Drop every entry when the observed versions changed since the last request, e.g. in another process"""
+        with self._lock:
+            changed = any(self._versions.get(name) != version for name, version in versions.items())
+            self._versions.update(versions)
+        if changed:
+            self.invalidate()
+
+    def invalidate_for(self, changed_fields, member=None):
+        """Invalidate when a write touched showcase fields of a member that is, or may become, shown to guests"""
+        changed_fields = set(changed_fields)
+        if not changed_fields & SHOWCASE_FIELDS:
+            return False
+        # Showcases and segment counts only include verified members with a public profile
+        shown = member is None or (member.get('verified') and member.get('public_profile'))
+        if not shown and not changed_fields & {"verified", "public_profile"}:
+            return False
+        self.invalidate()
+        return True
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "ttl": self.ttl,
+                "stale_ttl": self.stale_ttl
+            }
+
+showcase_cache = ShowcaseCache(Config.SHOWCASE_CACHE_TTL_SECONDS, Config.SHOWCASE_CACHE_STALE_SECONDS)
+
+def invalidate_showcases(changed_fields, member=None):
+    """invalidate_for on this process's cache, bumping the showcases version for the others when it applied"""
+    if showcase_cache.invalidate_for(changed_fields, member):
+        change_versions.bump(SHOWCASE_VERSION)
+        return True
+    return False
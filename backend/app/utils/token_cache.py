@@ -0,0 +1,71 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from backend.config import Config
+
+class TokenCache:
+    """Bounded LRU of verified token digests -> decoded claims, each entry expiring at the token's exp"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token):
+        if isinstance(token, str):
+            token = token.encode('utf-8')
+        return hashlib.sha256(token).digest()
+
+    def get(self, token):
+        key = self.digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                claims, expires_at = entry
+                if expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return claims
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, token, claims, expires_at):
+        if not self.capacity or not expires_at:
+            return
+        key = self.digest(token)
+        with self._lock:
+            self._entries[key] = (claims, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, token):
+        """Drop a token, e.g. when it is revoked"""
+        with self._lock:
+            self._entries.pop(self.digest(token), None)
+
+    def invalidate_where(self, predicate):
+        """Drop every entry whose claims match, e.g. all tokens of a user"""
+        with self._lock:
+            for key in [key for key, (claims, _) in self._entries.items() if predicate(claims)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "capacity": self.capacity
+            }
+
+token_cache = TokenCache(Config.TOKEN_CACHE_SIZE)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Response compression benchmark.
+Reports bytes saved and CPU time per payload for gzip levels and brotli qualities,
+using member-list JSON of increasing size.
+
+Usage: python benchmarks/compression_benchmark.py [--sizes 10,100,1000,5000] [--repeat 20]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from bson import ObjectId
+from backend.config import Config
+from backend.app.utils import compression
+
+SECTORS = ['Technology', 'Finance', 'Healthcare', 'Energy', 'Retail', 'Agribusiness']
+
+def member_list(count):
+    rng = random.Random(count)
+    return json.dumps({"members": [{
+        "_id": str(ObjectId()),
+        "name": f"Member {i}",
+        "email": f"member{i}@example.com",
+        "tier": rng.choice(['Disruption', 'Infinity', 'Sócio']),
+        "sector": rng.choice(SECTORS),
+        "company": f"Company {rng.randint(1, 500)}",
+        "description": "Founder and investor focused on " + rng.choice(SECTORS).lower() + " deals.",
+        "connections": rng.randint(0, 2000),
+    } for i in range(count)], "next_cursor": None}).encode('utf-8')
+
+def measure(data, encoding, repeat):
+    start = time.process_time()
+    for _ in range(repeat):
+        compressed = compression.compress(data, encoding)
+    return len(compressed), (time.process_time() - start) / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark response compression')
+    parser.add_argument('--sizes', default='10,100,1000,5000', help='Members per payload, comma separated')
+    parser.add_argument('--repeat', type=int, default=20, help='Compressions per measurement')
+    args = parser.parse_args()
+
+    settings = [('gzip', level) for level in (1, 6, 9)]
+    if compression.brotli:
+        settings += [('br', quality) for quality in (1, 4, 6)]
+
+    print(f"{'members':>8}{'raw bytes':>12}  {'encoding':<10}{'bytes':>10}{'saved':>8}{'CPU ms':>9}{'MB/s':>8}")
+    for count in (int(size) for size in args.sizes.split(',')):
+        data = member_list(count)
+        for encoding, level in settings:
+            Config.COMPRESS_LEVEL = Config.COMPRESS_BROTLI_QUALITY = level
+            size, seconds = measure(data, encoding, args.repeat)
+            label = f"{encoding}-{level}"
+            print(f"{count:>8}{len(data):>12}  {label:<10}{size:>10}{1 - size / len(data):>8.0%}"
+                  f"{seconds * 1000:>9.2f}{len(data) / seconds / 1e6 if seconds else 0:>8.0f}")
+        print()
+
+if __name__ == '__main__':
+    main()
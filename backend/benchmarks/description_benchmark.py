@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Bulk description generation benchmark.
+Generates descriptions for synthetic members against the local OpenAI stub
+(tests/openai_stub.py), which answers after a fixed latency, and reports the
+throughput of the serial loop and of the worker pool at each concurrency.
+MongoDB is not involved; descriptions are not stored.
+
+Usage: python benchmarks/description_benchmark.py [--members 64] [--latency 0.25] [--concurrency 1 8 32]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import openai
+from backend.app.services.ai_description_service import request_description
+from backend.app.services.description_backfill_service import generate_all
+from backend.tests.openai_stub import OpenAIStub
+
+def member_info(index):
+    return {'name': f"Membro {index}", 'company': "Empresa", 'sector': "Technology", 'expertise': ["Payments"]}
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark bulk description generation')
+    parser.add_argument('--members', type=int, default=64, help='Synthetic members')
+    parser.add_argument('--latency', type=float, default=0.25, help='Seconds the stub takes per completion')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32], help='Worker pool sizes')
+    args = parser.parse_args()
+
+    with OpenAIStub(latency=args.latency) as stub:
+        openai.api_key, openai.api_base = "benchmark", stub.url
+        print(f"{args.members} members, {args.latency * 1000:.0f} ms per completion")
+
+        start = time.perf_counter()
+        for index in range(args.members):
+            request_description(member_info(index))
+        elapsed = time.perf_counter() - start
+        print(f"{'serial':<22}{elapsed:>8.2f} s {args.members / elapsed:>8.1f} members/s")
+
+        for concurrency in args.concurrency:
+            start = time.perf_counter()
+            generate_all(range(args.members), lambda index: request_description(member_info(index)),
+                         concurrency, lambda *result: None)
+            elapsed = time.perf_counter() - start
+            print(f"{f'pool of {concurrency}':<22}{elapsed:>8.2f} s {args.members / elapsed:>8.1f} members/s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Guest login benchmark.
+Compares guest_login() with the principal cached against bare JWT signing, so the
+cost added on top of signing a token is visible.
+
+Usage: python benchmarks/guest_login_benchmark.py [--logins 20000]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bson import ObjectId
+from backend.app.services import auth_service
+from backend.app.utils.guest_principal import guest_principal
+from backend.app.utils.security import create_access_token
+
+def run(logins, fn):
+    start = time.perf_counter()
+    for _ in range(logins):
+        fn()
+    return logins / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark guest login throughput')
+    parser.add_argument('--logins', type=int, default=20000, help='Logins per scenario')
+    args = parser.parse_args()
+
+    guest_id = str(ObjectId())
+    # Stands in for the one lookup each process makes; no MongoDB is needed
+    guest_principal.prime(guest_id)
+    loads_before = guest_principal.loads
+
+    signing = run(args.logins, lambda: create_access_token(guest_id, 'guest'))
+    guest = run(args.logins, auth_service.guest_login)
+    assert guest_principal.loads == loads_before, "guest_login queried MongoDB"
+
+    print(f"{args.logins} logins per scenario, single thread\n")
+    print(f"{'scenario':<28}{'logins/s':>12}")
+    print(f"{'JWT signing only':<28}{signing:>12.0f}")
+    print(f"{'guest_login()':<28}{guest:>12.0f}")
+    print(f"\nguest_login() runs at {guest / signing:.0%} of bare signing throughput")
+
+if __name__ == '__main__':
+    main()
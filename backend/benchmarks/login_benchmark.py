@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Password verification benchmark.
+Reports logins per second, and per core, for inline bcrypt and for the hashing process pool.
+
+Usage: python benchmarks/login_benchmark.py [--rounds 12] [--logins 64] [--workers 4]
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.config import Config
+from backend.app.utils import passwords
+
+def run(logins, request_threads, password, hashed):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=request_threads) as threads:
+        results = list(threads.map(lambda _: passwords.check_password(password, hashed), range(logins)))
+    elapsed = time.perf_counter() - start
+    assert all(results)
+    return logins / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark password verification throughput')
+    parser.add_argument('--rounds', type=int, default=Config.BCRYPT_ROUNDS, help='bcrypt cost factor')
+    parser.add_argument('--logins', type=int, default=64, help='Logins per scenario')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Hashing pool size')
+    args = parser.parse_args()
+
+    Config.PASSWORD_HASH_WORKERS = 0
+    hashed = passwords.hash_password('password', rounds=args.rounds)
+
+    print(f"bcrypt cost {args.rounds}, {args.logins} logins per scenario, {os.cpu_count()} cores\n")
+    print(f"{'scenario':<28}{'logins/s':>10}{'per core':>10}")
+
+    rate = run(args.logins, 1, 'password', hashed)
+    print(f"{'inline, 1 request thread':<28}{rate:>10.1f}{rate:>10.1f}")
+
+    Config.PASSWORD_HASH_WORKERS = args.workers
+    try:
+        # Warm the pool so process start-up is not measured
+        passwords.check_password('password', hashed)
+        rate = run(args.logins, args.workers * 2, 'password', hashed)
+        cores = min(args.workers, os.cpu_count() or 1)
+        print(f"{f'pool, {args.workers} workers':<28}{rate:>10.1f}{rate / cores:>10.1f}")
+    finally:
+        passwords.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Model construction benchmark.
+Compares validating construction with MongoModel.from_db() for documents read back
+from MongoDB, and .dict(by_alias=True, exclude_none=True) with .to_db() for writes.
+
+Usage: python benchmarks/model_benchmark.py [--objects 20000]
+"""
+
+import os
+import sys
+import time
+import argparse
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from bson import ObjectId
+from backend.app.models.member import Member
+from backend.app.models.member_info import MemberInfo
+from backend.app.models.value_request import ValueRequest
+from backend.app.models.message import Message
+from backend.app.models.validate_values import ValidateValues
+
+def documents():
+    now = datetime.utcnow()
+    user_id = str(ObjectId())
+    return [
+        (Member, {
+            "_id": str(ObjectId()), "name": "Member Example", "email": "member@example.com",
+            "password_hash": "$2b$12$" + "x" * 53, "tier": "Infinity", "user_type": "member",
+            "contact_info": {"phone": "+55 11 99999-0000", "company": "Example", "position": "CEO"},
+            "created_at": now, "updated_at": now, "is_active": True,
+        }),
+        (MemberInfo, {
+            "_id": str(ObjectId()), "user_id": user_id, "name": "Member Example", "email": "member@example.com",
+            "company": "Example", "sector": "Technology", "title": "Founder",
+            "expertise": ["fintech", "payments", "growth"], "connections": 420,
+            "negocios_fechados": 12, "valor_total": 1250000.0,
+            "deals": [{"deal_id": str(ObjectId()), "description": f"Deal {i}", "value": 10000.0 * i, "date": now} for i in range(5)],
+            "created_at": now, "updated_at": now,
+        }),
+        (ValueRequest, {
+            "_id": str(ObjectId()), "member_id": user_id, "request_type": "both",
+            "current_deal_count": 3, "requested_deal_count": 5, "requested_deal_value": "150000.00",
+            "justification": "Closed two new deals this quarter", "status": "pending",
+            "created_at": now, "updated_at": now,
+        }),
+        (Message, {
+            "_id": str(ObjectId()), "conversation_id": f"{user_id}:{ObjectId()}", "sender_id": user_id,
+            "receiver_id": str(ObjectId()), "content": "Hello, shall we talk about the deal?",
+            "created_at": now, "status": "sent",
+        }),
+        (ValidateValues, {
+            "_id": str(ObjectId()), "user_id": user_id, "request_type": "new_deal",
+            "data": {"description": "New deal", "value": 25000.0}, "status": "pending",
+            "created_at": now, "updated_at": now,
+        }),
+    ]
+
+def rate(objects, fn):
+    start = time.perf_counter()
+    for _ in range(objects):
+        fn()
+    return objects / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark model construction and serialization')
+    parser.add_argument('--objects', type=int, default=20000, help='Objects per measurement')
+    args = parser.parse_args()
+
+    print(f"{args.objects} objects per measurement, objects/s\n")
+    print(f"{'model':<16}{'Model(**doc)':>14}{'from_db()':>12}{'speedup':>9}{'.dict()':>12}{'to_db()':>12}{'speedup':>9}")
+    for model, document in documents():
+        instance = model(**document)
+        validated = rate(args.objects, lambda: model(**document))
+        trusted = rate(args.objects, lambda: model.from_db(document))
+        dumped = rate(args.objects, lambda: instance.dict(by_alias=True, exclude_none=True))
+        serialized = rate(args.objects, instance.to_db)
+        print(f"{model.__name__:<16}{validated:>14.0f}{trusted:>12.0f}{trusted / validated:>8.1f}x"
+              f"{dumped:>12.0f}{serialized:>12.0f}{serialized / dumped:>8.1f}x")
+
+if __name__ == '__main__':
+    main()
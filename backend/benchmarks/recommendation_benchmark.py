@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Recommendation engine benchmark.
+Encodes synthetic member profiles and computes every member's top-k similar and
+complementary members in chunked matrix blocks, reporting the time of each stage.
+MongoDB is not involved; writes are left out.
+
+Usage: python benchmarks/recommendation_benchmark.py [--members 100000] [--chunk-size 256]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.config import Config
+from backend.app.services.recommendation_service import ProfileMatrix, profile_features, top_k
+
+SECTORS = ['Technology', 'Finance', 'Healthcare', 'Energy', 'Retail', 'Agribusiness', 'Real Estate',
+           'Education', 'Logistics', 'Media']
+HIERARCHY = ['C-Level', 'Director', 'Manager', 'Founder', 'Partner']
+TITLES = ['Founder', 'CEO', 'CTO', 'CFO', 'Partner', 'Investor', 'Director of Sales', 'Head of Growth']
+
+def profiles(count, expertise_pool):
+    rng = random.Random(count)
+    tags = [f"skill {i}" for i in range(expertise_pool)]
+    for _ in range(count):
+        yield {
+            'sector': rng.choice(SECTORS), 'hierarchy': rng.choice(HIERARCHY), 'title': rng.choice(TITLES),
+            'expertise': rng.sample(tags, rng.randint(2, 6)),
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the recommendation engine')
+    parser.add_argument('--members', type=int, default=100000, help='Synthetic members')
+    parser.add_argument('--chunk-size', type=int, default=Config.RECOMMENDATION_CHUNK_SIZE, help='Rows per matrix block')
+    parser.add_argument('--expertise', type=int, default=400, help='Distinct expertise tags')
+    args = parser.parse_args()
+    k = Config.RECOMMENDATION_TOP_K
+
+    start = time.perf_counter()
+    features = [profile_features(profile) for profile in profiles(args.members, args.expertise)]
+    matrix = ProfileMatrix([str(i) for i in range(args.members)], features, Config.RECOMMENDATION_MAX_FEATURES)
+    encoded = time.perf_counter() - start
+    print(f"{args.members} members, {matrix.encoded.shape[1]} features, top {k}, blocks of {args.chunk_size}\n")
+    print(f"{'encode profiles':<22}{encoded:>9.1f} s")
+
+    scoring = selecting = 0.0
+    start = time.perf_counter()
+    for _, similar, complementary in matrix.score_blocks(range(len(matrix)), args.chunk_size):
+        scored = time.perf_counter()
+        top_k(similar, k)
+        top_k(complementary, k)
+        selected = time.perf_counter()
+        scoring += scored - start
+        selecting += selected - scored
+        start = selected
+    print(f"{'score blocks':<22}{scoring:>9.1f} s")
+    print(f"{'select top k':<22}{selecting:>9.1f} s")
+    print(f"{'total':<22}{encoded + scoring + selecting:>9.1f} s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Member search benchmark.
+Builds the in-process search and typeahead indexes over synthetic members and reports
+build time, query and per-keystroke suggest latency percentiles and the cost of an
+incremental update.
+
+Usage: python benchmarks/search_benchmark.py [--members 10000] [--queries 2000]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from bson import ObjectId
+from backend.app.services.search_service import search_document, suggest_document, SUGGEST_LIMIT
+from backend.app.utils.search_index import SearchIndex, PrefixIndex, MEMBER_FIELD_WEIGHTS
+
+SECTORS = ['Technology', 'Finance', 'Healthcare', 'Energy', 'Retail', 'Agribusiness']
+TIERS = ['Disruption', 'Infinity', 'Sócio']
+TITLES = ['Founder', 'CEO', 'CTO', 'Partner', 'Investor', 'Director', 'Head of Sales']
+EXPERTISE = ['payments', 'fintech', 'logistics', 'marketing', 'data', 'cloud', 'agtech', 'biotech',
+             'real estate', 'mergers', 'private equity', 'growth', 'sales', 'branding', 'energy trading']
+FIRST = ['Ana', 'Bruno', 'Carla', 'Diego', 'Eduarda', 'Felipe', 'Gabriela', 'Henrique', 'Isabela', 'João']
+LAST = ['Souza', 'Lima', 'Dias', 'Pereira', 'Costa', 'Almeida', 'Rocha', 'Martins', 'Barbosa', 'Ribeiro']
+
+def documents(count):
+    rng = random.Random(count)
+    for i in range(count):
+        member = {
+            '_id': ObjectId(), 'user_type': 'member', 'name': f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+            'tier': rng.choice(TIERS), 'verified': rng.random() < 0.7, 'connections': rng.randint(0, 2000),
+        }
+        info = {
+            'company': f"{rng.choice(LAST)} {rng.choice(['Capital', 'Tech', 'Group', 'Labs'])} {i % 500}",
+            'sector': rng.choice(SECTORS), 'title': rng.choice(TITLES),
+            'expertise': rng.sample(EXPERTISE, 3),
+        }
+        yield member, info
+
+def percentile(samples, fraction):
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark member search')
+    parser.add_argument('--members', type=int, default=10000, help='Members in the index')
+    parser.add_argument('--queries', type=int, default=2000, help='Queries per scenario')
+    args = parser.parse_args()
+
+    pairs = list(documents(args.members))
+    docs = [search_document(*pair) for pair in pairs]
+    index = SearchIndex(MEMBER_FIELD_WEIGHTS)
+    start = time.perf_counter()
+    index.replace_all(docs)
+    print(f"indexed {args.members} members in {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    rng = random.Random(0)
+    scenarios = [
+        ('company', lambda: (rng.choice(LAST) + ' ' + rng.choice(['capital', 'labs']) + f" {rng.randrange(500)}", {})),
+        ('name', lambda: (f"{rng.choice(FIRST)} {rng.choice(LAST)}", {})),
+        ('common term', lambda: (rng.choice(EXPERTISE), {})),
+        ('term + filters', lambda: (rng.choice(TITLES), {'tier': rng.choice(TIERS), 'verified': True})),
+    ]
+    print(f"{'scenario':<18}{'p50 ms':>9}{'p99 ms':>9}{'matches':>10}")
+    for label, make in scenarios:
+        samples, matches = [], 0
+        for _ in range(args.queries):
+            query, filters = make()
+            start = time.perf_counter()
+            total, _ = index.search(query, filters, limit=20)
+            samples.append((time.perf_counter() - start) * 1000)
+            matches += total
+        samples.sort()
+        print(f"{label:<18}{percentile(samples, 0.5):>9.3f}{percentile(samples, 0.99):>9.3f}{matches // args.queries:>10}")
+
+    suggestions = PrefixIndex()
+    suggestions.replace_all(suggest_document(*pair) for pair in pairs)
+    samples = []
+    for _ in range(args.queries // 10):
+        # Type a name out one keystroke at a time
+        name = rng.choice(pairs)[0]['name']
+        for end in range(1, len(name) + 1):
+            start = time.perf_counter()
+            suggestions.suggest(name[:end], SUGGEST_LIMIT)
+            samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    print(f"{'suggest keystroke':<18}{percentile(samples, 0.5):>9.3f}{percentile(samples, 0.99):>9.3f}")
+
+    start = time.perf_counter()
+    for pair in pairs[:1000]:
+        index.upsert(*search_document(*pair))
+        suggestions.upsert(*suggest_document(*pair))
+    print(f"\nincremental update: {(time.perf_counter() - start) / 1000 * 1e6:.0f} µs per member")
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,79 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+def _int_env(name, default=None):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+def password_hash_workers(processes, worker_class, cores):
+    """Each server process's share of the box's bcrypt cores; 0 (inline) under gevent"""
+    if worker_class == 'gevent':
+        return 0
+    return max(1, cores // max(1, processes))
+
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'a-secret-key'
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET') or 'a-jwt-secret-key'
     MONGO_URI = os.environ.get('MONGODB_URI')
     OPENAI_KEY = os.environ.get('OPENAI_KEY')
+    OPENAI_API_BASE = os.environ.get('OPENAI_API_BASE')  # e.g. a local stub server; unset uses api.openai.com
+    OPENAI_TIMEOUT_SECONDS = _int_env('OPENAI_TIMEOUT_SECONDS', 60)
+    CHECK_INDEXES_ON_STARTUP = os.environ.get('CHECK_INDEXES_ON_STARTUP', 'false').lower() == 'true'
+    TOKEN_CACHE_SIZE = _int_env('TOKEN_CACHE_SIZE', 10000)  # 0 disables the verified-token cache
+    ACCESS_TOKEN_MINUTES = _int_env('ACCESS_TOKEN_MINUTES', 30)
+    REFRESH_TOKEN_DAYS = _int_env('REFRESH_TOKEN_DAYS', 30)
+    SHOWCASE_CACHE_TTL_SECONDS = _int_env('SHOWCASE_CACHE_TTL_SECONDS', 60)  # 0 disables the showcase cache
+    SHOWCASE_CACHE_STALE_SECONDS = _int_env('SHOWCASE_CACHE_STALE_SECONDS', 300)
+    # Response compression; an empty COMPRESS_ALGORITHMS disables it
+    COMPRESS_ALGORITHMS = [name.strip() for name in os.environ.get('COMPRESS_ALGORITHMS', 'br,gzip').split(',') if name.strip()]
+    COMPRESS_MIN_SIZE = _int_env('COMPRESS_MIN_SIZE', 1024)
+    COMPRESS_LEVEL = _int_env('COMPRESS_LEVEL', 6)
+    COMPRESS_BROTLI_QUALITY = _int_env('COMPRESS_BROTLI_QUALITY', 4)
+    COMPRESS_STREAM_FLUSH_BYTES = _int_env('COMPRESS_STREAM_FLUSH_BYTES', 65536)
+    GUEST_PRINCIPAL_TTL_SECONDS = _int_env('GUEST_PRINCIPAL_TTL_SECONDS', 300)
+    REVOCATION_SYNC_SECONDS = _int_env('REVOCATION_SYNC_SECONDS', 5)  # 0 keeps revocations local to the process
+    RECOMMENDATION_TOP_K = _int_env('RECOMMENDATION_TOP_K', 10)
+    RECOMMENDATION_CHUNK_SIZE = _int_env('RECOMMENDATION_CHUNK_SIZE', 256)  # rows scored per matrix block
+    RECOMMENDATION_MAX_FEATURES = _int_env('RECOMMENDATION_MAX_FEATURES', 512)
+    # Bulk description generation (manage.py generate-descriptions)
+    DESCRIPTION_CONCURRENCY = _int_env('DESCRIPTION_CONCURRENCY', 8)
+    DESCRIPTION_RATE_PER_MINUTE = _int_env('DESCRIPTION_RATE_PER_MINUTE', 60)  # 0 disables the rate limit
+    DESCRIPTION_MAX_ATTEMPTS = _int_env('DESCRIPTION_MAX_ATTEMPTS', 5)
+    SEARCH_INDEX_SYNC_SECONDS = _int_env('SEARCH_INDEX_SYNC_SECONDS', 30)  # 0 leaves other processes' writes to a restart
+    SERVER_PORT = _int_env('SERVER_PORT', 5002)
+    DEBUG = os.environ.get('DEBUG', 'false').lower() == 'true'
+
+    # Production server (gunicorn); worker count defaults to 2 * cores + 1
+    WEB_CONCURRENCY = _int_env('WEB_CONCURRENCY')
+    WEB_THREADS = _int_env('WEB_THREADS', 4)
+    WEB_WORKER_CLASS = os.environ.get('WEB_WORKER_CLASS', 'gthread')  # 'gthread' or 'gevent'
+    WEB_WORKER_CONNECTIONS = _int_env('WEB_WORKER_CONNECTIONS', 1000)
+    WEB_TIMEOUT = _int_env('WEB_TIMEOUT', 60)
+    WEB_GRACEFUL_TIMEOUT = _int_env('WEB_GRACEFUL_TIMEOUT', 30)
+    WEB_MAX_REQUESTS = _int_env('WEB_MAX_REQUESTS', 0)
+    # Pub/sub channel that carries Socket.IO emits between server processes, e.g. redis://localhost:6379/0.
+    # Without it a push only reaches sockets connected to the process that sent it.
+    SOCKETIO_MESSAGE_QUEUE = os.environ.get('SOCKETIO_MESSAGE_QUEUE')
+    SOCKETIO_CHANNEL = os.environ.get('SOCKETIO_CHANNEL', 'members-book')
+    SOCKETIO_ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE') or ('gevent' if WEB_WORKER_CLASS == 'gevent' else 'threading')
+
+    # Password hashing: bcrypt cost and the size of each server process's hashing pool.
+    # Every process gets its share of PASSWORD_HASH_CORES (default: all cores) split across
+    # the WEB_CONCURRENCY processes; gunicorn.conf.py redoes the split for the worker count it
+    # actually starts. 0 hashes inline, which is the default under gevent where process pools misbehave.
+    BCRYPT_ROUNDS = _int_env('BCRYPT_ROUNDS', 12)
+    PASSWORD_HASH_CORES = _int_env('PASSWORD_HASH_CORES', os.cpu_count() or 1)
+    PASSWORD_HASH_WORKERS = _int_env(
+        'PASSWORD_HASH_WORKERS', password_hash_workers(WEB_CONCURRENCY or 1, WEB_WORKER_CLASS, PASSWORD_HASH_CORES)
+    )
+    PASSWORD_HASH_QUEUE_FACTOR = _int_env('PASSWORD_HASH_QUEUE_FACTOR', 4)
+
+    # MongoDB connection pool (per process); unset values use the driver defaults
+    MONGO_MAX_POOL_SIZE = _int_env('MONGO_MAX_POOL_SIZE', 100)
+    MONGO_MIN_POOL_SIZE = _int_env('MONGO_MIN_POOL_SIZE', 0)
+    MONGO_MAX_IDLE_TIME_MS = _int_env('MONGO_MAX_IDLE_TIME_MS')
+    MONGO_WAIT_QUEUE_TIMEOUT_MS = _int_env('MONGO_WAIT_QUEUE_TIMEOUT_MS')
+    MONGO_SERVER_SELECTION_TIMEOUT_MS = _int_env('MONGO_SERVER_SELECTION_TIMEOUT_MS')
+    MONGO_CONNECT_TIMEOUT_MS = _int_env('MONGO_CONNECT_TIMEOUT_MS')
+    MONGO_SOCKET_TIMEOUT_MS = _int_env('MONGO_SOCKET_TIMEOUT_MS')
+    MONGO_COMPRESSORS = os.environ.get('MONGO_COMPRESSORS')  # e.g. "zstd,snappy,zlib"
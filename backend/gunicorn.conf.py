@@ -0,0 +1,74 @@
+"""
+Gunicorn settings for the production server.
+Used by `python start_server.py --production` and `python manage.py runserver --production`;
+every value can be overridden with the environment variables read by Config.
+"""
+
+import multiprocessing
+import os
+import sys
+
+# Cooperative workers must patch the standard library before the preloaded app imports it
+if os.environ.get('WEB_WORKER_CLASS') == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
+# Make both the project root and the backend directory importable
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+sys.path.insert(0, os.path.dirname(backend_dir))
+
+from backend.config import Config, password_hash_workers
+
+wsgi_app = "backend.app.main:app"
+
+# Socket.IO pushes only cross worker processes through a message queue, so without
+# one the server defaults to a single worker and refuses to start with more
+workers = Config.WEB_CONCURRENCY or (multiprocessing.cpu_count() * 2 + 1 if Config.SOCKETIO_MESSAGE_QUEUE else 1)
+# The plain gevent worker cannot upgrade to WebSocket, which would leave Socket.IO on long-polling
+worker_class = (
+    "geventwebsocket.gunicorn.workers.GeventWebSocketWorker" if Config.WEB_WORKER_CLASS == 'gevent'
+    else Config.WEB_WORKER_CLASS
+)
+threads = Config.WEB_THREADS
+worker_connections = Config.WEB_WORKER_CONNECTIONS
+
+# Load the app once in the master and fork it into every worker
+preload_app = True
+
+timeout = Config.WEB_TIMEOUT
+graceful_timeout = Config.WEB_GRACEFUL_TIMEOUT
+keepalive = 5
+
+# Recycle workers periodically; jitter keeps them from restarting together
+max_requests = Config.WEB_MAX_REQUESTS
+max_requests_jitter = max_requests // 10 if max_requests else 0
+
+accesslog = "-"
+errorlog = "-"
+
+def on_starting(server):
+    if server.cfg.workers > 1 and not Config.SOCKETIO_MESSAGE_QUEUE:
+        raise RuntimeError(
+            f"{server.cfg.workers} workers need SOCKETIO_MESSAGE_QUEUE (e.g. redis://localhost:6379/0) "
+            "to deliver Socket.IO pushes between them; set it or run a single worker"
+        )
+    if not os.environ.get('PASSWORD_HASH_WORKERS'):
+        # Split the box's bcrypt budget across the workers instead of giving each one a pool per core
+        Config.PASSWORD_HASH_WORKERS = password_hash_workers(
+            server.cfg.workers, Config.WEB_WORKER_CLASS, Config.PASSWORD_HASH_CORES
+        )
+
+def when_ready(server):
+    server.log.info(f"Serving {wsgi_app} with {server.cfg.workers} {server.cfg.worker_class_str} workers")
+    # Build the search and typeahead indexes once; forked workers share them copy-on-write
+    from backend.app.services import search_service
+    search_service.warm()
+
+def post_fork(server, worker):
+    # Every worker opens its own MongoDB pool on first use
+    from backend.app.utils.database import reset_client
+    reset_client()
+
+def worker_int(worker):
+    worker.log.info(f"Worker {worker.pid} interrupted; finishing in-flight requests")
@@ -1,10 +1,12 @@
 import os
 import sys
+import click
 from flask.cli import FlaskGroup
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from backend.app.main import app
+from backend.app.utils.realtime import socketio
 from backend.seed import seed_users
 from backend.config import Config
 
@@ -22,13 +24,102 @@ def seed():
     """Seeds the database with initial data."""
     seed_users()
 
+@cli.command("ensure-indexes")
+def ensure_indexes():
+    """Creates every index declared in the index registry."""
+    from backend.app.utils.database import db
+    from backend.app.utils.indexes import ensure_indexes as create_indexes
+    for collection_name, index_names in create_indexes(db).items():
+        print(f"{collection_name}: {', '.join(index_names)}")
+
+@cli.command("backfill-conversations")
+def backfill_conversations():
+    """Sets conversation_id on messages stored before it existed."""
+    from backend.app.services.message_service import backfill_conversation_ids
+    print(f"Updated {backfill_conversation_ids()} messages.")
+
+@cli.command("rebuild-unread-counters")
+def rebuild_unread_counters():
+    """Recounts the unread_counters collection from the unread messages."""
+    from backend.app.services.message_service import rebuild_unread_counters
+    print(f"Rebuilt unread counters for {rebuild_unread_counters()} users.")
+
+@cli.command("rebuild-segments")
+def rebuild_segments():
+    """Recounts the segments collection from the members collection."""
+    from backend.app.services.segment_service import rebuild_segments as recount
+    counts = recount()
+    print(f"Rebuilt {len(counts)} segments ({sum(counts.values())} members).")
+
+@cli.command("recommend")
+@click.option("--full", is_flag=True, help="Recompute every member instead of only changed profiles.")
+def recommend(full):
+    """Recomputes member-to-member recommendations into ai_recommendations."""
+    from backend.app.services import recommendation_service
+    bar = None
+
+    def progress(done, total):
+        nonlocal bar
+        if bar is None:
+            bar = click.progressbar(length=total, label="Recommending")
+            bar.__enter__()
+        bar.update(done)
+
+    stats = recommendation_service.run(full=full, progress=progress)
+    if bar is not None:
+        bar.__exit__(None, None, None)
+    print(f"Recomputed {stats['recomputed']} of {stats['members']} members "
+          f"({stats['recommendations']} recommendations, {stats['removed']} removed members).")
+
+@cli.command("generate-descriptions")
+@click.option("--concurrency", type=int, help="Concurrent OpenAI requests (defaults to DESCRIPTION_CONCURRENCY).")
+@click.option("--missing-only", is_flag=True, help="Only members without any description (new jobs only).")
+@click.option("--restart", is_flag=True, help="Start a new job instead of resuming an unfinished one.")
+def generate_descriptions(concurrency, missing_only, restart):
+    """Generates member descriptions with OpenAI, resuming an interrupted run."""
+    from backend.app.services import description_backfill_service
+    bar = None
+
+    def progress(done, total):
+        nonlocal bar
+        if bar is None:
+            bar = click.progressbar(length=total, label="Generating descriptions")
+            bar.__enter__()
+        bar.update(done)
+
+    try:
+        stats = description_backfill_service.run(
+            concurrency=concurrency, restart=restart, missing_only=missing_only, progress=progress
+        )
+    finally:
+        if bar is not None:
+            bar.__exit__(None, None, None)
+    print(f"Job {stats['job_id']}: {stats['completed']} generated, {stats['skipped']} without member info, "
+          f"{stats['failed']} failed, of {stats['pending']} pending members.")
+
+@cli.command("bump-versions")
+@click.argument("collections", nargs=-1, required=True)
+def bump_versions(collections):
+    """Invalidates ETags of the given collections after edits made outside the services."""
+    from backend.app.utils.change_versions import bump
+    bump(*collections)
+    print(f"Bumped {', '.join(collections)}.")
+
 @cli.command("runserver")
-def runserver():
-    """Run the Flask development server."""
+@click.option("--production", is_flag=True, help="Run under gunicorn with multiple workers.")
+@click.option("--workers", type=int, help="Number of worker processes (production only).")
+@click.option("--threads", type=int, help="Threads per worker (production only).")
+@click.option("--worker-class", type=click.Choice(["gthread", "gevent"]), help="Worker class (production only).")
+def runserver(production, workers, threads, worker_class):
+    """Run the Flask development server, or gunicorn with --production."""
     config = Config()
     host = "0.0.0.0"
     port = config.SERVER_PORT
     debug = config.DEBUG
+
+    if production:
+        from backend.start_server import run_production
+        run_production(host, port, workers, threads, worker_class)
     
     print(f"\n=== Starting Flask Server via manage.py ===")
     print(f"Host: {host}")
@@ -37,7 +128,7 @@ def runserver():
     print(f"Server URL: http://{host}:{port}")
     print(f"==========================================\n")
     
-    app.run(debug=debug, host=host, port=port)
+    socketio.run(app, debug=debug, host=host, port=port, allow_unsafe_werkzeug=True)
 
 if __name__ == "__main__":
     cli()
\ No newline at end of file
@@ -5,12 +5,12 @@ import os
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
-import bcrypt
 from backend.app.utils.database import members_collection, members_info_collection, value_requests_collection
 from backend.app.models.member import Member
 from backend.app.models.member_info import MemberInfo
 from backend.app.models.value_request import ValueRequest, RequestType, RequestStatus
-from backend.app.services import ai_description_service
+from backend.app.services import description_backfill_service
+from backend.app.utils.passwords import hash_password
 from datetime import datetime
 from bson import ObjectId
 
@@ -44,12 +44,12 @@ def seed_users():
     for user_data in users_to_seed:
         existing_user = members_collection.find_one({"email": user_data["email"]})
         
-        hashed_password = bcrypt.hashpw(user_data['password'].encode('utf-8'), bcrypt.gensalt())
+        hashed_password = hash_password(user_data['password'])
         
         new_user_doc = {
             "name": user_data['name'],
             "email": user_data['email'],
-            "password_hash": hashed_password.decode('utf-8'),
+            "password_hash": hashed_password,
             "password_plain": user_data['password'],  # Store plain text password for development
             "tier": user_data['tier'],
             "contact_info": {}, # Keep empty for now
@@ -148,10 +148,8 @@ def seed_value_requests():
 
 def generate_descriptions_for_all_users():
     print("Generating descriptions for all users...")
-    members = list(members_collection.find())
-    for member in members:
-        print(f"Generating description for {member['email']}...")
-        ai_description_service.generate_description(str(member["_id"]))
+    stats = description_backfill_service.run()
+    print(f"Generated {stats['completed']} descriptions ({stats['failed']} failed).")
 
 if __name__ == '__main__':
     seed_users()
@@ -7,8 +7,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from pymongo import MongoClient
-from config import Config
+from app.utils.database import members_collection
 import bcrypt
 
 def debug_database_users():
@@ -16,11 +15,6 @@ def debug_database_users():
     print("=== DATABASE USERS DEBUG ===")
     
     try:
-        # Connect to database
-        client = MongoClient(Config.MONGO_URI)
-        db = client.get_database("Cluster0-Members-book")
-        members_collection = db.get_collection("members")
-        
         # Get all users from database
         users = list(members_collection.find({}))
         print(f"Total users found: {len(users)}")
@@ -47,11 +41,6 @@ def test_admin_login():
     print("\n=== ADMIN LOGIN TEST ===")
     
     try:
-        # Connect to database
-        client = MongoClient(Config.MONGO_URI)
-        db = client.get_database("Cluster0-Members-book")
-        members_collection = db.get_collection("members")
-        
         # Find admin user
         admin_user = members_collection.find_one({"email": "admin@test.com"})
         if admin_user:
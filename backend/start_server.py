@@ -11,22 +11,54 @@ import argparse
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from backend.app.main import app
 from backend.config import Config
 
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+GUNICORN_CONFIG = os.path.join(BACKEND_DIR, 'gunicorn.conf.py')
+
+def run_production(host, port, workers=None, threads=None, worker_class=None):
+    """Run backend.app.main:app under gunicorn, replacing the current process"""
+    command = [
+        sys.executable, '-m', 'gunicorn',
+        '--config', GUNICORN_CONFIG,
+        '--chdir', os.path.dirname(BACKEND_DIR),
+        '--bind', f'{host}:{port}',
+    ]
+    if workers:
+        command += ['--workers', str(workers)]
+    if threads:
+        command += ['--threads', str(threads)]
+    if worker_class:
+        # Read by gunicorn.conf.py, which patches for gevent before the app is preloaded
+        os.environ['WEB_WORKER_CLASS'] = worker_class
+
+    print(f"\n=== Starting Production Server ===")
+    print(f"Bind: {host}:{port}")
+    print(f"Graceful restart: kill -HUP <master pid>")
+    print(f"==================================\n")
+    sys.stdout.flush()
+    os.execv(sys.executable, command)
+
 def main():
     parser = argparse.ArgumentParser(description='Start the Flask server')
     parser.add_argument('--host', type=str, default='0.0.0.0', help='Host IP address')
     parser.add_argument('--port', type=int, help='Override port number')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     parser.add_argument('--no-debug', action='store_true', help='Disable debug mode')
+    parser.add_argument('--production', action='store_true', help='Run under gunicorn with multiple workers')
+    parser.add_argument('--workers', type=int, help='Number of worker processes (production only)')
+    parser.add_argument('--threads', type=int, help='Threads per worker (production only)')
+    parser.add_argument('--worker-class', choices=['gthread', 'gevent'], help='Worker class (production only)')
     
     args = parser.parse_args()
     
     config = Config()
     
     host = args.host
-    port = args.port if args.port else 5002
+    port = args.port if args.port else config.SERVER_PORT
+
+    if args.production:
+        run_production(host, port, args.workers, args.threads, args.worker_class)
     
     if args.debug:
         debug = True
@@ -42,8 +74,11 @@ def main():
     print(f"Server URL: http://{host}:{port}")
     print(f"================================\n")
     
+    from backend.app.main import app
+    from backend.app.utils.realtime import socketio
+
     try:
-        app.run(debug=debug, host=host, port=port)
+        socketio.run(app, debug=debug, host=host, port=port, allow_unsafe_werkzeug=True)
     except KeyboardInterrupt:
         print("\n\nServer stopped by user.")
     except Exception as e:
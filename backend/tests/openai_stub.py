@@ -0,0 +1,130 @@
+"""
+Local stand-in for the OpenAI chat completions endpoint.
+
+Point OPENAI_API_BASE at it (http://127.0.0.1:<port>/v1) to run description
+backfills without an API key or cost:
+
+    python -m backend.tests.openai_stub --port 8089 --latency 0.5 --reject-every 10
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class OpenAIStub:
+    """
+    Answers POST /v1/chat/completions after latency seconds. The first
+    reject_first requests, and every reject_every-th one, get a 429 with a
+    Retry-After header instead.
+    """
+
+    def __init__(self, port=0, latency=0.0, reject_first=0, reject_every=0, retry_after=0):
+        self.latency = latency
+        self.reject_first = reject_first
+        self.reject_every = reject_every
+        self.retry_after = retry_after
+        self.requests = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="openai-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _admit(self):
+        """Count a request and decide whether it is rate limited"""
+        with self._lock:
+            self.requests += 1
+            rejected = self.requests <= self.reject_first or (
+                self.reject_every and self.requests % self.reject_every == 0
+            )
+            if rejected:
+                self.rejected += 1
+            else:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            return not rejected
+
+    def _done(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b"{}")
+                if self.path.rstrip("/") != "/v1/chat/completions":
+                    return self._send(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+                if not stub._admit():
+                    return self._send(
+                        429, {"error": {"message": "Rate limit reached", "type": "requests"}},
+                        {"Retry-After": str(stub.retry_after)}
+                    )
+                try:
+                    time.sleep(stub.latency)
+                    prompt = body.get('messages', [{}])[-1].get('content', "")
+                    name = re.search(r"- Nome: (.*)", prompt)
+                    self._send(200, {
+                        "id": f"chatcmpl-stub-{stub.requests}",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": body.get('model'),
+                        "choices": [{
+                            "index": 0,
+                            "message": {"role": "assistant", "content": f"Bio de {name.group(1) if name else 'membro'}."},
+                            "finish_reason": "stop"
+                        }],
+                        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+                    })
+                finally:
+                    stub._done()
+
+            def _send(self, status, payload, headers=None):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a local OpenAI chat completions stub")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before each completion is returned")
+    parser.add_argument("--reject-every", type=int, default=0, help="Answer every Nth request with a 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+    args = parser.parse_args()
+    stub = OpenAIStub(args.port, args.latency, reject_every=args.reject_every, retry_after=args.retry_after)
+    print(f"OpenAI stub listening on {stub.url}")
+    stub.server.serve_forever()
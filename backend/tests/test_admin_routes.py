@@ -59,6 +59,25 @@ def test_route_imports():
     
     print("\nRoute import test completed.")
 
+def test_users_ndjson_export():
+    """Test that the NDJSON export yields one JSON line per member without secrets"""
+    import json
+    from unittest.mock import patch
+    from bson import ObjectId
+
+    user_id = ObjectId()
+    with patch('backend.app.services.admin_service.members_collection') as mock_collection:
+        mock_collection.find.return_value.batch_size.return_value = iter([
+            {'_id': user_id, 'name': 'Jane Doe', 'email': 'jane@example.com'}
+        ])
+        lines = list(admin_service.iter_users_ndjson(batch_size=10))
+
+    projection = mock_collection.find.call_args[0][1]
+    assert projection == {"password_hash": 0, "password_plain": 0}
+    mock_collection.find.return_value.batch_size.assert_called_once_with(10)
+    assert len(lines) == 1 and lines[0].endswith(b"\n")
+    assert json.loads(lines[0]) == {'_id': str(user_id), 'name': 'Jane Doe', 'email': 'jane@example.com'}
+
 if __name__ == "__main__":
     print("=== Admin Routes Test ===")
     test_admin_service_methods()
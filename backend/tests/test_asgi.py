@@ -0,0 +1,41 @@
+import jwt
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from bson import ObjectId
+from starlette.testclient import TestClient
+from backend.app.asgi import app
+from backend.config import Config
+
+def make_token(public_id, role):
+    return jwt.encode({
+        'public_id': public_id,
+        'role': role,
+        'exp': datetime.utcnow() + timedelta(minutes=5)
+    }, Config.JWT_SECRET_KEY, algorithm="HS256")
+
+client = TestClient(app)
+
+def test_async_members_page():
+    member_id = ObjectId()
+    with patch('backend.app.services.async_read_service.get_async_collection') as mock_collection:
+        mock_collection.return_value.find.return_value.to_list = AsyncMock(return_value=[])
+        cursor = mock_collection.return_value.find.return_value.sort.return_value.limit.return_value
+        cursor.to_list = AsyncMock(return_value=[{'_id': member_id, 'name': 'Jane Doe'}])
+        rv = client.get('/api/members/?limit=10', headers={'x-access-token': make_token('guest', 'guest')})
+
+    assert rv.status_code == 200
+    assert rv.json() == {'members': [{'_id': str(member_id), 'name': 'Jane Doe'}], 'next_cursor': None}
+    mock_collection.assert_called_with('members')
+
+@patch('backend.app.services.async_read_service.current_versions', AsyncMock(return_value={}))
+def test_async_routes_enforce_auth_and_roles():
+    assert client.get('/api/members/').status_code == 401
+    rv = client.get('/api/value-requests/', headers={'x-access-token': make_token('member', 'member')})
+    assert rv.status_code == 403
+    rv = client.get('/api/members/?after=not-a-cursor', headers={'x-access-token': make_token('guest', 'guest')})
+    assert rv.status_code == 400
+
+def test_other_routes_fall_through_to_flask():
+    rv = client.post('/api/auth/refresh')
+    assert rv.status_code == 401
+    assert rv.json()['error'] == 'Refresh token is missing'
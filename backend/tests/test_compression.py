@@ -0,0 +1,78 @@
+import gzip
+import json
+import brotli
+import jwt
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from bson import ObjectId
+from flask import Response
+from starlette.testclient import TestClient
+from backend.app.asgi import app as asgi_app
+from backend.app.main import app
+from backend.app.utils import compression
+from backend.config import Config
+
+def make_token(role):
+    return jwt.encode({
+        'public_id': str(ObjectId()),
+        'role': role,
+        'exp': datetime.utcnow() + timedelta(minutes=5)
+    }, Config.JWT_SECRET_KEY, algorithm="HS256")
+
+def test_negotiation_honours_quality_values():
+    assert compression.negotiate('gzip, deflate, br') == 'br'
+    assert compression.negotiate('br;q=0.5, gzip') == 'gzip'
+    assert compression.negotiate('gzip;q=0, br;q=0') is None
+    assert compression.negotiate('identity') is None
+    assert compression.negotiate(None) is None
+    with patch.object(Config, 'COMPRESS_ALGORITHMS', []):
+        assert compression.negotiate('gzip') is None
+
+@patch('backend.app.utils.database.collection_versions_collection')
+@patch('backend.app.services.form_service.forms_collection')
+def test_large_json_is_compressed_and_small_json_is_not(mock_forms, mock_versions):
+    mock_versions.find.return_value = []
+    forms = [{'_id': ObjectId(), 'name': f'Form {i}', 'description': 'Member onboarding form'} for i in range(100)]
+    headers = {'x-access-token': make_token('admin'), 'Accept-Encoding': 'gzip'}
+
+    with app.test_client() as client:
+        mock_forms.find.return_value = forms
+        rv = client.get('/api/admin/forms/', headers=headers)
+        assert rv.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in rv.headers['Vary']
+        assert int(rv.headers['Content-Length']) == len(rv.data)
+        assert len(json.loads(gzip.decompress(rv.data))) == 100
+
+        mock_forms.find.return_value = forms[:1]
+        rv = client.get('/api/admin/forms/', headers=headers)
+        assert 'Content-Encoding' not in rv.headers
+        assert len(rv.get_json()) == 1
+
+def test_streamed_response_is_compressed_incrementally():
+    lines = [json.dumps({'_id': str(ObjectId()), 'name': 'Jane Doe'}) + '\n' for _ in range(500)]
+    response = Response(iter(lines), mimetype='application/x-ndjson')
+
+    with patch.object(Config, 'COMPRESS_STREAM_FLUSH_BYTES', 4096):
+        compression.compress_response(response, 'br')
+        chunks = [chunk for chunk in response.response if chunk]
+
+    assert response.headers['Content-Encoding'] == 'br'
+    assert 'Content-Length' not in response.headers
+    # Periodic flushes emit data before the stream ends
+    assert len(chunks) > 2
+    assert brotli.decompress(b''.join(chunks)).decode('utf-8') == ''.join(lines)
+
+def test_asgi_routes_are_compressed():
+    members = [{'_id': ObjectId(), 'name': f'Member {i}', 'company': 'Acme'} for i in range(100)]
+    client = TestClient(asgi_app)
+    with patch('backend.app.services.async_read_service.current_versions', AsyncMock(return_value={})), \
+            patch('backend.app.services.async_read_service.get_async_collection') as mock_collection:
+        cursor = mock_collection.return_value.find.return_value.sort.return_value.limit.return_value
+        cursor.to_list = AsyncMock(return_value=members)
+        rv = client.get('/api/members/?limit=200', headers={
+            'x-access-token': make_token('guest'), 'Accept-Encoding': 'br'
+        })
+
+    assert rv.status_code == 200
+    assert rv.headers['content-encoding'] == 'br'
+    assert len(rv.json()['members']) == 100
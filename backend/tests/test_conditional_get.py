@@ -0,0 +1,66 @@
+import jwt
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from bson import ObjectId
+from starlette.testclient import TestClient
+from werkzeug.http import http_date
+from backend.app.asgi import app as asgi_app
+from backend.app.main import app
+from backend.app.utils import change_versions
+from backend.config import Config
+
+UPDATED_AT = datetime(2024, 5, 1, 12, 0, 0, 500000)
+
+def make_token(role):
+    return jwt.encode({
+        'public_id': str(ObjectId()),
+        'role': role,
+        'exp': datetime.utcnow() + timedelta(minutes=5)
+    }, Config.JWT_SECRET_KEY, algorithm="HS256")
+
+def test_validators_follow_collection_versions():
+    etag, last_modified = change_versions.validators({'forms': (3, UPDATED_AT)}, '/api/forms/?')
+    assert change_versions.validators({'forms': (3, UPDATED_AT)}, '/api/forms/?')[0] == etag
+    assert change_versions.validators({'forms': (4, UPDATED_AT)}, '/api/forms/?')[0] != etag
+    assert change_versions.validators({'forms': (3, UPDATED_AT)}, '/api/forms/?limit=1')[0] != etag
+
+    assert change_versions.not_modified(etag, last_modified, f'W/"{etag}"', None)
+    assert not change_versions.not_modified(etag, last_modified, '"other"', http_date(last_modified))
+    assert change_versions.not_modified(etag, last_modified, None, http_date(last_modified))
+    assert not change_versions.not_modified(etag, last_modified, None, http_date(UPDATED_AT - timedelta(seconds=1)))
+
+@patch('backend.app.utils.database.collection_versions_collection')
+@patch('backend.app.services.form_service.forms_collection')
+def test_unchanged_forms_get_304_without_running_the_view(mock_forms, mock_versions):
+    mock_versions.find.return_value = [{'_id': 'forms', 'version': 3, 'updated_at': UPDATED_AT}]
+    mock_forms.find.return_value = [{'_id': ObjectId(), 'name': 'Onboarding'}]
+    headers = {'x-access-token': make_token('admin')}
+
+    with app.test_client() as client:
+        rv = client.get('/api/admin/forms/', headers=headers)
+        assert rv.status_code == 200
+        etag = rv.headers['ETag']
+        assert etag.startswith('W/"') and rv.headers['Last-Modified'] == http_date(UPDATED_AT)
+
+        rv = client.get('/api/admin/forms/', headers={**headers, 'If-None-Match': etag})
+        assert rv.status_code == 304 and rv.data == b''
+        assert mock_forms.find.call_count == 1
+
+        mock_versions.find.return_value = [{'_id': 'forms', 'version': 4, 'updated_at': UPDATED_AT}]
+        rv = client.get('/api/admin/forms/', headers={**headers, 'If-None-Match': etag})
+        assert rv.status_code == 200 and rv.headers['ETag'] != etag
+
+def test_async_members_page_304_matches_flask_validators():
+    versions = {'members': (7, UPDATED_AT)}
+    etag, _ = change_versions.validators(versions, '/api/members/?limit=10')
+    client = TestClient(asgi_app)
+
+    with patch('backend.app.services.async_read_service.current_versions', AsyncMock(return_value=versions)), \
+            patch('backend.app.services.async_read_service.get_async_collection') as mock_collection:
+        rv = client.get('/api/members/?limit=10', headers={
+            'x-access-token': make_token('guest'), 'If-None-Match': f'W/"{etag}"'
+        })
+
+    assert rv.status_code == 304
+    assert rv.headers['etag'] == f'W/"{etag}"'
+    mock_collection.assert_not_called()
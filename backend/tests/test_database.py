@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+from backend.app.utils import database
+
+def test_client_options_come_from_config():
+    with patch.object(database.Config, 'MONGO_MAX_POOL_SIZE', 20), \
+            patch.object(database.Config, 'MONGO_WAIT_QUEUE_TIMEOUT_MS', 500), \
+            patch.object(database.Config, 'MONGO_COMPRESSORS', 'zlib'):
+        options = database.client_options()
+    assert options['maxPoolSize'] == 20
+    assert options['waitQueueTimeoutMS'] == 500
+    assert options['compressors'] == 'zlib'
+    assert 'socketTimeoutMS' not in options
+
+@patch.dict('backend.app.utils.database._pool_listeners', clear=True)
+def test_client_is_lazy_per_process():
+    database.reset_client()
+    assert database.pool_stats()['client_created'] is False
+
+    with patch('backend.app.utils.database.MongoClient') as mock_client:
+        first = database.get_client()
+        assert database.get_client() is first
+        assert mock_client.call_count == 1
+        assert database.pool_stats()['client_created'] is True
+        assert database.pool_stats()['checked_out'] == 0
+
+        # A forked worker sees a different pid and builds its own client
+        with patch('backend.app.utils.database.os.getpid', return_value=-1):
+            database.get_client()
+        assert mock_client.call_count == 2
+
+    database.reset_client()
+
+def test_collections_resolve_lazily():
+    with patch('backend.app.utils.database.get_db') as mock_db:
+        database.members_collection.find_one({'email': 'someone@example.com'})
+    mock_db.return_value.get_collection.assert_called_with('members')
+    assert database.members_collection.name == 'members'
+
+@patch.dict('backend.app.utils.database._pool_listeners', clear=True)
+def test_pool_stats_cover_every_client_of_the_process():
+    database.pool_listener("pymongo").connection_created(None)
+    motor = database.pool_listener("motor")
+    motor.connection_created(None)
+    motor.connection_checked_out(None)
+
+    stats = database.pool_stats()
+
+    assert stats['connections_created'] == 2 and stats['checked_out'] == 1
+    assert stats['clients']['motor']['checked_out'] == 1
+    assert stats['clients']['pymongo']['connections_created'] == 1
+
+def test_app_loads_a_single_copy_of_the_database_module():
+    # Importing app.* next to backend.app.* would give the process a second client and pool
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = (
+        "import sys; import backend.app.main, backend.app.asgi; "
+        "print(sorted(name for name in sys.modules if name in ('app', 'config') or name.startswith('app.')))"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([os.path.dirname(backend_dir), backend_dir])}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,130 @@
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+import openai
+import pytest
+from bson import ObjectId
+from backend.app.services import description_backfill_service
+from backend.app.services.description_backfill_service import pending_query, generate_all
+from backend.app.utils.rate_limit import TokenBucket, retry_with_backoff
+from backend.tests.openai_stub import OpenAIStub
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+def test_token_bucket_allows_a_burst_then_paces_to_the_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.now == 0
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.now == pytest.approx(1.0)
+
+def test_retry_with_backoff_honours_retry_after_and_gives_up():
+    delays = []
+    error = openai.error.RateLimitError("slow down", headers={"retry-after": "7"})
+    calls = iter([error, error, "bio"])
+
+    def call():
+        result = next(calls)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert retry_with_backoff(call, (openai.error.RateLimitError,), 3, 0.01, 1.0, sleep=delays.append) == "bio"
+    assert delays == [7.0, 7.0]
+
+    with pytest.raises(openai.error.RateLimitError):
+        retry_with_backoff(lambda: (_ for _ in ()).throw(error), (openai.error.RateLimitError,), 2, sleep=delays.append)
+    with pytest.raises(openai.error.AuthenticationError):
+        retry_with_backoff(
+            lambda: (_ for _ in ()).throw(openai.error.AuthenticationError("bad key")),
+            description_backfill_service.RETRYABLE_ERRORS, 5, sleep=delays.append
+        )
+
+def test_pending_query_skips_members_done_by_the_job():
+    started_at = datetime(2024, 1, 1)
+    query = pending_query({"started_at": started_at, "missing_only": True})
+    assert query['description_generated_at'] == {"$not": {"$gte": started_at}}
+    assert query['description'] == {"$in": [None, ""]}
+
+def test_generate_all_reports_every_result_and_error():
+    results = {}
+
+    def work(user_id):
+        if user_id == 3:
+            raise ValueError("boom")
+        return user_id * 2
+
+    generate_all(range(10), work, 3, lambda user_id, result, error: results.__setitem__(user_id, (result, error)))
+    assert sorted(results) == list(range(10))
+    assert results[4] == (8, None)
+    assert isinstance(results[3][1], ValueError)
+
+@pytest.fixture
+def stub():
+    previous = openai.api_key, openai.api_base
+    with OpenAIStub(latency=0.05, reject_first=2) as server:
+        openai.api_key, openai.api_base = "test", server.url
+        yield server
+    openai.api_key, openai.api_base = previous
+
+@patch('backend.app.utils.database.collection_versions_collection')
+@patch('backend.config.Config.DESCRIPTION_RATE_PER_MINUTE', 6000)
+@patch('backend.app.services.description_backfill_service.RETRY_BASE_DELAY', 0.01)
+@patch('backend.app.services.description_backfill_service.description_jobs_collection')
+@patch('backend.app.services.ai_description_service.members_collection')
+@patch('backend.app.services.description_backfill_service.members_info_collection')
+@patch('backend.app.services.description_backfill_service.members_collection')
+def test_run_generates_descriptions_concurrently_against_the_stub(
+    mock_members, mock_infos, mock_saved, mock_jobs, mock_versions, stub
+):
+    member_ids = [ObjectId() for _ in range(12)]
+    mock_members.find.return_value = [{'_id': member_id} for member_id in member_ids]
+    infos = {str(member_id): {'user_id': str(member_id), 'name': f"Membro {index}"} for index, member_id in enumerate(member_ids)}
+    infos.pop(str(member_ids[0]))
+    mock_infos.find_one.side_effect = lambda query: infos.get(query['user_id'])
+    mock_jobs.find_one.return_value = None
+    mock_jobs.insert_one.return_value = MagicMock(inserted_id='job-1')
+    shown = {'verified': True, 'public_profile': True}
+    mock_saved.find_one_and_update.side_effect = lambda query, update, projection: shown if query['_id'] == member_ids[5] else {}
+    progress = []
+
+    stats = description_backfill_service.run(concurrency=4, progress=lambda done, total: progress.append(total))
+
+    assert stats == {"job_id": "job-1", "pending": 12, "completed": 11, "skipped": 1, "failed": 0}
+    assert len(progress) == 12
+    # The two rate-limited requests were retried
+    assert stub.rejected == 2 and stub.requests == 13
+    assert 1 < stub.max_in_flight <= 4
+    saved = {call[0][0]['_id']: call[0][1]['$set'] for call in mock_saved.find_one_and_update.call_args_list}
+    assert saved[member_ids[5]]['description'] == "Bio de Membro 5."
+    assert isinstance(saved[member_ids[5]]['description_generated_at'], datetime)
+    assert member_ids[0] not in saved
+    checkpoint = mock_jobs.update_one.call_args_list[0][0][1]
+    assert checkpoint['$inc'] == {"completed": 11, "skipped": 1}
+    assert mock_jobs.update_one.call_args_list[-1][0][1]['$set']['finished_at']
+    # One showcased member changed, so guests' showcases are invalidated once along with the members bump
+    bumped = [op._filter['_id'] for call in mock_versions.bulk_write.call_args_list for op in call[0][0]]
+    assert sorted(bumped) == ['members', 'showcases']
+
+@patch('backend.app.services.description_backfill_service.description_jobs_collection')
+@patch('backend.app.services.description_backfill_service.members_collection')
+def test_run_resumes_the_unfinished_job(mock_members, mock_jobs):
+    started_at = datetime(2024, 1, 1)
+    mock_jobs.find_one.return_value = {'_id': 'job-1', 'started_at': started_at, 'missing_only': False}
+    mock_members.find.return_value = []
+
+    stats = description_backfill_service.run()
+
+    assert stats['job_id'] == 'job-1' and stats['pending'] == 0
+    mock_jobs.insert_one.assert_not_called()
+    assert mock_members.find.call_args[0][0]['description_generated_at'] == {"$not": {"$gte": started_at}}
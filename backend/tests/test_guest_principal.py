@@ -0,0 +1,40 @@
+from unittest.mock import patch
+from bson import ObjectId
+from backend.app.services import admin_service, auth_service
+from backend.app.utils.guest_principal import guest_principal
+from backend.app.utils.security import decode_token
+
+@patch('backend.app.utils.guest_principal.database.members_collection')
+def test_guest_login_queries_once_per_process(mock_collection):
+    guest_id = ObjectId()
+    mock_collection.find_one.return_value = {'_id': guest_id}
+    guest_principal.invalidate()
+
+    tokens = [auth_service.guest_login()[0]['access_token'] for _ in range(5)]
+
+    assert mock_collection.find_one.call_count == 1
+    assert decode_token(tokens[-1]) == {'public_id': str(guest_id), 'role': 'guest'}
+
+@patch('backend.app.utils.guest_principal.database.members_collection')
+def test_missing_guest_account_is_not_cached(mock_collection):
+    mock_collection.find_one.return_value = None
+    guest_principal.invalidate()
+
+    assert auth_service.guest_login()[1] == 404
+    assert auth_service.guest_login()[1] == 404
+    assert mock_collection.find_one.call_count == 2
+
+@patch('backend.app.utils.database.collection_versions_collection')
+@patch('backend.app.services.auth_service.refresh_tokens_collection')
+@patch('backend.app.services.admin_service.members_collection')
+@patch('backend.app.services.admin_service.get_member_loader')
+def test_admin_change_to_guest_account_reloads_principal(mock_loader, mock_members, mock_refresh_tokens, mock_versions):
+    guest_id = ObjectId()
+    guest_principal.prime(str(guest_id))
+    mock_loader.return_value.load.return_value = {'_id': guest_id, 'email': 'guest@test.com', 'user_type': 'guest'}
+    mock_members.update_one.return_value.modified_count = 1
+
+    assert admin_service.update_user(str(guest_id), {'user_type': 'member'})[1] == 200
+
+    assert not guest_principal._fresh()
+    mock_refresh_tokens.delete_many.assert_called_once_with({'user_id': str(guest_id)})
@@ -0,0 +1,39 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+from bson import ObjectId, Decimal128
+from flask import jsonify
+from backend.app.main import app
+from backend.app.models.value_request import ValueRequest
+
+def test_documents_are_encoded_without_preprocessing():
+    member_id = ObjectId()
+    document = {
+        '_id': member_id,
+        'created_at': datetime(2024, 5, 1, 12, 30, 0, 500000),
+        'total_deal_value': Decimal128('1500000.50'),
+        'fee': Decimal('0.25'),
+        'tags': ['investor'],
+    }
+
+    with app.app_context():
+        body = json.loads(jsonify([document]).get_data())
+
+    assert body == [{
+        '_id': str(member_id),
+        'created_at': '2024-05-01T12:30:00.500000',
+        'total_deal_value': '1500000.50',
+        'fee': '0.25',
+        'tags': ['investor'],
+    }]
+
+def test_pydantic_models_and_request_bodies():
+    request = ValueRequest(member_id=str(ObjectId()), request_type='deal_count', requested_deal_count=3,
+                           justification='Closed three deals this quarter')
+
+    with app.app_context():
+        body = json.loads(app.json.dumps({'request': request}))
+        assert app.json.loads(b'{"a": 1}') == {'a': 1}
+
+    assert body['request']['requested_deal_count'] == 3
+    assert body['request']['member_id'] == request.member_id
@@ -0,0 +1,39 @@
+from unittest.mock import patch
+from bson import ObjectId
+from flask import Flask
+from backend.app.utils.member_loader import MemberLoader, get_member_loader
+
+@patch('backend.app.utils.database.members_collection')
+def test_loader_batches_and_memoizes(mock_collection):
+    ids = [ObjectId() for _ in range(3)]
+    mock_collection.find.side_effect = lambda query, projection: [
+        {'_id': _id, 'name': f'Member {i}'} for i, _id in enumerate(ids) if _id in query['_id']['$in']
+    ]
+
+    loader = MemberLoader()
+    loader.prime([str(_id) for _id in ids] + ['not-an-object-id'])
+    assert loader.load(ids[0])['name'] == 'Member 0'
+    assert loader.load(str(ids[2]))['name'] == 'Member 2'
+    assert loader.load('not-an-object-id') is None
+
+    # A single $in query served every lookup
+    assert loader.query_count == 1
+    assert mock_collection.find.call_count == 1
+
+    # Unknown ids are memoized as missing too
+    missing = ObjectId()
+    assert loader.load_many([missing, ids[1]]) == [None, {'_id': ids[1], 'name': 'Member 1'}]
+    assert loader.load(missing) is None
+    assert loader.query_count == 2
+
+    loader.clear(ids[1])
+    loader.load(ids[1])
+    assert loader.query_count == 3
+
+def test_loader_is_request_scoped():
+    app = Flask(__name__)
+    with app.test_request_context():
+        assert get_member_loader() is get_member_loader()
+        first = get_member_loader()
+    with app.test_request_context():
+        assert get_member_loader() is not first
@@ -70,4 +70,28 @@ def test_submit_form(mock_ai_service, mock_info_collection, mock_members_collect
     # Assert that the database methods were called
     mock_info_collection.find_one.assert_called_with({"user_id": member_id})
     mock_info_collection.insert_one.assert_called_once()
-    mock_members_collection.update_one.assert_called_once()
\ No newline at end of file
+    mock_members_collection.update_one.assert_called_once()
+
+@patch('backend.app.services.member_service.members_collection')
+def test_get_members_page(mock_collection):
+    from backend.app.services import member_service
+    from backend.app.utils.pagination import decode_cursor
+
+    ids = [ObjectId() for _ in range(3)]
+    cursor = mock_collection.find.return_value.sort.return_value.limit.return_value
+    cursor.__iter__.return_value = iter([{'_id': _id, 'name': f'Member {i}'} for i, _id in enumerate(ids)])
+
+    page = member_service.get_members_page(limit=2)
+
+    assert [m['_id'] for m in page['members']] == ids[:2]
+    assert decode_cursor(page['next_cursor']) == {'id': str(ids[1])}
+    mock_collection.find.return_value.sort.return_value.limit.assert_called_with(3)
+
+    # Following the cursor resumes strictly after the last returned _id
+    cursor.__iter__.return_value = iter([{'_id': ids[2], 'name': 'Member 2'}])
+    page = member_service.get_members_page(after=page['next_cursor'], limit=2)
+
+    query = mock_collection.find.call_args[0][0]
+    assert query == {'_id': {'$gt': ids[1]}}
+    assert page['next_cursor'] is None
+    assert len(page['members']) == 1
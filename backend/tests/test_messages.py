@@ -0,0 +1,124 @@
+from datetime import datetime
+from unittest.mock import patch
+from bson import ObjectId
+from backend.app.services import message_service
+from backend.app.utils.pagination import decode_cursor
+
+def test_conversation_id_is_symmetric():
+    assert message_service.conversation_id_for('b', 'a') == message_service.conversation_id_for('a', 'b') == 'a:b'
+
+@patch('backend.app.services.message_service.unread_counters_collection')
+@patch('backend.app.services.message_service.messages_collection')
+def test_send_message_stores_conversation_id(mock_collection, mock_counters):
+    mock_collection.insert_one.return_value.inserted_id = ObjectId()
+    message_service.send_message({'sender_id': 'b', 'receiver_id': 'a', 'content': 'Hello'})
+    stored = mock_collection.insert_one.call_args[0][0]
+    assert stored['conversation_id'] == 'a:b'
+
+@patch('backend.app.services.message_service.messages_collection')
+def test_get_conversation_pages_backwards(mock_collection):
+    newest_first = [
+        {'_id': ObjectId(), 'content': f'Message {n}', 'created_at': datetime(2024, 1, 1, 12, n)}
+        for n in (3, 2, 1)
+    ]
+    cursor = mock_collection.find.return_value.sort.return_value.limit.return_value
+    cursor.__iter__.return_value = iter(newest_first)
+
+    page = message_service.get_conversation('a', 'b', limit=2)
+
+    assert mock_collection.find.call_args[0][0] == {'conversation_id': 'a:b'}
+    assert [m['content'] for m in page['messages']] == ['Message 2', 'Message 3']
+    assert decode_cursor(page['next_cursor'])['id'] == str(newest_first[1]['_id'])
+
+    cursor.__iter__.return_value = iter(newest_first[2:])
+    page = message_service.get_conversation('a', 'b', before=page['next_cursor'], limit=2)
+
+    query = mock_collection.find.call_args[0][0]
+    assert query['$or'][0] == {'created_at': {'$lt': newest_first[1]['created_at']}}
+    assert [m['content'] for m in page['messages']] == ['Message 1']
+    assert page['next_cursor'] is None
+
+@patch('backend.app.services.message_service.unread_counters_collection')
+@patch('backend.app.services.message_service.messages_collection')
+def test_send_message_increments_unread_counter(mock_messages, mock_counters):
+    mock_messages.insert_one.return_value.inserted_id = ObjectId()
+    message_service.send_message({'sender_id': 'b', 'receiver_id': 'a', 'content': 'Hello'})
+    mock_counters.update_one.assert_called_once_with(
+        {'_id': 'a'}, {'$inc': {'total': 1, 'conversations.a:b': 1}}, upsert=True
+    )
+
+@patch('backend.app.services.message_service.unread_counters_collection')
+def test_get_unread_counts_reads_one_document(mock_counters):
+    mock_counters.find_one.return_value = {'_id': 'a', 'total': 3, 'conversations': {'a:b': 3, 'a:c': 0}}
+    assert message_service.get_unread_counts('a') == {'unread_count': 3, 'conversations': {'a:b': 3}}
+    mock_counters.find_one.return_value = None
+    assert message_service.get_unread_counts('a') == {'unread_count': 0, 'conversations': {}}
+
+@patch('backend.app.services.message_service.unread_counters_collection')
+@patch('backend.app.services.message_service.messages_collection')
+def test_reading_messages_that_were_never_counted(mock_messages, mock_counters):
+    message_id = ObjectId()
+    mock_messages.find_one.return_value = {
+        '_id': message_id, 'sender_id': 'c', 'receiver_id': 'a', 'conversation_id': 'a:c', 'created_at': datetime(2024, 1, 1)
+    }
+    mock_messages.update_many.return_value.modified_count = 3
+
+    message_service.mark_read_up_to('a', str(message_id))
+
+    # The counters only hold a:b, so the pipeline floors both decrements at zero
+    _, pipeline = mock_counters.update_one.call_args[0]
+    assert pipeline[0]['$set']['total'] == {'$max': [0, {'$subtract': [{'$ifNull': ['$total', 0]}, 3]}]}
+    assert 'upsert' not in mock_counters.update_one.call_args[1]
+    # Counters that went negative before the floor existed read as zero
+    mock_counters.find_one.return_value = {'_id': 'a', 'total': -3, 'conversations': {'a:b': 1, 'a:c': -4}}
+    assert message_service.get_unread_counts('a') == {'unread_count': 0, 'conversations': {'a:b': 1}}
+
+    # Rebuilding counts them from the unread messages, dropping users with none left
+    mock_messages.aggregate.return_value = [
+        {'_id': {'receiver_id': 'a', 'conversation_id': 'a:b'}, 'count': 1},
+        {'_id': {'receiver_id': 'a', 'conversation_id': 'a:c'}, 'count': 2},
+        {'_id': {'receiver_id': 'b', 'conversation_id': 'a:b'}, 'count': 4}
+    ]
+    assert message_service.rebuild_unread_counters() == 2
+    replaced = {op._filter['_id']: op._doc for op in mock_counters.bulk_write.call_args[0][0]}
+    assert replaced == {
+        'a': {'total': 3, 'conversations': {'a:b': 1, 'a:c': 2}},
+        'b': {'total': 4, 'conversations': {'a:b': 4}}
+    }
+    mock_counters.delete_many.assert_called_once_with({'_id': {'$nin': ['a', 'b']}})
+
+@patch('backend.app.services.message_service.unread_counters_collection')
+@patch('backend.app.services.message_service.messages_collection')
+def test_mark_read_up_to_updates_messages_and_counter(mock_messages, mock_counters):
+    message_id = ObjectId()
+    created_at = datetime(2024, 1, 1)
+    mock_messages.find_one.return_value = {
+        '_id': message_id, 'sender_id': 'b', 'receiver_id': 'a', 'conversation_id': 'a:b', 'created_at': created_at
+    }
+    mock_messages.update_many.return_value.modified_count = 2
+
+    response, status_code = message_service.mark_read_up_to('a', str(message_id))
+
+    assert status_code == 200 and response['marked_read'] == 2
+    query = mock_messages.update_many.call_args[0][0]
+    assert query['conversation_id'] == 'a:b' and query['created_at'] == {'$lte': created_at}
+    query, pipeline = mock_counters.update_one.call_args[0]
+    assert query == {'_id': 'a'}
+    assert pipeline[0]['$set']['conversations.a:b'] == {
+        '$max': [0, {'$subtract': [{'$ifNull': ['$conversations.a:b', 0]}, 2]}]
+    }
+
+    # Only the receiver can mark a message as read
+    _, status_code = message_service.mark_read_up_to('b', str(message_id))
+    assert status_code == 404
+
+@patch('backend.app.services.message_service.messages_collection')
+def test_backfill_conversation_ids_casts_object_ids_to_strings(mock_collection):
+    mock_collection.update_many.return_value.modified_count = 3
+
+    assert message_service.backfill_conversation_ids() == 3
+
+    pipeline = mock_collection.update_many.call_args[0][1]
+    condition, ascending, _ = pipeline[0]['$set']['conversation_id']['$cond']
+    assert condition == {'$lt': [{'$toString': '$sender_id'}, {'$toString': '$receiver_id'}]}
+    assert ascending == {'$concat': [{'$toString': '$sender_id'}, ':', {'$toString': '$receiver_id'}]}
@@ -0,0 +1,38 @@
+from datetime import datetime
+from bson import ObjectId
+from backend.app.models.member import Member
+from backend.app.models.member_info import MemberInfo
+from backend.app.models.message import Message
+
+def test_from_db_keeps_stored_values_without_validation():
+    member_id = ObjectId()
+    document = {'_id': member_id, 'name': 'Stored Member', 'email': 'not-an-email', 'tier': 'Infinity'}
+
+    member = Member.from_db(document)
+
+    assert member.id == member_id
+    assert member.email == 'not-an-email'
+    assert member.to_db()['_id'] == member_id
+    assert Member.from_db(None) is None
+
+def test_to_db_matches_dict_and_never_stores_a_null_id():
+    message = Message(sender_id='a', receiver_id='b', content='Hello', status='sent')
+
+    document = message.to_db()
+
+    assert '_id' not in document
+    assert document == message.dict(by_alias=True, exclude_none=True)
+    assert '_id' not in message.to_db(exclude_none=False)
+    assert message.to_db(exclude_none=False)['read_at'] is None
+
+def test_to_db_converts_nested_models_and_honours_exclude_unset():
+    info = MemberInfo(
+        user_id='u1', name='Member', email='member@example.com', sector=None,
+        deals=[{'deal_id': 'd1', 'description': 'Deal', 'value': 10.0, 'date': datetime(2024, 1, 1)}]
+    )
+    member = Member(name='Member', email='member@example.com', password_hash='hash',
+                    contact_info={'phone': '123'})
+
+    assert info.to_db()['deals'] == [{'deal_id': 'd1', 'description': 'Deal', 'value': 10.0, 'date': datetime(2024, 1, 1)}]
+    assert member.to_db()['contact_info'] == {'phone': '123', 'company': None, 'position': None}
+    assert info.to_db(exclude_none=False, exclude_unset=True).keys() == {'user_id', 'name', 'email', 'sector', 'deals'}
@@ -0,0 +1,54 @@
+from unittest.mock import patch
+from bson import ObjectId
+from backend.app.utils import passwords
+from backend.app.utils.passwords import hash_password, check_password, hash_cost, needs_rehash
+from backend.config import Config, password_hash_workers
+
+@patch.object(Config, 'PASSWORD_HASH_WORKERS', 0)
+def test_hash_and_check_inline():
+    hashed = hash_password('password', rounds=4)
+    assert isinstance(hashed, str) and hash_cost(hashed) == 4
+    assert check_password('password', hashed)
+    assert check_password('password', hashed.encode('utf-8'))
+    assert not check_password('wrong', hashed)
+    assert not check_password('password', 'not-a-bcrypt-hash')
+
+@patch.object(Config, 'PASSWORD_HASH_WORKERS', 1)
+def test_hash_and_check_in_process_pool():
+    try:
+        hashed = hash_password('password', rounds=4)
+        assert check_password('password', hashed)
+        assert passwords._executor is not None
+    finally:
+        passwords.shutdown()
+
+def test_hash_workers_split_the_box_across_server_processes():
+    # 8 cores: a single process gets them all, 17 gunicorn workers get one each
+    assert password_hash_workers(1, 'gthread', 8) == 8
+    assert password_hash_workers(3, 'gthread', 8) == 2
+    assert password_hash_workers(17, 'gthread', 8) == 1
+    assert password_hash_workers(4, 'gevent', 8) == 0
+
+@patch.object(Config, 'BCRYPT_ROUNDS', 5)
+def test_needs_rehash_compares_cost():
+    assert needs_rehash('$2b$04$' + 'a' * 53)
+    assert not needs_rehash('$2b$05$' + 'a' * 53)
+
+@patch.object(Config, 'PASSWORD_HASH_WORKERS', 0)
+@patch.object(Config, 'BCRYPT_ROUNDS', 5)
+def test_login_rehashes_outdated_cost():
+    from backend.app.services import auth_service
+
+    user_id = ObjectId()
+    user = {'_id': user_id, 'email': 'member@test.com', 'user_type': 'member',
+            'password_hash': hash_password('password', rounds=4)}
+    with patch.object(auth_service, 'members_collection') as mock_collection, \
+            patch.object(auth_service, 'refresh_tokens_collection') as mock_refresh_tokens:
+        mock_collection.find_one.return_value = user
+        response, status_code = auth_service.login_user({'email': 'member@test.com', 'password': 'password'})
+
+    assert status_code == 200
+    assert mock_refresh_tokens.insert_one.call_args[0][0]['user_id'] == str(user_id)
+    query, update = mock_collection.update_one.call_args[0]
+    assert query == {'_id': user_id}
+    assert hash_cost(update['$set']['password_hash']) == 5
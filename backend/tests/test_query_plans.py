@@ -0,0 +1,29 @@
+import os
+import pytest
+from unittest.mock import MagicMock
+from backend.app.utils.indexes import missing_indexes, unindexed_queries
+
+def test_missing_indexes_reports_unregistered_names():
+    db = MagicMock()
+    db.get_collection.return_value.index_information.return_value = {'_id_': {}, 'status': {}}
+    missing = missing_indexes(db)
+    assert ('update_requests', 'status') not in missing
+    assert ('members', 'email_unique') in missing
+
+def test_unindexed_queries_flags_collection_scans():
+    db = MagicMock()
+    db.get_collection.return_value.find.return_value.sort.return_value.explain.return_value = {
+        'queryPlanner': {'winningPlan': {'stage': 'SORT', 'inputStage': {'stage': 'COLLSCAN'}}}
+    }
+    db.get_collection.return_value.find.return_value.explain.return_value = {
+        'queryPlanner': {'winningPlan': {'stage': 'FETCH', 'inputStage': {'stage': 'IXSCAN'}}}
+    }
+    failures = unindexed_queries(db)
+    assert failures and all('COLLSCAN' in stages for _, stages in failures)
+
+@pytest.mark.skipif(not os.environ.get('EXPLAIN_QUERIES'), reason="set EXPLAIN_QUERIES=1 to explain queries against MongoDB")
+def test_service_queries_use_indexes():
+    from backend.app.utils.database import db
+    from backend.app.utils.indexes import ensure_indexes
+    ensure_indexes(db)
+    assert unindexed_queries(db) == []
@@ -0,0 +1,95 @@
+import multiprocessing
+import queue
+import time
+import jwt
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from socketio import PubSubManager
+from backend.app.main import app
+from backend.app.utils import realtime
+from backend.app.utils.realtime import socketio, push_to_user, MESSAGES_NAMESPACE
+from backend.config import Config
+
+def make_token(public_id, role='member'):
+    return jwt.encode({
+        'public_id': public_id,
+        'role': role,
+        'exp': datetime.utcnow() + timedelta(minutes=5)
+    }, Config.JWT_SECRET_KEY, algorithm="HS256")
+
+def test_socket_requires_valid_token():
+    client = socketio.test_client(app, namespace=MESSAGES_NAMESPACE, auth={'token': 'not-a-token'})
+    assert not client.is_connected(MESSAGES_NAMESPACE)
+
+    client = socketio.test_client(app, namespace=MESSAGES_NAMESPACE, auth={'token': make_token('guest', 'guest')})
+    assert not client.is_connected(MESSAGES_NAMESPACE)
+
+def test_push_reaches_only_the_receiver():
+    receiver = socketio.test_client(app, namespace=MESSAGES_NAMESPACE, auth={'token': make_token('receiver')})
+    other = socketio.test_client(app, namespace=MESSAGES_NAMESPACE, auth={'token': make_token('other')})
+    assert receiver.is_connected(MESSAGES_NAMESPACE)
+
+    push_to_user('receiver', 'message', {'content': 'Hello'})
+
+    received = receiver.get_received(MESSAGES_NAMESPACE)
+    assert [event['name'] for event in received] == ['message']
+    args = received[0]['args']
+    assert (args[0] if isinstance(args, list) else args) == {'content': 'Hello'}
+    assert other.get_received(MESSAGES_NAMESPACE) == []
+
+class ProcessQueueManager(PubSubManager):
+    """Pub/sub over a multiprocessing queue, standing in for the Redis channel between server processes"""
+    name = 'process-queue'
+
+    def __init__(self, channel):
+        super().__init__()
+        self.queue = channel
+        self.closed = False
+
+    def _publish(self, data):
+        self.queue.put(data)
+
+    def _listen(self):
+        while not self.closed:
+            try:
+                yield self.queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+def test_socketio_options_use_the_configured_message_queue():
+    with patch.object(Config, 'SOCKETIO_MESSAGE_QUEUE', None):
+        assert 'message_queue' not in realtime.socketio_options()
+    with patch.object(Config, 'SOCKETIO_MESSAGE_QUEUE', 'redis://localhost:6379/0'):
+        options = realtime.socketio_options()
+    assert options['message_queue'] == 'redis://localhost:6379/0' and options['channel'] == Config.SOCKETIO_CHANNEL
+
+def test_push_from_another_process_reaches_the_socket_through_the_queue():
+    receiver = socketio.test_client(app, namespace=MESSAGES_NAMESPACE, auth={'token': make_token('receiver')})
+    assert receiver.is_connected(MESSAGES_NAMESPACE)
+
+    # The test client refuses to connect through a queue, so the queue takes over the connected sockets
+    context = multiprocessing.get_context('fork')
+    manager = ProcessQueueManager(context.Queue())
+    manager.set_server(socketio.server)
+    manager.rooms, manager.eio_to_sid = socketio.server.manager.rooms, socketio.server.manager.eio_to_sid
+    with patch.object(socketio.server, 'manager', manager):
+        manager.initialize()
+        try:
+            # The forked process has no sockets of its own; only the queue connects it to the receiver
+            sender = context.Process(target=push_to_user, args=('receiver', 'message', {'content': 'From afar'}))
+            sender.start()
+            sender.join(5)
+            assert sender.exitcode == 0
+
+            received = []
+            deadline = time.monotonic() + 5
+            while not received and time.monotonic() < deadline:
+                received = receiver.get_received(MESSAGES_NAMESPACE)
+                time.sleep(0.02)
+        finally:
+            manager.closed = True
+    receiver.disconnect(MESSAGES_NAMESPACE)
+
+    assert [event['name'] for event in received] == ['message']
+    args = received[0]['args']
+    assert (args[0] if isinstance(args, list) else args) == {'content': 'From afar'}
@@ -0,0 +1,94 @@
+from datetime import datetime
+from unittest.mock import patch
+import numpy as np
+from bson import ObjectId
+from backend.app.services import recommendation_service
+from backend.app.services.recommendation_service import (
+    ProfileMatrix, profile_features, top_k, affected_rows, SIMILAR, COMPLEMENTARY
+)
+
+PROFILES = {
+    'ana': {'sector': 'Technology', 'hierarchy': 'Founder', 'title': 'CEO', 'expertise': ['Payments', 'Fintech']},
+    'bia': {'sector': 'Technology', 'hierarchy': 'Founder', 'title': 'CTO', 'expertise': ['Payments', 'Data']},
+    'caio': {'sector': 'Finance', 'hierarchy': 'Director', 'title': 'CFO', 'expertise': ['Payments', 'Fintech']},
+    'duda': {'sector': 'Energy', 'hierarchy': 'Director', 'title': 'CEO', 'expertise': ['Solar', 'Data']},
+}
+
+def matrix():
+    user_ids = list(PROFILES)
+    return ProfileMatrix(user_ids, [profile_features(PROFILES[user_id]) for user_id in user_ids], 512)
+
+def best(matrix, scores, k=2):
+    columns, values = top_k(scores[None, :], k)
+    return [matrix.user_ids[column] for column, value in zip(columns[0], values[0]) if value > 0]
+
+def test_profile_features_are_normalized():
+    assert profile_features({'sector': 'Sócio Tech', 'expertise': ['M&A', None], 'title': 'Head of Sales'}) == {
+        'sector:socio tech', 'expertise:m a', 'title:head', 'title:of', 'title:sales'
+    }
+
+def test_blocks_rank_similar_and_cross_sector_complementary_members():
+    profiles = matrix()
+    rows = [profiles.rows[user_id] for user_id in ('ana', 'bia', 'caio', 'duda')]
+    scores = {}
+    for block, similar, complementary in profiles.score_blocks(rows, chunk_size=3):
+        for position, row in enumerate(block):
+            scores[profiles.user_ids[row]] = (similar[position], complementary[position])
+
+    similar, complementary = scores['ana']
+    assert best(profiles, similar) == ['caio', 'bia']
+    # Complementary members never share the sector, and nobody is matched with themselves
+    assert best(profiles, complementary) == ['caio']
+    assert similar[profiles.rows['ana']] == -np.inf
+
+    # Cosine similarities agree with a direct computation
+    encoded = profiles.encoded / np.linalg.norm(profiles.encoded, axis=1, keepdims=True)
+    expected = encoded[profiles.rows['ana']] @ encoded[profiles.rows['caio']]
+    assert np.isclose(similar[profiles.rows['caio']], expected)
+
+def test_top_k_orders_best_first_and_handles_short_rows():
+    columns, values = top_k(np.array([[0.1, 0.9, -np.inf, 0.5]], dtype=np.float32), 3)
+    assert columns.tolist() == [[1, 3, 0]]
+    assert top_k(np.zeros((2, 1), dtype=np.float32), 5)[0].shape == (2, 1)
+
+@patch('backend.app.services.recommendation_service.ai_recommendations_collection')
+def test_incremental_run_recomputes_only_affected_members(mock_recommendations):
+    profiles = matrix()
+    # ana's list already holds caio; duda's list is full with a high bar
+    mock_recommendations.find.return_value = [{'user_id': 'ana'}]
+    mock_recommendations.aggregate.return_value = [
+        {'_id': {'user_id': 'duda', 'type': SIMILAR}, 'lowest': 0.99, 'count': 2},
+        {'_id': {'user_id': 'duda', 'type': COMPLEMENTARY}, 'lowest': 0.99, 'count': 2},
+    ]
+
+    affected = affected_rows(profiles, [profiles.rows['caio']], [], k=2, chunk_size=8)
+
+    assert {profiles.user_ids[row] for row in affected} == {'caio', 'ana', 'bia'}
+    assert mock_recommendations.find.call_args[0][0]['recommendation_data.member_id'] == {'$in': ['caio']}
+
+@patch('backend.app.services.recommendation_service.recommendation_runs_collection')
+@patch('backend.app.services.recommendation_service.ai_recommendations_collection')
+@patch('backend.app.services.recommendation_service.members_info_collection')
+@patch('backend.app.services.recommendation_service.members_collection')
+def test_full_run_writes_recommendation_documents(mock_members, mock_infos, mock_recommendations, mock_runs):
+    ids = {user_id: str(ObjectId()) for user_id in PROFILES}
+    mock_members.find.return_value = [{'_id': ObjectId(member_id)} for member_id in ids.values()]
+    mock_infos.find.return_value = [
+        {'user_id': member_id, 'updated_at': datetime(2024, 1, 1), **PROFILES[user_id]} for user_id, member_id in ids.items()
+    ]
+    mock_recommendations.distinct.return_value = ['deleted-member']
+
+    stats = recommendation_service.run(full=True)
+
+    assert stats['members'] == 4 and stats['recomputed'] == 4 and stats['removed'] == 1
+    operations = [op for call in mock_recommendations.bulk_write.call_args_list for op in call[0][0]]
+    assert len(operations) == stats['recommendations']
+    ana = [op for op in operations if op._filter['user_id'] == ids['ana']]
+    first = ana[0]._doc['$set']
+    assert ana[0]._filter['recommendation_type'] == SIMILAR
+    assert first['recommendation_data']['member_id'] == ids['caio']
+    assert 'expertise:payments' in first['recommendation_data']['shared']
+    assert 0 < first['confidence_score'] <= 1
+    assert ana[0]._doc['$setOnInsert'] == {'is_applied': False}
+    mock_recommendations.delete_many.assert_any_call({'user_id': {'$in': ['deleted-member']}})
+    assert mock_runs.update_one.call_args[0][1]['$set']['recomputed'] == 4
@@ -0,0 +1,79 @@
+import time
+import jwt
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from backend.app.main import app
+from backend.config import Config
+from backend.app.services import auth_service
+from backend.app.utils import revocation
+from backend.app.utils.security import create_access_token, decode_token, revoke_token
+
+@patch('backend.app.services.auth_service.refresh_tokens_collection')
+def test_refresh_rotates_the_token(mock_collection):
+    mock_collection.find_one_and_delete.return_value = {'_id': 'digest', 'user_id': 'member-1', 'role': 'member'}
+
+    response, status = auth_service.refresh_access_token('old-token')
+
+    assert status == 200
+    assert decode_token(response['access_token']) == {'public_id': 'member-1', 'role': 'member'}
+    query = mock_collection.find_one_and_delete.call_args[0][0]
+    assert query['_id'] == auth_service._refresh_token_digest('old-token')
+    stored = mock_collection.insert_one.call_args[0][0]
+    assert stored['_id'] == auth_service._refresh_token_digest(response['refresh_token'])
+    assert stored['_id'] != query['_id'] and stored['role'] == 'member'
+
+@patch('backend.app.services.auth_service.refresh_tokens_collection')
+def test_refresh_rejects_unknown_or_reused_tokens(mock_collection):
+    mock_collection.find_one_and_delete.return_value = None
+    assert auth_service.refresh_access_token('used-token')[1] == 401
+    assert auth_service.refresh_access_token(None)[1] == 401
+    mock_collection.insert_one.assert_not_called()
+
+@patch('backend.app.utils.revocation.database.revoked_tokens_collection')
+def test_revoked_access_token_is_rejected(mock_collection):
+    token = create_access_token('member-2', 'member')
+    assert decode_token(token)['public_id'] == 'member-2'
+
+    revoke_token(token)
+
+    with pytest.raises(jwt.InvalidTokenError):
+        decode_token(token)
+    jti = jwt.decode(token, options={"verify_signature": False})['jti']
+    assert mock_collection.update_one.call_args[0][0] == {'_id': jti}
+
+@patch('backend.app.utils.revocation.database.revoked_tokens_collection')
+def test_sync_picks_up_revocations_from_other_processes(mock_collection):
+    revocations = revocation.RevocationList()
+    mock_collection.find.return_value = [
+        {'_id': 'revoked-elsewhere', 'expires_at': datetime.utcnow() + timedelta(minutes=5)}
+    ]
+    revocations.add('expired', time.time() - 1)
+
+    revocations.sync()
+
+    assert 'revoked-elsewhere' in revocations
+    assert 'expired' not in revocations and len(revocations) == 1
+    # Later syncs only ask for what was revoked since the previous one
+    revocations.sync()
+    assert 'revoked_at' in mock_collection.find.call_args[0][0]
+
+@patch('backend.app.utils.revocation.database.revoked_tokens_collection')
+@patch('backend.app.services.auth_service.refresh_tokens_collection')
+def test_logout_with_an_expired_access_token_revokes_the_refresh_token(mock_refresh_tokens, mock_revoked):
+    expired = jwt.encode({
+        'public_id': 'member-3', 'role': 'member', 'jti': 'expired-jti',
+        'exp': datetime.utcnow() - timedelta(minutes=1)
+    }, Config.JWT_SECRET_KEY, "HS256")
+
+    response = app.test_client().post(
+        '/api/auth/logout', json={'refresh_token': 'refresh-3'}, headers={'x-access-token': expired}
+    )
+
+    assert response.status_code == 200
+    mock_refresh_tokens.delete_one.assert_called_once_with({'_id': auth_service._refresh_token_digest('refresh-3')})
+    # Only tokens that still decode are added to the revocation list
+    mock_revoked.update_one.assert_not_called()
+
+    response = app.test_client().post('/api/auth/logout', json={})
+    assert response.status_code == 401
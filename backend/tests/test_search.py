@@ -0,0 +1,153 @@
+import jwt
+from datetime import datetime, timedelta
+from unittest.mock import patch
+import pytest
+from bson import ObjectId
+from backend.app.main import app
+from backend.config import Config
+from backend.app.services import search_service, member_form_service
+from backend.app.utils.search_index import SearchIndex, PrefixIndex, MEMBER_FIELD_WEIGHTS, member_index, member_suggestions, tokenize
+
+def member(name, **fields):
+    return {'_id': ObjectId(), 'name': name, 'user_type': 'member', **fields}
+
+MEMBERS = [
+    member('Ana Souza', tier='Infinity', verified=True, sector='Technology', connections=40),
+    member('Bruno Lima', tier='Sócio', verified=False, sector='Finance', contact_info={'company': 'Banco Lima'}, connections=90),
+    member('Carla Dias', tier='Infinity', verified=True, sector='Technology'),
+    member('Admin', user_type='admin'),
+]
+INFOS = [
+    {'user_id': str(MEMBERS[0]['_id']), 'title': 'Founder', 'company': 'Nuvem Pagamentos', 'expertise': ['payments', 'fintech']},
+    {'user_id': str(MEMBERS[2]['_id']), 'title': 'CTO', 'company': 'Dados Abertos', 'expertise': ['data', 'payments'], 'connections': 120},
+]
+
+@pytest.fixture
+def loaded_index():
+    with patch('backend.app.services.search_service.members_collection') as mock_members, \
+         patch('backend.app.services.search_service.members_info_collection') as mock_infos, \
+         patch('backend.app.services.search_service.change_versions') as mock_versions, \
+         patch('backend.config.Config.SEARCH_INDEX_SYNC_SECONDS', 0):
+        mock_members.find.return_value = MEMBERS
+        mock_infos.find.return_value = INFOS
+        mock_versions.current_versions.return_value = {'members': (1, None), 'members_info': (1, None)}
+        search_service.load_index()
+        yield mock_members, mock_infos
+    member_index.replace_all([])
+    member_index.loaded = False
+    member_suggestions.replace_all([])
+
+def test_tokenize_folds_case_and_accents():
+    assert tokenize('Sócio-Fundador, São Paulo') == ['socio', 'fundador', 'sao', 'paulo']
+    assert tokenize(['Payments', 'FinTech']) == ['payments', 'fintech']
+
+def test_bm25_prefers_rarer_terms_and_weighted_fields():
+    index = SearchIndex(MEMBER_FIELD_WEIGHTS)
+    index.replace_all([
+        ('a', {'name': 'Payments Person', 'expertise': ['sales']}, {}, {}),
+        ('b', {'name': 'Someone', 'expertise': ['payments']}, {}, {}),
+        ('c', {'name': 'Other', 'expertise': ['sales']}, {}, {}),
+    ])
+
+    total, hits = index.search('payments')
+    assert total == 2
+    # A name match outweighs an expertise match
+    assert [doc_id for doc_id, _, _ in hits] == ['a', 'b']
+    assert index.search('nobody')[0] == 0
+
+def test_index_updates_and_removals_are_incremental():
+    index = SearchIndex(MEMBER_FIELD_WEIGHTS)
+    index.upsert('a', {'name': 'Ana'}, {}, {'name': 'Ana'})
+    index.upsert('a', {'name': 'Beatriz'}, {}, {'name': 'Beatriz'})
+
+    assert index.search('ana')[0] == 0
+    assert index.search('beatriz')[1][0][2] == {'name': 'Beatriz'}
+    assert index.remove('a') and len(index) == 0
+    assert index.search('beatriz')[0] == 0
+
+def test_prefix_index_matches_word_starts_by_weight():
+    index = PrefixIndex(cached_prefix_length=1)
+    index.replace_all([
+        ('a', ('Ana Souza', 'Nuvem Pagamentos'), 10, 'a'),
+        ('b', ('Bruno Lima', 'Banco Lima'), 30, 'b'),
+        ('c', ('Antônio Lima', None), 20, 'c'),
+    ])
+
+    assert index.suggest('an') == ['c', 'a']
+    assert index.suggest('LIM') == ['b', 'c']
+    assert index.suggest('ana so') == ['a']
+    assert index.suggest('a', limit=1) == ['c']
+    assert index.suggest('  ') == []
+
+    # Writes drop the cached ranking of short prefixes
+    index.upsert('a', ('Ana Souza',), 50, 'a')
+    assert index.suggest('a') == ['a', 'c']
+    assert index.suggest('nuvem') == []
+    index.remove('c')
+    assert index.suggest('a') == ['a']
+    assert len(index) == 2
+
+def test_search_merges_member_info_and_filters(loaded_index):
+    page = search_service.search_members('payments')
+    assert [hit['name'] for hit in page['results']] == ['Ana Souza', 'Carla Dias']
+    assert page['results'][0]['company'] == 'Nuvem Pagamentos'
+
+    assert search_service.search_members('banco')['results'][0]['name'] == 'Bruno Lima'
+    assert search_service.search_members('payments', tier='infinity', verified=True)['total'] == 2
+    assert search_service.search_members('technology finance', sector='finance')['total'] == 1
+    assert search_service.search_members('socio', tier='Socio')['total'] == 0
+    # Admins are not part of the member directory
+    assert search_service.search_members('admin')['total'] == 0
+
+def test_search_pagination_cursor(loaded_index):
+    first = search_service.search_members('technology finance', limit=2)
+    assert first['total'] == 3 and len(first['results']) == 2
+
+    second = search_service.search_members('technology finance', after=first['next_cursor'], limit=2)
+    assert len(second['results']) == 1 and second['next_cursor'] is None
+    assert {hit['_id'] for hit in first['results'] + second['results']} == {str(m['_id']) for m in MEMBERS[:3]}
+
+    with pytest.raises(ValueError):
+        search_service.search_members('finance', after='not-a-cursor')
+
+@patch('backend.app.services.member_form_service.change_versions')
+@patch('backend.app.services.member_form_service.members_info_collection')
+def test_submitted_form_is_searchable_without_a_reload(mock_form_infos, mock_form_versions, loaded_index):
+    mock_members, mock_infos = loaded_index
+    bruno = MEMBERS[1]
+    mock_form_infos.find_one.return_value = None
+    mock_members.find_one.return_value = bruno
+    mock_infos.find_one.return_value = {'user_id': str(bruno['_id']), 'title': 'Investor', 'expertise': ['agribusiness']}
+
+    response, status = member_form_service.submit_form(str(bruno['_id']), {'name': 'Bruno Lima', 'email': 'bruno@example.com'})
+
+    assert status == 200
+    mock_form_versions.bump.assert_called_once_with('members_info')
+    mock_members.find.reset_mock()
+    assert search_service.search_members('agribusiness')['results'][0]['title'] == 'Investor'
+    mock_members.find.assert_not_called()
+
+    assert search_service.suggest_members('bru') == [{'_id': str(bruno['_id']), 'name': 'Bruno Lima', 'company': 'Banco Lima', 'connections': 90}]
+
+    search_service.remove_member(bruno['_id'])
+    assert search_service.search_members('agribusiness')['total'] == 0
+    assert search_service.suggest_members('bru') == []
+
+def test_search_route(loaded_index):
+    token = jwt.encode({
+        'public_id': str(ObjectId()), 'role': 'member', 'exp': datetime.utcnow() + timedelta(minutes=5)
+    }, Config.JWT_SECRET_KEY, algorithm="HS256")
+    headers = {'x-access-token': token}
+
+    with app.test_client() as client:
+        rv = client.get('/api/members/search?q=payments&verified=true&limit=1', headers=headers)
+        assert rv.status_code == 200
+        assert rv.json['total'] == 2 and rv.json['results'][0]['name'] == 'Ana Souza'
+        assert rv.json['next_cursor']
+
+        assert client.get('/api/members/search', headers=headers).status_code == 400
+        assert [hit['name'] for hit in client.get('/api/members/suggest?q=d', headers=headers).json] == ['Carla Dias']
+        assert client.get('/api/members/suggest?q=lima', headers=headers).json == [
+            {'_id': str(MEMBERS[1]['_id']), 'name': 'Bruno Lima', 'company': 'Banco Lima', 'connections': 90}
+        ]
+        assert client.get('/api/members/search?q=x&verified=maybe', headers=headers).status_code == 400
@@ -0,0 +1,67 @@
+from datetime import datetime
+from unittest.mock import patch
+from bson import ObjectId
+from backend.app.services import member_service, segment_service
+from backend.app.utils.showcase_cache import showcase_cache
+
+PUBLIC = {'verified': True, 'public_profile': True}
+
+def bulk_updates(mock_segments):
+    operations = mock_segments.bulk_write.call_args[0][0]
+    return {op._filter['_id']: op._doc['$inc']['count'] for op in operations}
+
+@patch('backend.app.utils.database.collection_versions_collection')
+@patch('backend.app.services.segment_service.segments_collection')
+def test_member_change_moves_count_between_segments(mock_segments, mock_versions):
+    assert segment_service.apply_member_change({**PUBLIC, 'sector': 'Finance'}, {**PUBLIC, 'sector': 'Technology'})
+    assert bulk_updates(mock_segments) == {'Finance': -1, 'Technology': 1}
+
+    assert segment_service.apply_member_change({'sector': 'Finance', 'verified': False}, {**PUBLIC, 'sector': 'Finance'})
+    assert bulk_updates(mock_segments) == {'Finance': 1}
+
+    assert segment_service.apply_member_change({**PUBLIC, 'sector': 'Finance'}, None)
+    assert bulk_updates(mock_segments) == {'Finance': -1}
+
+    mock_segments.reset_mock()
+    # Edits that do not move a verified public member leave the counts alone
+    assert not segment_service.apply_member_change({**PUBLIC, 'sector': 'Finance'}, {**PUBLIC, 'sector': 'Finance', 'name': 'Jane'})
+    assert not segment_service.apply_member_change({'sector': 'Finance'}, {'sector': 'Technology'})
+    mock_segments.bulk_write.assert_not_called()
+
+@patch('backend.app.services.segment_service.segments_collection')
+def test_segments_are_read_from_the_materialized_collection(mock_segments):
+    showcase_cache.invalidate()
+    updated_at = datetime(2024, 1, 1)
+    mock_segments.find.return_value.sort.return_value = [
+        {'_id': 'Finance', 'count': 2, 'updated_at': updated_at},
+        {'_id': 'Technology', 'count': 5, 'updated_at': updated_at},
+    ]
+
+    assert member_service.get_business_segments() == ['Finance', 'Technology']
+    assert member_service.get_business_segments(with_counts=True)[1] == {
+        'segment': 'Technology', 'count': 5, 'updated_at': updated_at
+    }
+    assert mock_segments.find.call_args[0][0] == {'count': {'$gt': 0}}
+
+@patch('backend.app.utils.database.collection_versions_collection')
+@patch('backend.app.services.segment_service.segments_collection')
+@patch('backend.app.services.member_service.get_member_loader')
+@patch('backend.app.services.member_service.update_requests_collection')
+@patch('backend.app.services.member_service.members_collection')
+def test_approved_sector_change_updates_counts(mock_members, mock_requests, mock_loader, mock_segments, mock_versions):
+    user_id = ObjectId()
+    mock_requests.find_one.return_value = {
+        '_id': ObjectId(), 'status': 'pending', 'user_id': str(user_id),
+        'requested_changes': {'sector': 'Technology'}
+    }
+    mock_members.find_one_and_update.return_value = {'_id': user_id, 'sector': 'Finance', **PUBLIC}
+
+    response, status = member_service.approve_update_request(str(ObjectId()), 'admin')
+
+    assert status == 200
+    assert bulk_updates(mock_segments) == {'Finance': -1, 'Technology': 1}
+    bumped = {op._filter['_id'] for call in mock_versions.bulk_write.call_args_list for op in call[0][0]}
+    assert bumped == {'members', 'segments', 'showcases'}
+
+    mock_members.find_one_and_update.return_value = None
+    assert member_service.approve_update_request(str(ObjectId()), 'admin')[1] == 404
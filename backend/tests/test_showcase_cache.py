@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+from bson import ObjectId
+from backend.app.services import member_service
+from backend.app.utils.showcase_cache import ShowcaseCache, showcase_cache, invalidate_showcases, SHOWCASE_VERSION
+
+def test_fresh_entries_are_served_from_memory():
+    cache = ShowcaseCache(ttl=60, stale_ttl=300)
+    calls = []
+    loader = lambda: calls.append(1) or ['showcase']
+
+    assert cache.get('key', loader) == ['showcase']
+    assert cache.get('key', loader) == ['showcase']
+    assert len(calls) == 1
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+def test_stale_entry_is_served_while_one_refresh_runs():
+    cache = ShowcaseCache(ttl=60, stale_ttl=300)
+    cache.get('key', lambda: 'old')
+    refreshed = threading.Event()
+
+    def reload():
+        refreshed.set()
+        return 'new'
+
+    with patch('backend.app.utils.showcase_cache.time.monotonic', return_value=10 ** 9 + 100):
+        cache._entries['key'] = ('old', 10 ** 9)
+        assert cache.get('key', reload) == 'old'
+        assert refreshed.wait(5)
+    # The refresh stores its result just after the loader returns
+    for _ in range(100):
+        if cache._entries['key'][0] == 'new':
+            break
+        time.sleep(0.01)
+    assert cache.get('key', lambda: 'unused') == 'new'
+    assert cache.stats()['stale_hits'] == 1
+
+def test_load_started_before_invalidation_is_not_stored():
+    cache = ShowcaseCache(ttl=60, stale_ttl=300)
+
+    def load_while_an_admin_edits():
+        cache.invalidate()
+        return 'outdated'
+
+    assert cache.get('key', load_while_an_admin_edits) == 'outdated'
+    assert cache.get('key', lambda: 'current') == 'current'
+
+def test_async_get_shares_entries():
+    cache = ShowcaseCache(ttl=60, stale_ttl=300)
+
+    async def load():
+        return ['from motor']
+
+    assert asyncio.run(cache.aget('key', load)) == ['from motor']
+    assert cache.get('key', lambda: ['from pymongo']) == ['from motor']
+
+@patch('backend.app.utils.database.collection_versions_collection')
+@patch('backend.app.services.member_service.get_member_loader')
+@patch('backend.app.services.member_service.members_collection')
+def test_profile_update_invalidates_segment_showcases(mock_collection, mock_loader, mock_versions):
+    showcase_cache.invalidate()
+    mock_collection.find.return_value = [{'_id': ObjectId(), 'name': 'Jane Doe', 'sector': 'Technology'}]
+
+    member_service.get_showcases_by_segment('Technology')
+    member_service.get_showcases_by_segment('Technology')
+    assert mock_collection.find.call_count == 1
+
+    # Fields guests never see leave the cache alone
+    mock_collection.find_one_and_update.return_value = {'verified': True, 'public_profile': True}
+    member_service.update_member_profile(str(ObjectId()), {'total_deal_value': 10})
+    member_service.get_showcases_by_segment('Technology')
+    assert mock_collection.find.call_count == 1
+
+    # So do members whose profile guests cannot see
+    mock_collection.find_one_and_update.return_value = {'verified': True, 'public_profile': False}
+    member_service.update_member_profile(str(ObjectId()), {'description': 'Private'})
+    member_service.get_showcases_by_segment('Technology')
+    assert mock_collection.find.call_count == 1
+    mock_collection.find_one_and_update.return_value = {'verified': True, 'public_profile': True}
+
+    member_service.update_member_profile(str(ObjectId()), {'description': 'Updated'})
+    member_service.get_showcases_by_segment('Technology')
+    assert mock_collection.find.call_count == 2
+
+@patch('backend.app.utils.database.collection_versions_collection')
+def test_only_guest_visible_changes_bump_the_showcases_version(mock_versions):
+    showcase_cache.invalidate()
+    cache_versions = {'showcases': (1, None)}
+    showcase_cache.observe_versions(cache_versions)
+    showcase_cache.get('key', lambda: 'cached')
+
+    assert not invalidate_showcases({'description'}, member={'verified': False, 'public_profile': True})
+    assert not invalidate_showcases({'description'}, member={'verified': True, 'public_profile': False})
+    assert not invalidate_showcases({'total_deal_value'})
+    mock_versions.bulk_write.assert_not_called()
+    # Another process's members writes no longer reach the showcase routes' versions
+    showcase_cache.observe_versions(cache_versions)
+    assert showcase_cache.get('key', lambda: 'reloaded') == 'cached'
+
+    assert invalidate_showcases({'description'}, member={'verified': True, 'public_profile': True})
+    assert mock_versions.bulk_write.call_args[0][0][0]._filter == {'_id': SHOWCASE_VERSION}
+    showcase_cache.get('key', lambda: 'reloaded')
+    # Other processes drop their entries when they see the bumped version
+    showcase_cache.observe_versions({'showcases': (2, None)})
+    assert showcase_cache.get('key', lambda: 'current') == 'current'
@@ -0,0 +1,48 @@
+import time
+import jwt
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from backend.app.utils.security import decode_token, invalidate_token
+from backend.app.utils.token_cache import TokenCache, token_cache
+from backend.config import Config
+
+def make_token(public_id, minutes=5):
+    return jwt.encode({
+        'public_id': public_id,
+        'role': 'member',
+        'exp': datetime.utcnow() + timedelta(minutes=minutes)
+    }, Config.JWT_SECRET_KEY, algorithm="HS256")
+
+def test_cache_hit_skips_verification():
+    token_cache.clear()
+    token = make_token('member-1')
+    assert decode_token(token) == {'public_id': 'member-1', 'role': 'member'}
+
+    with patch('backend.app.utils.security.jwt.decode') as mock_decode:
+        assert decode_token(token)['public_id'] == 'member-1'
+    mock_decode.assert_not_called()
+
+    invalidate_token(token)
+    with patch('backend.app.utils.security.jwt.decode', side_effect=jwt.InvalidTokenError):
+        with pytest.raises(jwt.InvalidTokenError):
+            decode_token(token)
+
+def test_lru_eviction_expiry_and_counters():
+    cache = TokenCache(capacity=2)
+    now = time.time()
+    cache.put('a', {'public_id': 'a'}, now + 60)
+    cache.put('b', {'public_id': 'b'}, now + 60)
+    assert cache.get('a') == {'public_id': 'a'}
+    cache.put('c', {'public_id': 'c'}, now + 60)
+
+    # 'b' was least recently used
+    assert cache.get('b') is None
+    assert cache.get('c') == {'public_id': 'c'}
+
+    cache.put('expired', {'public_id': 'x'}, now - 1)
+    assert cache.get('expired') is None
+
+    cache.invalidate_where(lambda claims: claims['public_id'] == 'a')
+    assert cache.get('a') is None
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 3
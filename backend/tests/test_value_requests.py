@@ -225,6 +225,41 @@ def test_error_handling():
     
     print("\nError handling test completed.")
 
+def test_listing_uses_single_aggregation():
+    """Test that request listings resolve member names without per-row lookups"""
+    from datetime import datetime
+    from unittest.mock import patch
+    from bson import ObjectId
+    from backend.app.utils.pagination import decode_cursor
+
+    member_id = ObjectId()
+    docs = [
+        {
+            '_id': ObjectId(), 'member_id': member_id, 'member': [{'name': 'Jane Doe'}],
+            'request_type': 'deal_count', 'requested_deal_count': n, 'justification': 'Closed deals',
+            'verified': False, 'status': 'pending',
+            'created_at': datetime(2024, 1, n), 'updated_at': datetime(2024, 1, n)
+        }
+        for n in (3, 2, 1)
+    ]
+
+    with patch('backend.app.services.value_request_service.value_requests_collection') as mock_requests, \
+            patch('backend.app.services.value_request_service.members_collection') as mock_members:
+        mock_members.name = 'members'
+        mock_requests.aggregate.return_value = iter(docs)
+        response, status_code = value_request_service.get_pending_requests(limit=2)
+
+    assert status_code == 200
+    mock_requests.aggregate.assert_called_once()
+    mock_members.find_one.assert_not_called()
+
+    pipeline = mock_requests.aggregate.call_args[0][0]
+    assert [list(stage)[0] for stage in pipeline] == ['$match', '$sort', '$limit', '$lookup']
+    assert pipeline[2] == {'$limit': 3}
+
+    assert [r['member_name'] for r in response['requests']] == ['Jane Doe', 'Jane Doe']
+    assert decode_cursor(response['next_cursor'])['id'] == str(docs[1]['_id'])
+
 if __name__ == "__main__":
     print("=== Value Requests Test ===")
     test_value_request_service_methods()